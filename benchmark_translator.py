@@ -0,0 +1,473 @@
+# 번역기 성능 측정 스크립트
+# 사용법: python benchmark_translator.py --entries 1000 100000 1000000
+#         python benchmark_translator.py --save-baseline  (기준 결과 갱신)
+
+import io
+import os
+import re
+import sys
+import html
+import json
+import time
+import random
+import logging
+import argparse
+import tempfile
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+
+import improved_translator_python as translator
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE_PATH = os.path.join(SCRIPT_DIR, "benchmark_baseline.json")
+
+# 비교 대상: 이전 버전 파서 (3.0.5의 load_paradox_localization_file)
+def legacy_load_paradox_localization_file(file_path):
+    """이전 버전 파서 - 파일 전체를 읽고 줄마다 정규식을 컴파일 없이 최대 3회 적용"""
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig') as file:
+            content = file.read()
+    except UnicodeDecodeError:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+        except UnicodeDecodeError:
+            with open(file_path, 'r', encoding='cp1252') as file:
+                content = file.read()
+
+    language_match = re.search(r'(l_\w+):', content)
+    language_code = language_match.group(1) if language_match else 'l_english'
+
+    result = {language_code: {}}
+    lines = content.split('\n')
+    parsing_errors = []
+
+    for line_num, line in enumerate(lines, 1):
+        original_line = line
+        line = line.strip()
+
+        if not line or line.startswith('#') or re.match(r'l_\w+:', line):
+            continue
+
+        success = False
+        match = re.match(r'^\s*([^:]+:\s*\d*)\s+"(.+)"\s*$', line)
+        if match:
+            result[language_code][match.group(1).strip()] = f'"{match.group(2)}"'
+            success = True
+        else:
+            match = re.match(r'^\s*([^:]+:\s*\d*)\s+"(.+?)\'?\s*$', line)
+            if match:
+                key = match.group(1).strip()
+                fixed_value = match.group(2).rstrip("'")
+                result[language_code][key] = f'"{fixed_value}"'
+                parsing_errors.append(f"라인 {line_num}: 따옴표 오류 자동 수정 - '{original_line.strip()}'")
+                success = True
+            else:
+                match = re.match(r'^\s*([^:]+:\s*\d*)\s+(.+?)\s*$', line)
+                if match and '"' not in line:
+                    result[language_code][match.group(1).strip()] = f'"{match.group(2)}"'
+                    parsing_errors.append(f"라인 {line_num}: 따옴표 누락 자동 수정 - '{original_line.strip()}'")
+                    success = True
+
+        if not success and '"' in line:
+            parsing_errors.append(f"라인 {line_num}: 파싱 실패 (건너뜀) - '{original_line.strip()}'")
+
+    return result
+
+# 비교 대상: 이전 버전 저장 (파싱한 딕셔너리를 키/값 줄로 다시 씀 - 주석, 빈 줄, 줄 배치는 유지하지 않음)
+def legacy_save_paradox_localization(translated_data, output_path):
+    """이전 버전 저장 - 모든 번역이 끝난 뒤 파일 전체를 한 번에 기록"""
+    with open(output_path, 'w', encoding='utf-8-sig') as file:
+        for lang_code, lang_data in translated_data.items():
+            file.write(f"{lang_code}:\n")
+            for key, value in lang_data.items():
+                if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
+                    file.write(f" {key} {value}\n")
+                else:
+                    file.write(f' {key} "{value}"\n')
+
+# 측정용 HOI4 형식 말뭉치 생성 ($VAR$, §Y 색상 코드, £아이콘, [Root.GetName] 스크립트 로컬라이제이션 포함)
+SAMPLE_TEXTS = [
+    "Focus on Heavy Industry",
+    "Our nation must expand its $BUILDING$ capacity before the war.",
+    "§YRadar§! improves detection of enemy units.",
+    "The government of [Root.GetName] has declared war on [From.GetName].",
+    "£pol_power Political power gain: $VALUE|+=0$",
+    "Convoy raiding\\nReduces enemy supply by 10%.",
+]
+CORPUS_SUBJECTS = ["Heavy Industry", "Naval Doctrine", "Air Superiority", "Infantry Equipment", "Synthetic Oil",
+                   "Fortification", "Convoy Escort", "Political Reform", "Mass Mobilization", "Rocket Artillery"]
+CORPUS_PARTS = [
+    "$COUNTRY$ gains §Y{subject}§! for $DAYS$ days.",
+    "£army_experience [Root.GetLeader] demands more {subject}.",
+    "§RWarning:§! [From.GetAdjective] {subject} is below $VALUE|%0$.",
+    "£tech_mod Research speed for {subject}: $BONUS|+=%0$\\nUnlocks §G[This.GetName]§!.",
+    "The people of [Root.Capital.GetName] celebrate the new {subject} program.",
+]
+
+def generate_corpus_text(rng, index):
+    """HOI4 형식 번역 대상 문장 하나 생성"""
+    parts = [rng.choice(CORPUS_PARTS).format(subject=rng.choice(CORPUS_SUBJECTS)) for _ in range(rng.randint(1, 3))]
+    if index % 7 == 0:
+        parts.insert(0, rng.choice(SAMPLE_TEXTS))
+    return " ".join(parts) + f" ({index})"
+
+def generate_corpus(entries, seed=42):
+    """측정용 문장 목록 생성 (같은 seed면 같은 말뭉치)"""
+    rng = random.Random(seed)
+    return [generate_corpus_text(rng, index) for index in range(entries)]
+
+def write_sample_file(path, entries, seed=42):
+    """HOI4 형식의 측정용 로컬라이제이션 파일 생성"""
+    with open(path, 'w', encoding='utf-8-sig') as file:
+        file.write("l_english:\n")
+        for index, text in enumerate(generate_corpus(entries, seed)):
+            if index % 50 == 0:
+                file.write(f" # section {index // 50}\n\n")
+            file.write(f' bench_key_{index}:0 "{text}"\n')
+
+def measure(func, *args, repeat=3):
+    """실행 시간(repeat회 중 최솟값)과 최대 메모리 사용량 측정 (시간은 tracemalloc 없이 별도 측정)"""
+    elapsed = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        run_elapsed = time.perf_counter() - started
+        elapsed = run_elapsed if elapsed is None else min(elapsed, run_elapsed)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+def consume_stream(path):
+    """스트리밍 파서로 항목만 순회 (결과를 메모리에 모으지 않음)"""
+    count = 0
+    for _ in translator.iter_paradox_localization(path):
+        count += 1
+    return count
+
+def print_stage_header(title):
+    """단계별 측정 결과 표 머리글 출력"""
+    print(f"\n{title}")
+    print(f"{'단계':<32}{'시간(초)':>10}{'항목/초':>14}{'최대 메모리(MB)':>18}")
+
+def run_stage(results, name, entries, func, *args):
+    """단계 하나를 측정해 결과에 기록하고 출력"""
+    elapsed, peak = measure(func, *args)
+    results[name] = {
+        "seconds": round(elapsed, 6),
+        "entries_per_second": round(entries / elapsed, 1) if elapsed else None,
+        "peak_mb": round(peak / (1024 * 1024), 3),
+    }
+    print(f"{name:<32}{elapsed:>10.3f}{entries / elapsed:>14,.0f}{peak / (1024 * 1024):>18.1f}")
+
+def benchmark_parser(entries):
+    """이전 파서와 스트리밍 파서 비교"""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench_l_english.yml")
+        write_sample_file(path, entries)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+
+        print_stage_header(f"[파서] 항목 {entries:,}개, 파일 {size_mb:.1f}MB")
+        run_stage(results, "legacy load", entries, legacy_load_paradox_localization_file, path)
+        run_stage(results, "load_paradox_localization_file", entries, translator.load_paradox_localization_file, path)
+        run_stage(results, "iter_paradox_localization", entries, consume_stream, path)
+    return results
+
+# 텍스트 처리 단계 (번역 요청 전후에 항목마다 실행되는 함수)
+AI_RESPONSE_SUFFIXES = [
+    "",
+    "\n\nExplanation: The variables were kept unchanged.",
+    "\n\n**Note:** I preserved the formatting. Let me know if you have any other text to translate!",
+]
+
+# 비교 대상: 이전 버전 텍스트 처리 (정규식 문자열을 항목마다 re.sub, 토큰마다 str.replace, AI 응답 정리 2회)
+LEGACY_AI_NOISE_PATTERNS = [
+    r'Let me know if you have.*?translate!',
+    r'I\'m ready for.*?challenge\.?',
+    r'\*\*Explanation:\*\*.*?\n',
+    r'\* .*?symbols.*?\.',
+    r'\* I translated.*?\.',
+    r'\* The.*?emphasis\.',
+    r'\* I kept.*?\.',
+    r'Let me know if.*?translate!',
+    r'I\'d be happy to.*?',
+    r'Here\'s the translation.*?:',
+    r'Translation:.*?\n',
+    r'\*\*.*?\*\*.*?\n',
+    r'Explanation:.*?\n',
+    r'Note:.*?\n',
+]
+
+def legacy_clean_ai_response(text):
+    """이전 버전 AI 응답 정리 - 패턴 14개와 공백 정리 2개를 매번 re.sub"""
+    if not text:
+        return text
+    for pattern in LEGACY_AI_NOISE_PATTERNS:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    text = re.sub(r'\n\s*\n', '\n', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+def legacy_postprocess_ai_text(text):
+    """이전 버전 AI 응답 후처리 - clean_ai_response 후 restore_text_formatting (정리를 다시 하고 HTML 엔티티/공백 정리)"""
+    text = legacy_clean_ai_response(text)
+    text = legacy_clean_ai_response(text)
+    if text:
+        text = re.sub(r'\s+', ' ', html.unescape(text)).strip()
+    return text
+
+def legacy_preserve_tokens(text):
+    """이전 버전 토큰 보존 - 토큰마다 str.replace"""
+    token_pattern = re.compile(r'(\$[^$]*\$)')
+    placeholders = {}
+    for i, token in enumerate(dict.fromkeys(token_pattern.findall(text))):
+        placeholder = f"__TOKEN_{i}__"
+        placeholders[placeholder] = token
+        text = text.replace(token, placeholder)
+    return text, placeholders
+
+def legacy_restore_tokens(text, placeholders):
+    """이전 버전 토큰 복원 - 플레이스홀더마다 str.replace"""
+    for placeholder, token in placeholders.items():
+        text = text.replace(placeholder, token)
+    return text
+
+def legacy_preserve_and_restore(texts):
+    """이전 버전 토큰 보존 후 복원"""
+    for text in texts:
+        protected_text, placeholders = legacy_preserve_tokens(text)
+        legacy_restore_tokens(protected_text, placeholders)
+
+def preserve_and_restore(texts):
+    """토큰 보존 후 그대로 복원 (구글 번역 전후 처리)"""
+    for text in texts:
+        protected_text, placeholders = translator.preserve_tokens(text)
+        translator.restore_tokens(protected_text, placeholders)
+
+def strict_preserve_and_restore(texts):
+    """모든 마크업 토큰 보존 후 복원 (마크업 손상 항목 재번역 전후 처리)"""
+    for text in texts:
+        protected_text, placeholders = translator.preserve_tokens(text, True)
+        translator.restore_tokens(protected_text, placeholders)
+
+def sanitize_all(texts):
+    """AI 번역 전처리"""
+    for text in texts:
+        translator.sanitize_text_for_ai(text)
+
+def clean_all(responses):
+    """AI 응답 정리"""
+    for response in responses:
+        translator.clean_ai_response(response)
+
+def legacy_clean_all(responses):
+    """이전 버전 AI 응답 정리"""
+    for response in responses:
+        legacy_clean_ai_response(response)
+
+def legacy_postprocess_all(responses):
+    """이전 버전 AI 응답 후처리 (항목마다)"""
+    for response in responses:
+        legacy_postprocess_ai_text(response)
+
+def validate_all(texts, translated_texts):
+    """마크업 토큰 검사"""
+    for text, translated_text in zip(texts, translated_texts):
+        translator.has_markup_integrity(text, translated_text)
+
+def get_writer_units(entries, unit_size=128, window=8, seed=42):
+    """결과 파일에 반영할 요청 단위 [[(항목 번호, 번역)]] - 동시 요청처럼 window개 단위 안에서 끝나는 순서를 섞음"""
+    units = [[(index, f"번역 {index}") for index in range(start, min(start + unit_size, entries))]
+             for start in range(0, entries, unit_size)]
+    rng = random.Random(seed)
+    shuffled = []
+    for start in range(0, len(units), window):
+        group = units[start:start + window]
+        rng.shuffle(group)
+        shuffled.extend(group)
+    return shuffled
+
+def write_with_localization_writer(path, output_path, units):
+    """스트리밍 writer로 결과 파일 저장 (요청 단위 결과 반영 → 마무리)"""
+    writer = translator.LocalizationWriter(path, output_path)
+    for unit in units:
+        writer.resolve(unit)
+    writer.finish()
+
+def benchmark_pipeline(entries):
+    """파싱부터 저장까지 CPU 처리 단계별 처리량과 최대 메모리 측정"""
+    results = {}
+    texts = generate_corpus(entries)
+    responses = [text + AI_RESPONSE_SUFFIXES[index % len(AI_RESPONSE_SUFFIXES)] for index, text in enumerate(texts)]
+    texts_translated = [f"번역 {text}" for text in texts]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench_l_english.yml")
+        write_sample_file(path, entries)
+        data = translator.load_paradox_localization_file(path)
+        output_path = os.path.join(temp_dir, "output_l_korean.yml")
+        units = get_writer_units(entries)
+
+        # 부분 다운로드 측정용: 절반만 번역된 writer
+        partial_writer = translator.LocalizationWriter(path, os.path.join(temp_dir, "partial_l_korean.yml"))
+        for unit in sorted(units)[:len(units) // 2]:
+            partial_writer.resolve(unit)
+
+        print_stage_header(f"[처리 단계] 항목 {entries:,}개")
+        run_stage(results, "load_paradox_localization_file", entries, translator.load_paradox_localization_file, path)
+        run_stage(results, "legacy preserve/restore", entries, legacy_preserve_and_restore, texts)
+        run_stage(results, "preserve_tokens/restore_tokens", entries, preserve_and_restore, texts)
+        run_stage(results, "preserve_tokens(strict)/restore", entries, strict_preserve_and_restore, texts)
+        run_stage(results, "sanitize_text_for_ai", entries, sanitize_all, texts)
+        run_stage(results, "legacy clean_ai_response", entries, legacy_clean_all, responses)
+        run_stage(results, "clean_ai_response", entries, clean_all, responses)
+        run_stage(results, "legacy AI 응답 후처리", entries, legacy_postprocess_all, responses)
+        run_stage(results, "postprocess_ai_texts", entries, translator.postprocess_ai_texts, responses)
+        run_stage(results, "has_markup_integrity", entries, validate_all, texts, texts_translated)
+        run_stage(results, "legacy save_paradox_localization", entries, legacy_save_paradox_localization, data, output_path)
+        run_stage(results, "LocalizationWriter resolve", entries, write_with_localization_writer, path, output_path, units)
+        run_stage(results, "LocalizationWriter snapshot", entries, lambda: partial_writer.write_snapshot(io.BytesIO()))
+    return results
+
+# 기준 결과 저장/비교 (회귀 확인용)
+def load_baseline(path):
+    """저장된 기준 결과 읽기 (없으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+def save_baseline(path, results):
+    """측정 결과를 기준 결과로 저장"""
+    baseline = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(baseline, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+    print(f"\n기준 결과 저장: {path}")
+
+def compare_with_baseline(baseline, results, tolerance):
+    """기준 결과와 비교해 처리량이 tolerance 이상 떨어진 단계 출력 - 회귀 수 반환"""
+    regressions = 0
+    print(f"\n[기준 비교] {baseline.get('created_at', '?')} (Python {baseline.get('python', '?')}), 허용 하락폭 {tolerance:.0%}")
+    for group, group_results in results.items():
+        for name, result in group_results.items():
+            reference = baseline.get("results", {}).get(group, {}).get(name)
+            if not reference or not reference.get("entries_per_second") or not result.get("entries_per_second"):
+                continue
+            change = result["entries_per_second"] / reference["entries_per_second"] - 1
+            marker = "  << 회귀" if change < -tolerance else ""
+            if marker:
+                regressions += 1
+            print(f"{group + ' ' + name:<48}{change:>+9.1%}{marker}")
+    return regressions
+
+# 유사 번역 메모리 측정용 문장 (HOI4처럼 반복이 많은 문장 생성)
+FUZZY_SUBJECTS = ["Heavy Industry", "Light Industry", "Naval Doctrine", "Air Superiority", "Infantry Equipment",
+                  "Radar", "Synthetic Oil", "Fortification", "Convoy Escort", "Political Reform"]
+FUZZY_TEMPLATES = [
+    "Focus on {subject}",
+    "The government of $COUNTRY$ invests in {subject} ({index})",
+    "Research of {subject} increases $VALUE|+=0$ per week",
+    "§Y{subject}§! is required before unlocking tier {index}",
+]
+
+def fuzzy_sample_text(rng, index):
+    """유사 번역 메모리 측정용 원문 생성"""
+    return rng.choice(FUZZY_TEMPLATES).format(subject=rng.choice(FUZZY_SUBJECTS), index=index)
+
+def benchmark_fuzzy_memory(entries, queries=2000):
+    """유사 번역 메모리 색인 생성 시간과 조회 지연 측정"""
+    rng = random.Random(7)
+    memory = translator.FuzzyTranslationMemory(max_entries=entries)
+
+    started = time.perf_counter()
+    for index in range(entries):
+        source_text = fuzzy_sample_text(rng, index)
+        memory.add('ko', source_text, f"KO {source_text}")
+    build_elapsed = time.perf_counter() - started
+
+    query_texts = [fuzzy_sample_text(rng, rng.randrange(entries * 2)) for _ in range(queries)]
+    print(f"\n[유사 번역 메모리] 항목 {len(memory):,}개, 색인 생성 {build_elapsed:.2f}초")
+    print(f"{'조회':<28}{'평균(ms)':>10}{'p99(ms)':>12}{'적중':>10}")
+
+    for name, lookup in (("similar", memory.similar), ("reuse", memory.reuse)):
+        timings = []
+        found = 0
+        for text in query_texts:
+            started = time.perf_counter()
+            if lookup(text, 'ko'):
+                found += 1
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        average = sum(timings) / len(timings) * 1000
+        p99 = timings[int(len(timings) * 0.99) - 1] * 1000
+        print(f"{name:<28}{average:>10.3f}{p99:>12.3f}{found:>10,}")
+
+# 시작 시간 측정 대상 (새 프로세스에서 실행)
+COLD_START_COMMANDS = [
+    ("python (빈 실행)", ["-c", "pass"]),
+    ("import improved_translator_python", ["-c", "import improved_translator_python"]),
+    ("import translator_web (Flask)", ["-c", "import translator_web"]),
+    ("translator_cli --help", ["translator_cli.py", "--help"]),
+]
+
+def benchmark_cold_start(repeat=5):
+    """새 프로세스의 시작 시간 측정 (repeat회 중 최솟값, Google 인증 조회 없이)"""
+    env = dict(os.environ, PYTHONPATH=SCRIPT_DIR)
+    print(f"\n[시작 시간] {repeat}회 중 최솟값")
+    print(f"{'명령':<40}{'시간(초)':>10}")
+    for name, arguments in COLD_START_COMMANDS:
+        elapsed = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            subprocess.run([sys.executable] + arguments, cwd=SCRIPT_DIR, env=env, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            run_elapsed = time.perf_counter() - started
+            elapsed = run_elapsed if elapsed is None else min(elapsed, run_elapsed)
+        print(f"{name:<40}{elapsed:>10.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="번역기 성능 측정")
+    parser.add_argument("--entries", type=int, nargs="+", default=[10000, 100000], help="측정할 항목 수 (1,000 ~ 1,000,000)")
+    parser.add_argument("--memory-entries", type=int, nargs="+", default=[100000, 300000], help="유사 번역 메모리 항목 수")
+    parser.add_argument("--skip-memory", action="store_true", help="유사 번역 메모리 측정 생략")
+    parser.add_argument("--skip-cold-start", action="store_true", help="시작 시간 측정 생략")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="비교할 기준 결과 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 결과로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 표시할 처리량 하락 비율")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = {}
+    for entries in args.entries:
+        results[f"parser_{entries}"] = benchmark_parser(entries)
+        results[f"pipeline_{entries}"] = benchmark_pipeline(entries)
+    if not args.skip_memory:
+        for entries in args.memory_entries:
+            benchmark_fuzzy_memory(entries)
+    if not args.skip_cold_start:
+        benchmark_cold_start()
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline and compare_with_baseline(baseline, results, args.tolerance):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,36 +3,117 @@
 # 주요 개선사항: 파싱 오류 처리 개선, 잘못된 따옴표 자동 수정, 오류 복구 기능
 
 import os
+import io
 import re
 import logging
 import time
+import random
 import json
+import asyncio
 import requests
+import requests.adapters
 import tempfile
 import atexit
 import html
 import zipfile
+import shutil
+import uuid
+import sqlite3
+import hashlib
+import contextlib
+import threading
+import sys
+from collections import OrderedDict, namedtuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
-from flask import Flask, request, send_file, jsonify
-from google.cloud import translate_v2 as translate
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-import openai
 from werkzeug.utils import secure_filename
+# Flask(웹 서버), google.cloud, openai는 사용할 때 불러옴 (명령줄 실행 시작 시간 단축)
 
 # .env 파일 로드 (환경 변수 설정)
 load_dotenv()
 
 # 설정 클래스
 class Config:
-    MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+    MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB (로컬라이제이션 파일 하나, ZIP 안 파일 포함)
+    MAX_UPLOAD_SIZE = 1024 * 1024 * 1024  # 1GB (업로드 요청 전체, 대형 모드 ZIP 포함)
+    ZIP_COMPRESSION = zipfile.ZIP_DEFLATED  # 결과 ZIP 압축 방식 (ZIP_STORED면 압축하지 않음)
+    ZIP_COMPRESS_LEVEL = 6  # 결과 ZIP 압축 수준 (1~9, 낮을수록 빠르고 파일이 큼)
     UPLOAD_FOLDER = 'uploads'
     DOWNLOAD_FOLDER = 'downloads'
     SUPPORTED_EXTENSIONS = {'.yml', '.yaml'}
-    DEFAULT_BATCH_SIZE = 100
-    AI_REQUEST_DELAY = 0.1  # AI 모델별 요청 간격 줄임 (0.3초 → 0.1초)
+    DEFAULT_BATCH_SIZE = 128  # 구글 번역 요청당 최대 세그먼트 수 (API 한도 128개)
+    GOOGLE_BATCH_MAX_CHARS = 30000  # 구글 번역 요청당 최대 문자 수 (API 권장 한도)
+    GOOGLE_BATCH_CONCURRENCY = 4  # 동시에 보내는 구글 배치 요청 수
+    AI_CONCURRENCY = {'openai': 8, 'ollama': 2}  # 백엔드별 프로세스 전체 동시 요청 수 (모든 작업/파일 합계, 작업별 값은 이보다 낮게만 설정 가능)
+    JOB_WORKERS = 2  # 동시에 처리하는 번역 작업 수
+    JOB_RETENTION = 3600  # 완료된 작업과 결과 파일 보관 시간 (초)
+    SSE_MIN_INTERVAL = 0.25  # 진행률 이벤트 최소 전송 간격 (초)
+    SSE_KEEPALIVE_INTERVAL = 15  # 변경이 없을 때 연결 유지 이벤트 간격 (초)
     LOG_LEVEL = logging.WARNING  # INFO → WARNING으로 변경 (로그 줄임)
     
+    # OpenAI 묶음 요청 설정 (여러 항목을 JSON 객체 하나로 번역)
+    OPENAI_PACKING = True  # 작업 설정이 없을 때 기본 사용 여부
+    OPENAI_PACK_TOKEN_BUDGET = 1500  # 묶음당 입력 토큰 예산 (추정치)
+    OPENAI_PACK_MAX_ENTRIES = 40  # 묶음당 최대 항목 수
+    OPENAI_PACK_MAX_OUTPUT_TOKENS = 4096  # 묶음 응답 최대 토큰 수
+    OPENAI_COMPACT_PROMPT = False  # 작업 설정이 없을 때 압축 프롬프트 사용 여부 (요청 크기 최소화용 - 지시문이 OpenAI 프롬프트 캐시 최소 길이(1024토큰)보다 짧아 캐시는 적용되지 않음)
+    # 모델별 100만 토큰당 가격 (USD: 입력, 캐시된 입력, 출력) - 비용 추정용, 없는 모델은 비용 미표시
+    OPENAI_PRICING = {
+        'gpt-3.5-turbo': (0.50, 0.50, 1.50),
+        'gpt-4': (30.00, 30.00, 60.00),
+        'gpt-4-turbo': (10.00, 10.00, 30.00),
+        'gpt-4o': (2.50, 1.25, 10.00),
+        'gpt-4o-mini': (0.15, 0.075, 0.60),
+        'gpt-4.1': (2.00, 0.50, 8.00),
+        'gpt-4.1-mini': (0.40, 0.10, 1.60),
+        'gpt-4.1-nano': (0.10, 0.025, 0.40),
+    }
+    
+    # Ollama 설정
+    OLLAMA_KEEP_ALIVE = '30m'  # 요청 사이에 모델을 메모리에 유지하는 시간
+    OLLAMA_NUM_CTX = 8192  # 컨텍스트 길이 (묶음 요청 크기 고려)
+    OLLAMA_USE_CHAT = True  # /api/chat 사용 (False면 /api/generate)
+    OLLAMA_PACKING = True  # 작업 설정이 없을 때 묶음 요청 기본 사용 여부
+    OLLAMA_PACK_TOKEN_BUDGET = 1000  # 묶음당 입력 토큰 예산 (추정치)
+    OLLAMA_PACK_MAX_ENTRIES = 20  # 묶음당 최대 항목 수
+    OLLAMA_MODEL_CACHE_TTL = 60  # 모델 목록 캐시 유지 시간 (초)
+    OLLAMA_REQUEST_TIMEOUT = 120  # 번역 요청 타임아웃 (초)
+    OLLAMA_WARMUP_TIMEOUT = 300  # 모델 로드 타임아웃 (초)
+    
+    # 백엔드 클라이언트 연결 풀 설정 (API 키/엔드포인트별로 재사용)
+    HTTP_POOL_SIZE = {'google': 8, 'openai': 16, 'ollama': 8}  # 백엔드별 최대 유지 연결 수
+    OPENAI_TIMEOUT = 60  # OpenAI 요청 타임아웃 (초)
+    OPENAI_MAX_RETRIES = 2  # OpenAI SDK 자동 재시도 횟수
+    
+    # 백엔드 주소 재정의 (로컬 모의 서버로 부하 테스트할 때 사용, 빈 값이면 실제 서비스)
+    GOOGLE_TRANSLATE_ENDPOINT = os.getenv('GOOGLE_TRANSLATE_ENDPOINT', '')  # 설정 시 익명 인증으로 요청
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL', '')
+    SERVER_PORT = int(os.getenv('TRANSLATOR_PORT', '5000'))
+    
+    # 번역 캐시 설정 (메모리 LRU + SQLite 디스크 캐시)
+    CACHE_MEMORY_LIMIT = 64 * 1024 * 1024  # 메모리 캐시 최대 크기 (64MB)
+    CACHE_DB_PATH = os.getenv('TRANSLATOR_CACHE_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'translation_cache.db'))  # 스크립트 폴더 기준 (실행 위치와 무관), 빈 값이면 디스크 캐시 사용 안 함
+    PROMPT_VERSION = 'v1'  # 프롬프트 변경 시 올려서 이전 캐시 무효화
+    
+    # 유사 번역 메모리 설정 (문자 n-gram MinHash LSH 색인)
+    FUZZY_MEMORY_ENABLED = True
+    FUZZY_MEMORY_MAX_ENTRIES = 500000  # 최대 항목 수 (초과 시 추가하지 않음)
+    FUZZY_MEMORY_THRESHOLD = 0.6  # 유사도(n-gram 자카드) 하한
+    FUZZY_MEMORY_EXAMPLES = 3  # 항목당 프롬프트 예시 수
+    FUZZY_MEMORY_MAX_EXAMPLES = 8  # 요청당 프롬프트 예시 수 (묶음 요청 포함)
+    
+    # 작업 저널 설정 (번역 결과를 파일에 추가 기록 - 중단된 작업을 다시 제출하면 기록된 항목은 건너뜀)
+    JOURNAL_ENABLED = True
+    JOURNAL_FOLDER = 'journals'
+    JOURNAL_FLUSH_ENTRIES = 200  # 이 개수만큼 모이면 디스크에 기록
+    JOURNAL_FLUSH_INTERVAL = 5  # 마지막 기록 후 이 시간(초)이 지나면 기록
+    JOURNAL_RETENTION = 7 * 24 * 3600  # 다시 제출되지 않은 저널 보관 시간 (초)
+    
+    # 모드 전체 번역 설정 (localisation 폴더 또는 모드 ZIP을 작업 하나로 번역)
+    MOD_SOURCE_LANGUAGE = 'l_english'  # 번역할 원문 파일의 언어 헤더 (다른 언어 파일은 건너뜀)
+    MOD_FILE_WORKERS = 4  # 파일 읽기/저장 병렬 스레드 수
+    
     # 언어 코드 매핑
     LANGUAGE_NAMES = {
         'ko': 'Korean', 'en': 'English', 'ja': 'Japanese', 
@@ -42,32 +123,416 @@ class Config:
         'no': 'Norwegian', 'da': 'Danish', 'fi': 'Finnish'
     }
 
+    # 게임 로컬라이제이션 언어 헤더 (번역 메모리 파일 구분용, 없으면 l_<언어 이름>)
+    LOCALIZATION_LANGUAGES = {
+        'ko': 'l_korean', 'en': 'l_english', 'ja': 'l_japanese',
+        'zh': 'l_simp_chinese', 'es': 'l_spanish', 'fr': 'l_french',
+        'de': 'l_german', 'ru': 'l_russian', 'pt': 'l_braz_por'
+    }
+
 # 전역 설정
 config = Config()
 translate_client = None
 
-# 구글 클라우드 번역 API 클라이언트 초기화
-try:
-    translate_client = translate.Client()
-    # 로깅 레벨 조정으로 초기화 성공 메시지 제거
-except Exception as e:
-    logging.error(f"Google Cloud Translate API 초기화 실패: {e}")
+# 성능 지표 (Prometheus 텍스트 형식, /metrics)
+METRIC_DEFINITIONS = {
+    "translator_backend_request_seconds": ("histogram", "번역 백엔드 요청 지연 (초)"),
+    "translator_backend_requests_total": ("counter", "번역 백엔드 요청 수 (결과별: success, error, rate_limited)"),
+    "translator_openai_tokens_total": ("counter", "OpenAI 토큰 사용량 (prompt, completion)"),
+    "translator_entries_total": ("counter", "처리한 항목 수 (처리 방식별: backend, memory, previous, fuzzy, journal)"),
+    "translator_pipeline_seconds": ("histogram", "파일 처리 단계별 소요 시간 (초)"),
+    "translator_jobs_total": ("counter", "완료된 번역 작업 수 (상태별)"),
+    "translator_bytes_uploaded_total": ("counter", "업로드 받은 바이트 수"),
+    "translator_bytes_downloaded_total": ("counter", "다운로드로 보낸 바이트 수"),
+    "translator_markup_retries_total": ("counter", "마크업 토큰이 손상되어 엄격한 마스킹으로 다시 번역한 항목 수"),
+    "translator_markup_failures_total": ("counter", "다시 번역해도 마크업 토큰이 손상되어 원문을 유지한 항목 수"),
+}
+METRIC_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+class BackendCall:
+    """백엔드 요청 1회의 결과 기록용 (HTTP 상태 코드로 결과를 정할 때 사용)"""
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome = "success"
+
+    def status(self, status_code):
+        """HTTP 상태 코드로 결과 설정"""
+        if status_code == 429:
+            self.outcome = "rate_limited"
+        elif status_code >= 400:
+            self.outcome = "error"
+
+class MetricsRegistry:
+    """프로세스 내 성능 지표 집계 (카운터, 히스토그램) - 외부 라이브러리 없이 Prometheus 텍스트 형식 출력"""
+
+    def __init__(self, buckets=METRIC_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}  # 이름 → {레이블: 값}
+        self._histograms = {}  # 이름 → {레이블: [구간별 개수..., 합계, 개수]}
+
+    @staticmethod
+    def _labels(labels):
+        return tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        """카운터 증가"""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """히스토그램에 값 기록"""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            state = series.get(key)
+            if state is None:
+                state = series[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextlib.contextmanager
+    def timer(self, name, **labels):
+        """블록 실행 시간을 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @contextlib.contextmanager
+    def track(self, backend, operation):
+        """백엔드 요청 지연과 결과 기록 (예외는 그대로 전달, 429는 rate_limited로 분류)"""
+        call = BackendCall()
+        started = time.perf_counter()
+        try:
+            yield call
+        except Exception as e:
+            status_code = getattr(e, 'status_code', None) or getattr(e, 'code', None)
+            call.outcome = "rate_limited" if status_code == 429 else "error"
+            raise
+        finally:
+            self.observe("translator_backend_request_seconds", time.perf_counter() - started,
+                         backend=backend, operation=operation)
+            self.inc("translator_backend_requests_total", backend=backend, operation=operation, outcome=call.outcome)
+
+    def record_openai_usage(self, response, model):
+        """OpenAI 응답의 토큰 사용량 기록"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        self.inc("translator_openai_tokens_total", getattr(usage, 'prompt_tokens', 0) or 0, model=model, type="prompt")
+        self.inc("translator_openai_tokens_total", getattr(usage, 'completion_tokens', 0) or 0, model=model, type="completion")
+        self.inc("translator_openai_tokens_total", get_cached_prompt_tokens(usage), model=model, type="cached")
+
+    @staticmethod
+    def _format_labels(labels):
+        if not labels:
+            return ""
+        pairs = []
+        for name, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            pairs.append(f'{name}="{value}"')
+        return "{" + ",".join(pairs) + "}"
+
+    def render(self, gauges=None):
+        """Prometheus 텍스트 형식으로 출력 (gauges: {이름: (설명, [(레이블 dict, 값)])})"""
+        lines = []
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {key: list(state) for key, state in series.items()} for name, series in self._histograms.items()}
+
+        for name, (kind, help_text) in METRIC_DEFINITIONS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "counter":
+                for labels, value in sorted(counters.get(name, {}).items()):
+                    lines.append(f"{name}{self._format_labels(labels)} {value:g}")
+            else:
+                for labels, state in sorted(histograms.get(name, {}).items()):
+                    for bound, count in zip(self.buckets, state):
+                        lines.append(f"{name}_bucket{self._format_labels(labels + (('le', f'{bound:g}'),))} {count}")
+                    lines.append(f"{name}_bucket{self._format_labels(labels + (('le', '+Inf'),))} {state[-1]}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {state[-2]:.6f}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {state[-1]}")
+
+        for name, (help_text, samples) in (gauges or {}).items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                lines.append(f"{name}{self._format_labels(self._labels(labels))} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+def get_cached_prompt_tokens(usage):
+    """OpenAI 응답 usage에서 프롬프트 캐시로 처리된 입력 토큰 수"""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    return (getattr(details, 'cached_tokens', 0) or 0) if details is not None else 0
+
+class TokenUsage:
+    """작업별 OpenAI 토큰 사용량과 예상 비용 집계 (이전 방식 대비 항목당 토큰 비교 포함)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.entries = 0  # 요청에 담아 보낸 항목 수 (재시도 포함)
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.legacy_prompt_tokens = 0  # 항목마다 전체 프롬프트를 보내던 방식의 입력 토큰 추정치
+        self.cost = 0.0
+        self.cost_known = True
+
+    def add(self, response, model, texts):
+        """응답 1회의 usage 기록 (texts: 요청에 담은 원문)"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+
+        prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+        cached_tokens = get_cached_prompt_tokens(usage)
+        completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+        legacy_tokens = sum(get_legacy_prompt_tokens() + estimate_tokens(text) for text in texts)
+
+        pricing = config.OPENAI_PRICING.get(model)
+        with self._lock:
+            self.requests += 1
+            self.entries += len(texts)
+            self.prompt_tokens += prompt_tokens
+            self.cached_tokens += cached_tokens
+            self.completion_tokens += completion_tokens
+            self.legacy_prompt_tokens += legacy_tokens
+            if pricing:
+                input_price, cached_price, output_price = pricing
+                self.cost += ((prompt_tokens - cached_tokens) * input_price + cached_tokens * cached_price +
+                              completion_tokens * output_price) / 1_000_000
+            else:
+                self.cost_known = False
+
+    def to_dict(self):
+        """작업 요약용 사용량"""
+        with self._lock:
+            entries = self.entries or 1
+            completion_per_entry = self.completion_tokens / entries
+            return {
+                "requests": self.requests,
+                "entries": self.entries,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_tokens,
+                "completion_tokens": self.completion_tokens,
+                "estimated_cost_usd": round(self.cost, 6) if self.cost_known else None,
+                "prompt_tokens_per_entry": round(self.prompt_tokens / entries, 1),
+                "tokens_per_entry": round(self.prompt_tokens / entries + completion_per_entry, 1),
+                "legacy_tokens_per_entry": round(self.legacy_prompt_tokens / entries + completion_per_entry, 1),
+            }
+
+# Ollama 클라이언트
+class OllamaClient:
+    """Ollama API 클라이언트 (연결 재사용, 모델 목록 캐시, keep_alive, 모델 예열)"""
+
+    def __init__(self, endpoint, session=None):
+        self.endpoint = endpoint.rstrip('/')
+        self.session = session or create_pooled_session(config.HTTP_POOL_SIZE['ollama'])
+
+        self._lock = threading.Lock()
+        self._models = None
+        self._models_fetched_at = 0
+        self._warm_models = set()
+
+    def list_models(self, refresh=False):
+        """사용 가능한 모델 목록 조회 (TTL 동안 캐시)"""
+        with self._lock:
+            if (not refresh and self._models is not None and
+                    time.time() - self._models_fetched_at < config.OLLAMA_MODEL_CACHE_TTL):
+                return list(self._models)
+
+        try:
+            response = self.session.get(f"{self.endpoint}/api/tags", timeout=5)
+            if response.status_code == 200:
+                data = response.json()
+                models = [model['name'] for model in data.get('models', [])]
+                with self._lock:
+                    self._models = models
+                    self._models_fetched_at = time.time()
+                return list(models)
+            else:
+                logging.warning(f"Ollama 모델 목록 조회 실패: {response.status_code}")
+                return []
+        except Exception as e:
+            logging.warning(f"Ollama 연결 실패: {e}")
+            return []
+
+    def warm_up(self, model, keep_alive=None):
+        """모델을 미리 메모리에 로드 (작업 시작 전 1회)"""
+        with self._lock:
+            if model in self._warm_models:
+                return True
+
+        try:
+            # 프롬프트 없이 요청하면 모델만 로드됨
+            response = self.session.post(
+                f"{self.endpoint}/api/generate",
+                json={"model": model, "keep_alive": keep_alive or config.OLLAMA_KEEP_ALIVE},
+                timeout=config.OLLAMA_WARMUP_TIMEOUT
+            )
+            if response.status_code != 200:
+                logging.warning(f"Ollama 모델 예열 실패: {response.status_code} - {response.text}")
+                return False
+        except requests.RequestException as e:
+            logging.warning(f"Ollama 모델 예열 실패: {e}")
+            return False
+
+        with self._lock:
+            self._warm_models.add(model)
+        return True
+
+    def generate(self, model, prompt, options=None, keep_alive=None):
+        """/api/generate 호출"""
+        with metrics.track("ollama", "generate") as call:
+            response = self.session.post(
+                f"{self.endpoint}/api/generate",
+                json={
+                    "model": model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": keep_alive or config.OLLAMA_KEEP_ALIVE,
+                    "options": options or {}
+                },
+                timeout=config.OLLAMA_REQUEST_TIMEOUT
+            )
+            call.status(response.status_code)
+        return response
+
+    def chat(self, model, messages, options=None, keep_alive=None, response_format=None):
+        """/api/chat 호출 (response_format="json"이면 JSON 출력 강제)"""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": False,
+            "keep_alive": keep_alive or config.OLLAMA_KEEP_ALIVE,
+            "options": options or {}
+        }
+        if response_format:
+            payload["format"] = response_format
+
+        with metrics.track("ollama", "pack" if response_format else "chat") as call:
+            response = self.session.post(f"{self.endpoint}/api/chat", json=payload, timeout=config.OLLAMA_REQUEST_TIMEOUT)
+            call.status(response.status_code)
+        return response
+
+def create_pooled_session(pool_size, session=None):
+    """연결 풀 크기를 지정한 requests 세션 생성 (기존 세션이 주어지면 어댑터만 교체)"""
+    session = session or requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class ClientRegistry:
+    """백엔드별 클라이언트 레지스트리 - API 키/엔드포인트별 SDK 클라이언트와 연결 풀 재사용"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._openai_clients = {}
+        self._ollama_clients = {}
+
+    def google(self):
+        """구글 번역 클라이언트 생성 (연결 풀이 설정된 인증 세션 사용)"""
+        import google.auth
+        from google.auth.credentials import AnonymousCredentials
+        from google.auth.transport.requests import AuthorizedSession
+        from google.cloud import translate_v2 as translate
+
+        if config.GOOGLE_TRANSLATE_ENDPOINT:
+            # 모의 서버: 인증 없이 지정한 주소로 요청
+            credentials = AnonymousCredentials()
+            session = create_pooled_session(config.HTTP_POOL_SIZE['google'], AuthorizedSession(credentials))
+            return translate.Client(credentials=credentials, _http=session,
+                                    client_options={"api_endpoint": config.GOOGLE_TRANSLATE_ENDPOINT})
+
+        credentials, _ = google.auth.default(scopes=translate.Client.SCOPE)
+        session = create_pooled_session(config.HTTP_POOL_SIZE['google'], AuthorizedSession(credentials))
+        return translate.Client(credentials=credentials, _http=session)
+
+    def openai(self, api_key):
+        """API 키별 OpenAI 클라이언트 반환 (없으면 생성)"""
+        import openai
+
+        client_key = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+        with self._lock:
+            client = self._openai_clients.get(client_key)
+            if client is None:
+                client_options = {"api_key": api_key, "timeout": config.OPENAI_TIMEOUT, "max_retries": config.OPENAI_MAX_RETRIES}
+                if config.OPENAI_BASE_URL:
+                    client_options["base_url"] = config.OPENAI_BASE_URL
+                http_client = self._openai_http_client()
+                if http_client is not None:
+                    client_options["http_client"] = http_client
+                client = openai.OpenAI(**client_options)
+                self._openai_clients[client_key] = client
+            return client
+
+    @staticmethod
+    def _openai_http_client():
+        """연결 풀 크기를 지정한 OpenAI용 httpx 클라이언트 (httpx가 없으면 SDK 기본값)"""
+        import openai
+        try:
+            import httpx
+        except ImportError:
+            return None
+
+        pool_size = config.HTTP_POOL_SIZE['openai']
+        return openai.DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    def ollama(self, endpoint):
+        """엔드포인트별 Ollama 클라이언트 반환 (없으면 생성)"""
+        endpoint = endpoint.rstrip('/')
+        with self._lock:
+            client = self._ollama_clients.get(endpoint)
+            if client is None:
+                client = OllamaClient(endpoint)
+                self._ollama_clients[endpoint] = client
+            return client
+
+# 백엔드 클라이언트 레지스트리
+client_registry = ClientRegistry()
+
+# 구글 클라우드 번역 API 클라이언트 (처음 사용할 때 초기화 - 인증 정보 조회가 느리므로 import 시에는 만들지 않음)
+_google_client_lock = threading.Lock()
+_google_client_initialized = False
+
+def get_google_client():
+    """구글 번역 클라이언트 반환 (처음 호출 시 생성, 설정되지 않았으면 None)"""
+    global translate_client, _google_client_initialized
+    if not _google_client_initialized:
+        with _google_client_lock:
+            if not _google_client_initialized:
+                try:
+                    translate_client = client_registry.google()
+                    # 로깅 레벨 조정으로 초기화 성공 메시지 제거
+                except Exception as e:
+                    logging.error(f"Google Cloud Translate API 초기화 실패: {e}")
+                _google_client_initialized = True
+    return translate_client
+
+def get_ollama_client(endpoint="http://localhost:11434"):
+    """엔드포인트별 Ollama 클라이언트 반환"""
+    return client_registry.ollama(endpoint)
 
 # 유틸리티 함수들
-def get_available_ollama_models(endpoint="http://localhost:11434"):
+def get_available_ollama_models(endpoint="http://localhost:11434", refresh=False):
     """Ollama에서 사용 가능한 모델 목록 조회"""
-    try:
-        response = requests.get(f"{endpoint}/api/tags", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            models = [model['name'] for model in data.get('models', [])]
-            return models
-        else:
-            logging.warning(f"Ollama 모델 목록 조회 실패: {response.status_code}")
-            return []
-    except Exception as e:
-        logging.warning(f"Ollama 연결 실패: {e}")
-        return []
+    return get_ollama_client(endpoint).list_models(refresh=refresh)
 
 def validate_ollama_model(endpoint, model):
     """Ollama 모델이 사용 가능한지 확인"""
@@ -80,6 +545,22 @@ def validate_ollama_model(endpoint, model):
     
     return True, "사용 가능"
 
+def prepare_ollama_model(endpoint, model, keep_alive=None):
+    """작업 시작 전 Ollama 모델 확인 및 예열 - 사용할 모델명 반환 (없으면 None)"""
+    is_valid, message = validate_ollama_model(endpoint, model)
+    if not is_valid:
+        logging.error(f"Ollama 모델 검증 실패: {message}")
+        # 사용 가능한 첫 번째 모델로 대체 시도
+        available_models = get_available_ollama_models(endpoint)
+        if not available_models:
+            logging.error("사용 가능한 Ollama 모델이 없습니다.")
+            return None
+        model = available_models[0]
+        logging.info(f"사용 가능한 모델로 변경: {model}")
+
+    get_ollama_client(endpoint).warm_up(model, keep_alive)
+    return model
+
 def clean_temporary_files():
     """임시 파일들 정리"""
     try:
@@ -87,32 +568,50 @@ def clean_temporary_files():
             if os.path.exists(folder):
                 for file in os.listdir(folder):
                     file_path = os.path.join(folder, file)
-                    if os.path.isfile(file_path):
-                        # 1시간 이상 된 파일들 삭제
-                        if time.time() - os.path.getctime(file_path) > 3600:
+                    # 1시간 이상 된 파일들 삭제 (작업별 결과 폴더 포함)
+                    if time.time() - os.path.getctime(file_path) > 3600:
+                        if os.path.isfile(file_path):
                             os.remove(file_path)
+                        elif os.path.isdir(file_path):
+                            shutil.rmtree(file_path, ignore_errors=True)
+        
+        # 오래된 작업 저널 삭제 (중단 후 다시 제출되지 않은 작업)
+        if os.path.exists(config.JOURNAL_FOLDER):
+            for file in os.listdir(config.JOURNAL_FOLDER):
+                file_path = os.path.join(config.JOURNAL_FOLDER, file)
+                if time.time() - os.path.getmtime(file_path) > config.JOURNAL_RETENTION:
+                    os.remove(file_path)
     except Exception as e:
         logging.error(f"임시 파일 정리 중 오류: {e}")
 
-def validate_file(file):
-    """파일 유효성 검사"""
+def validate_file(file, extensions=None):
+    """파일 유효성 검사 (extensions: 허용 확장자, 기본은 로컬라이제이션 파일)"""
     if not file or not file.filename:
         raise ValueError("파일이 선택되지 않았습니다.")
     
     # 파일 확장자 검사
+    extensions = extensions or config.SUPPORTED_EXTENSIONS
     _, ext = os.path.splitext(file.filename.lower())
-    if ext not in config.SUPPORTED_EXTENSIONS:
-        raise ValueError(f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(config.SUPPORTED_EXTENSIONS)}")
+    if ext not in extensions:
+        raise ValueError(f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(sorted(extensions))}")
+    if ext == '.zip':
+        return  # ZIP은 요청 전체 크기로 제한하고 안의 파일마다 크기 검사
     
-    # 파일 크기 검사 (Content-Length 헤더가 있는 경우)
-    if hasattr(file, 'content_length') and file.content_length:
-        if file.content_length > config.MAX_FILE_SIZE:
-            raise ValueError(f"파일 크기가 너무 큽니다. 최대 크기: {config.MAX_FILE_SIZE // (1024*1024)}MB")
+    # 파일 크기 검사 (Content-Length 헤더가 있는 경우, 없으면 받은 크기)
+    size = getattr(file, 'content_length', None)
+    if not size and hasattr(file, 'stream'):
+        position = file.stream.tell()
+        size = file.stream.seek(0, os.SEEK_END)
+        file.stream.seek(position)
+    if size and size > config.MAX_FILE_SIZE:
+        raise ValueError(f"파일 크기가 너무 큽니다. 최대 크기: {config.MAX_FILE_SIZE // (1024*1024)}MB")
 
 def sanitize_text_for_ai(text):
     """AI 번역을 위한 텍스트 전처리 - 들여쓰기를 줄바꿈으로 변환"""
     if not text:
         return text
+    if '\n' not in text:
+        return text.lstrip()  # 한 줄짜리 값 (대부분의 항목)
     
     # 모든 들여쓰기를 강제로 제거하고 \n으로 교체
     lines = text.split('\n')
@@ -132,77 +631,88 @@ def sanitize_text_for_ai(text):
     
     return '\n'.join(processed_lines)
 
-def restore_text_formatting(text):
-    """번역 후 텍스트 포맷팅 복원"""
-    if not text:
-        return text
-    
-    # \\n을 실제 줄바꿈으로 변환
-    text = text.replace('\\n', '\n')
-    
-    # AI 응답 정리 (불필요한 설명 제거)
-    text = clean_ai_response(text)
-    
-    # 번역된 텍스트 정리 (HTML 엔티티 등)
-    text = clean_translated_text(text)
-    
+# AI 응답 후처리 (패턴은 한 번만 컴파일, 항목마다 각 단계를 한 번씩만 실행)
+# 제거할 설명 패턴과 그 패턴이 맞으려면 응답에 있어야 하는 문구 (casefold 기준) - 문구가 없으면 정규식을 실행하지 않음
+AI_RESPONSE_NOISE_PATTERNS = tuple(
+    (trigger, re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL))
+    for trigger, pattern in (
+        ("let me know if you have", r'Let me know if you have.*?translate!'),
+        ("i'm ready for", r'I\'m ready for.*?challenge\.?'),
+        ("**explanation:**", r'\*\*Explanation:\*\*.*?\n'),
+        ("* ", r'\* .*?symbols.*?\.'),
+        ("* i translated", r'\* I translated.*?\.'),
+        ("* the", r'\* The.*?emphasis\.'),
+        ("* i kept", r'\* I kept.*?\.'),
+        ("let me know if", r'Let me know if.*?translate!'),
+        ("i'd be happy to", r'I\'d be happy to.*?'),
+        ("here's the translation", r'Here\'s the translation.*?:'),
+        ("translation:", r'Translation:.*?\n'),
+        ("**", r'\*\*.*?\*\*.*?\n'),
+        ("explanation:", r'Explanation:.*?\n'),
+        ("note:", r'Note:.*?\n'),
+    )
+)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def remove_ai_noise(text):
+    """AI 응답에서 설명/인사말 제거 (문구가 있는 패턴만 원래 순서대로 적용)"""
+    folded = text.casefold()
+    for trigger, pattern in AI_RESPONSE_NOISE_PATTERNS:
+        if trigger in folded:
+            text = pattern.sub('', text)
+            folded = text.casefold()
     return text
 
+def postprocess_ai_texts(texts, placeholders=None):
+    """AI 응답 목록 후처리 - 설명 제거 → HTML 엔티티 디코딩 → 공백 정리 → 플레이스홀더 복원
+    (placeholders: 항목별 preserve_tokens 결과 목록, 빈 응답은 그대로)"""
+    results = []
+    for index, text in enumerate(texts):
+        if text:
+            text = remove_ai_noise(text)
+            if '&' in text:
+                text = html.unescape(text)
+            text = WHITESPACE_PATTERN.sub(' ', text).strip()
+            if placeholders and placeholders[index]:
+                text = restore_tokens(text, placeholders[index])
+        results.append(text)
+    return results
+
+def postprocess_ai_text(text, placeholders=None):
+    """AI 응답 하나 후처리 (postprocess_ai_texts 참고)"""
+    return postprocess_ai_texts([text], [placeholders])[0]
+
+def restore_text_formatting(text):
+    """번역 후 텍스트 포맷팅 복원 (\\n 이스케이프는 로컬라이제이션 값 그대로 유지)"""
+    return postprocess_ai_text(text)
+
 def clean_ai_response(text):
     """AI 응답에서 불필요한 설명과 주석 제거"""
     if not text:
         return text
-    
-    # 일반적인 AI 응답 패턴들 제거
-    patterns_to_remove = [
-        r'Let me know if you have.*?translate!',
-        r'I\'m ready for.*?challenge\.?',
-        r'\*\*Explanation:\*\*.*?\n',
-        r'\* .*?symbols.*?\.',
-        r'\* I translated.*?\.',
-        r'\* The.*?emphasis\.',
-        r'\* I kept.*?\.',
-        r'Let me know if.*?translate!',
-        r'I\'d be happy to.*?',
-        r'Here\'s the translation.*?:',
-        r'Translation:.*?\n',
-        r'\*\*.*?\*\*.*?\n',
-        r'Explanation:.*?\n',
-        r'Note:.*?\n',
-    ]
-    
-    # 패턴들을 순차적으로 제거
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-    
-    # 연속된 공백과 줄바꿈 정리
-    text = re.sub(r'\n\s*\n', '\n', text)  # 연속된 빈 줄 제거
-    text = re.sub(r'\s+', ' ', text)  # 연속된 공백을 하나로
-    
-    return text.strip()
+    return WHITESPACE_PATTERN.sub(' ', remove_ai_noise(text)).strip()
 
 def clean_translated_text(text):
     """번역된 텍스트 정리"""
     if not text:
         return text
     
-    # HTML 엔티티 디코딩
-    text = html.unescape(text)
-    
-    # 불필요한 공백 정리
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
+    # HTML 엔티티 디코딩 후 불필요한 공백 정리
+    return WHITESPACE_PATTERN.sub(' ', html.unescape(text)).strip()
 
 # 토큰 보존 함수들
-def preserve_tokens(text):
-    """토큰($...$) 보존: 토큰을 임시 플레이스홀더로 치환"""
-    if not text:
+# 게임 마크업 토큰: $변수$, §색상 코드, £아이콘, [스크립트 로컬라이제이션], \n 줄바꿈 이스케이프
+MARKUP_TOKEN_PATTERN = re.compile(r'(?:\$[^$\s]+\$|§[0-9A-Za-z!]|£[0-9A-Za-z_|\-]+£?|\[[^\[\]\n]+\]|\\n)')
+PRESERVED_TOKEN_PATTERN = re.compile(r'(\$[^$]*\$)')
+
+def preserve_tokens(text, strict=False):
+    """토큰 보존: 토큰을 임시 플레이스홀더로 치환 (기본은 $...$만, strict면 모든 마크업 토큰)"""
+    if not text or (not strict and '$' not in text):
         return text, {}
     
-    token_pattern = re.compile(r'(\$[^$]*\$)')
-    tokens = token_pattern.findall(text)
+    tokens = dict.fromkeys((MARKUP_TOKEN_PATTERN if strict else PRESERVED_TOKEN_PATTERN).findall(text))  # 같은 토큰이 여러 번 나와도 플레이스홀더 하나
+    if strict:
+        tokens = sorted(tokens, key=len, reverse=True)  # 다른 토큰 안에 들어 있는 짧은 토큰(§Y, \n)이 먼저 치환되지 않도록
     placeholders = {}
     
     for i, token in enumerate(tokens):
@@ -212,6 +722,15 @@ def preserve_tokens(text):
     
     return text, placeholders
 
+def has_markup_integrity(source_text, translated_text):
+    """번역이 원문의 마크업 토큰을 같은 개수로 모두 유지하고 새 토큰을 만들지 않았는지 검사"""
+    if translated_text is None or translated_text == source_text:
+        return True
+    source_tokens = MARKUP_TOKEN_PATTERN.findall(source_text)
+    translated_tokens = MARKUP_TOKEN_PATTERN.findall(translated_text)
+    # 대부분은 순서까지 같으므로 정렬 비교는 순서가 바뀐 경우에만
+    return source_tokens == translated_tokens or sorted(source_tokens) == sorted(translated_tokens)
+
 def restore_tokens(text, placeholders):
     """치환된 토큰 복원"""
     if not text or not placeholders:
@@ -222,75 +741,181 @@ def restore_tokens(text, placeholders):
     
     return text
 
+# OpenAI 묶음 요청 관련 함수들
+def estimate_tokens(text):
+    """토큰 수 추정 (ASCII는 약 4자당 1토큰, 그 외 문자는 1자당 1토큰)"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+def pack_texts_by_token_budget(texts, token_budget, max_entries):
+    """추정 토큰 예산에 맞춰 텍스트 인덱스를 묶음 단위로 분할"""
+    packs = []
+    current_pack = []
+    current_tokens = 0
+
+    for index, text in enumerate(texts):
+        # JSON 키/따옴표 등 항목당 오버헤드 포함
+        item_tokens = estimate_tokens(text) + 8
+        if current_pack and (len(current_pack) >= max_entries or current_tokens + item_tokens > token_budget):
+            packs.append(current_pack)
+            current_pack = []
+            current_tokens = 0
+        current_pack.append(index)
+        current_tokens += item_tokens
+
+    if current_pack:
+        packs.append(current_pack)
+
+    return packs
+
+def supports_openai_json_mode(model):
+    """response_format=json_object 지원 모델 여부 (구형 gpt-4 제외)"""
+    return not re.fullmatch(r'gpt-4(-0314|-0613)?', model)
+
+def parse_json_object_response(content):
+    """AI 응답에서 JSON 객체 추출 (코드 블록 감싸기 허용)"""
+    content = (content or '').strip()
+    if content.startswith('```'):
+        content = re.sub(r'^```(?:json)?\s*|\s*```$', '', content)
+
+    data = json.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("응답이 JSON 객체가 아닙니다.")
+    return data
+
 # 파라독스 로컬라이제이션 파일 처리
+LocEntry = namedtuple('LocEntry', ['line_num', 'language', 'key', 'version', 'value', 'raw_line', 'value_span'])
+
+# 미리 컴파일한 파싱 패턴
+LOC_HEADER_PATTERN = re.compile(r'^\s*(l_\w+):\s*(?:#.*)?$')
+# 1차: 값 뒤에 주석이 있는 경우 (값 안의 \" 이스케이프 허용)
+LOC_ENTRY_WITH_COMMENT_PATTERN = re.compile(r'^\s*([^:#]+):(\d*)\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*#.*$')
+# 2차: 정상적인 패턴 (마지막 따옴표까지가 값)
+LOC_ENTRY_PATTERN = re.compile(r'^\s*([^:#]+):(\d*)\s*"(.*)"\s*$')
+# 3차: 끝 따옴표 없음
+LOC_ENTRY_UNCLOSED_PATTERN = re.compile(r'^\s*([^:#]+):(\d*)\s+"(.+?)\'?\s*$')
+# 4차: 따옴표가 완전히 없음
+LOC_ENTRY_UNQUOTED_PATTERN = re.compile(r'^\s*([^:#]+):(\d*)\s+(.+?)\s*$')
+LOC_LINE_PATTERNS = ((LOC_ENTRY_PATTERN, None), (LOC_ENTRY_UNCLOSED_PATTERN, 'unclosed'))
+LOC_LINE_PATTERNS_WITH_COMMENT = ((LOC_ENTRY_WITH_COMMENT_PATTERN, None),) + LOC_LINE_PATTERNS
+
+def iter_decoded_lines(source, position=None):
+    """파일 경로 또는 바이너리 스트림을 한 번만 읽으며 줄 단위로 디코딩 (UTF-8 실패 시 cp1252)
+    (position: 파일 경로를 이어 읽을 위치 {"offset", "line_num", "encoding"} - 줄을 반환할 때마다 갱신)"""
+    stream = open(source, 'rb') if isinstance(source, (str, os.PathLike)) else source
+    encoding = 'utf-8'
+    start = 1
+    if position is not None:
+        stream.seek(position["offset"])
+        encoding = position["encoding"]
+        start = position["line_num"] + 1
+
+    try:
+        for line_num, raw in enumerate(stream, start):
+            if position is not None:
+                position["offset"] += len(raw)
+            if isinstance(raw, str):
+                line = raw
+            else:
+                if line_num == 1 and raw.startswith(b'\xef\xbb\xbf'):
+                    raw = raw[3:]
+                try:
+                    line = raw.decode(encoding)
+                except UnicodeDecodeError:
+                    # UTF-8로 읽기 실패 시 이후 줄은 cp1252로 처리
+                    logging.warning(f"라인 {line_num}: UTF-8 디코딩 실패 - cp1252로 처리합니다.")
+                    encoding = 'cp1252'
+                    line = raw.decode(encoding, errors='replace')
+            if position is not None:
+                position["line_num"] = line_num
+                position["encoding"] = encoding
+
+            yield line_num, line.rstrip('\r\n')
+    finally:
+        if stream is not source:
+            stream.close()
+
+def parse_localization_line(line):
+    """로컬라이제이션 한 줄 파싱 - (키, 버전, 값, 값 위치, 자동 수정 종류) 또는 None"""
+    # 주석 패턴은 '#'이 있는 줄에만 적용 (대부분의 줄은 정상 패턴 한 번으로 끝남)
+    patterns = LOC_LINE_PATTERNS_WITH_COMMENT if '#' in line else LOC_LINE_PATTERNS
+    for pattern, fix in patterns:
+        match = pattern.match(line)
+        if match:
+            value = match.group(3)
+            value_span = match.span(3)
+            if fix == 'unclosed':
+                # 잘못된 작은따옴표 제거
+                value = value.rstrip("'")
+                value_span = (value_span[0], value_span[0] + len(value))
+            return match.group(1).strip(), match.group(2), value, value_span, fix
+
+    if '"' not in line:
+        match = LOC_ENTRY_UNQUOTED_PATTERN.match(line)
+        if match:
+            return match.group(1).strip(), match.group(2), match.group(3), match.span(3), 'unquoted'
+
+    return None
+
+def iter_localization_lines(lines, parsing_errors=None):
+    """(줄 번호, 줄) 목록을 파싱하며 (줄 번호, 줄, LocEntry 또는 None) 반환 - 헤더, 주석, 빈 줄, 파싱 실패한 줄은 None"""
+    language = None
+
+    for line_num, line in lines:
+        stripped = line.strip()
+
+        # 주석, 빈 줄은 건너뜀
+        if not stripped or stripped[0] == '#':
+            yield line_num, line, None
+            continue
+
+        # 언어 헤더(l_*)는 이후 항목의 언어로 사용
+        if stripped.startswith('l_'):
+            header = LOC_HEADER_PATTERN.match(line)
+            if header:
+                language = header.group(1)
+                yield line_num, line, None
+                continue
+
+        parsed = parse_localization_line(line)
+        if parsed is None:
+            # 파싱 실패한 라인 처리
+            if parsing_errors is not None and '"' in line:
+                parsing_errors.append(f"라인 {line_num}: 파싱 실패 (건너뜀) - '{stripped}'")
+            yield line_num, line, None
+            continue
+
+        key, version, value, value_span, fix = parsed
+        if parsing_errors is not None and fix == 'unclosed':
+            parsing_errors.append(f"라인 {line_num}: 따옴표 오류 자동 수정 - '{stripped}' → '{key}:{version} \"{value}\"'")
+        elif parsing_errors is not None and fix == 'unquoted':
+            parsing_errors.append(f"라인 {line_num}: 따옴표 누락 자동 수정 - '{stripped}' → '{key}:{version} \"{value}\"'")
+
+        yield line_num, line, LocEntry(line_num, language or 'l_english', key, version, value, line, value_span)
+
+def iter_paradox_localization(source, parsing_errors=None):
+    """파라독스 로컬라이제이션 스트리밍 파서 - 항목을 LocEntry로 하나씩 반환 (여러 l_* 블록 지원)"""
+    lines = iter_localization_lines(iter_decoded_lines(source), parsing_errors)
+    try:
+        for _, _, entry in lines:
+            if entry is not None:
+                yield entry
+    finally:
+        lines.close()
+
 def load_paradox_localization_file(file_path):
     """파라독스 로컬라이제이션 파일 로드 및 파싱"""
-    try:
-        with open(file_path, 'r', encoding='utf-8-sig') as file:
-            content = file.read()
-    except UnicodeDecodeError:
-        # UTF-8로 읽기 실패 시 다른 인코딩 시도
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-        except UnicodeDecodeError:
-            with open(file_path, 'r', encoding='cp1252') as file:
-                content = file.read()
-    
-    # 언어 코드 추출 (예: l_english)
-    language_match = re.search(r'(l_\w+):', content)
-    language_code = language_match.group(1) if language_match else 'l_english'
-    
-    # 키-값 쌍 추출
-    result = {language_code: {}}
-    lines = content.split('\n')
+    result = {}
     parsing_errors = []
     
-    for line_num, line in enumerate(lines, 1):
-        original_line = line
-        line = line.strip()
-        
-        # 주석, 빈 줄, 혹은 언어 헤더(l_*)는 건너뜀
-        if not line or line.startswith('#') or re.match(r'l_\w+:', line):
-            continue
-        
-        # 키-값 쌍 파싱 시도
-        success = False
-        
-        # 1차 시도: 정상적인 패턴
-        match = re.match(r'^\s*([^:]+:\s*\d*)\s+"(.+)"\s*$', line)
-        if match:
-            key_part = match.group(1)
-            value_text = match.group(2)
-            key = key_part.strip()
-            result[language_code][key] = f'"{value_text}"'
-            success = True
-        else:
-            # 2차 시도: 따옴표 문제 해결 (끝 따옴표 없음)
-            match = re.match(r'^\s*([^:]+:\s*\d*)\s+"(.+?)\'?\s*$', line)
-            if match:
-                key_part = match.group(1)
-                value_text = match.group(2)
-                key = key_part.strip()
-                # 따옴표 수정
-                fixed_value = value_text.rstrip("'")  # 잘못된 작은따옴표 제거
-                result[language_code][key] = f'"{fixed_value}"'
-                parsing_errors.append(f"라인 {line_num}: 따옴표 오류 자동 수정 - '{original_line.strip()}' → '{key} \"{fixed_value}\"'")
-                success = True
-            else:
-                # 3차 시도: 따옴표가 완전히 없는 경우
-                match = re.match(r'^\s*([^:]+:\s*\d*)\s+(.+?)\s*$', line)
-                if match and '"' not in line:
-                    key_part = match.group(1)
-                    value_text = match.group(2)
-                    key = key_part.strip()
-                    result[language_code][key] = f'"{value_text}"'
-                    parsing_errors.append(f"라인 {line_num}: 따옴표 누락 자동 수정 - '{original_line.strip()}' → '{key} \"{value_text}\"'")
-                    success = True
-        
-        # 파싱 실패한 라인 처리
-        if not success and '"' in line:
-            parsing_errors.append(f"라인 {line_num}: 파싱 실패 (건너뜀) - '{original_line.strip()}'")
+    # 키는 기존 형식대로 버전 숫자 포함 (예: tech_name:0)
+    for entry in iter_paradox_localization(file_path, parsing_errors):
+        result.setdefault(entry.language, {})[f"{entry.key}:{entry.version}"] = f'"{entry.value}"'
+    
+    if not result:
+        result = {'l_english': {}}
     
     # 파싱 오류 로깅
     if parsing_errors:
@@ -302,73 +927,8 @@ def load_paradox_localization_file(file_path):
     
     return result
 
-class TranslationService:
-    """번역 서비스 클래스"""
-    
-    def __init__(self):
-        self.cache = {}  # 번역 캐시
-    
-    def translate_with_google(self, text, target_language):
-        """구글 클라우드 번역 API를 사용한 번역"""
-        if not text.strip():
-            return text
-        
-        if not translate_client:
-            raise Exception("Google Cloud Translate API가 설정되지 않았습니다.")
-        
-        # 캐시 확인
-        cache_key = f"google_{text}_{target_language}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # 구글 번역의 경우 토큰 보존을 위해 플레이스홀더 처리
-        text_to_translate, placeholders = preserve_tokens(text)
-        
-        try:
-            result = translate_client.translate(text_to_translate, target_language=target_language)
-            translated_text = result['translatedText']
-            
-            # HTML 엔티티 디코딩 (&quot; → " 등)
-            translated_text = html.unescape(translated_text)
-            
-            # 토큰 복원
-            translated_text = restore_tokens(translated_text, placeholders)
-            
-            # 캐시 저장
-            self.cache[cache_key] = translated_text
-            return translated_text
-            
-        except Exception as e:
-            logging.error(f"Google 번역 API 오류: {e}")
-            return text
-    
-    def translate_with_openai(self, text, target_language, api_key, model="gpt-3.5-turbo"):
-        """OpenAI API를 사용한 텍스트 번역"""
-        if not text.strip():
-            return text
-        
-        if not api_key:
-            raise ValueError("OpenAI API 키가 필요합니다.")
-        
-        # 캐시 확인
-        cache_key = f"openai_{text}_{target_language}_{model}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        target_lang_name = config.LANGUAGE_NAMES.get(target_language, target_language)
-        
-        # AI 번역을 위한 텍스트 전처리
-        processed_text = sanitize_text_for_ai(text)
-        
-        try:
-            client = openai.OpenAI(api_key=api_key)
-            
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. Your task is to translate the following text into {target_lang_name} accurately and naturally.
-
-CRITICAL RULES:
+# AI 번역 규칙 (OpenAI/Ollama, 단일 요청/묶음 요청 공용)
+AI_TRANSLATION_RULES = """CRITICAL RULES:
 1. NEVER translate anything between $ symbols (e.g., $PARAM$, $VALUE$, $COUNTRY_NAME$). Keep these exactly as they are.
 2. These $ tokens are game variables/placeholders that must remain untouched.
 
@@ -387,7 +947,42 @@ TRANSLATION GUIDELINES:
 7. Maintain consistency in terminology throughout the text.
 8. For numbers with units, preserve the format (e.g., "50 km", "1943년").
 9. Keep proper nouns (character names, place names) in their commonly accepted translated forms.
-10. If uncertain about a specific term, prioritize clarity and common usage over literal translation.
+10. If uncertain about a specific term, prioritize clarity and common usage over literal translation."""
+
+# 압축 프롬프트 (요청 크기 최소화 - 짧은 고정 지시문만 system에 두고 언어/예시/본문은 user에 넣음)
+AI_COMPACT_RULES = """You translate video game localisation text.
+- Keep every $TOKEN$, [Scripted.Loc], §X colour code, £icon and \\n exactly as written.
+- Use established official terms for historical people, places, ranks and political terms; keep terminology consistent.
+- Keep numbers and units in the same format."""
+
+AI_COMPACT_OUTPUT_SINGLE = "Output only the translated text: no notes, explanations or markdown."
+AI_COMPACT_OUTPUT_PACK = ("Input is a JSON object of separate entries. Output only a JSON object with exactly the same keys, "
+                          "each value translated independently. No notes or code fences.")
+
+def build_openai_messages(target_lang_name, content, references="", packed=False, compact=False):
+    """OpenAI 요청 메시지 생성 (packed: JSON 묶음 요청, compact: 입력 토큰을 줄인 압축 프롬프트)
+    (유사 번역 예시는 system 끝에 붙여 그 앞의 고정 지시문은 요청마다 같게 유지)"""
+    if compact:
+        system_prompt = f"{AI_COMPACT_RULES}\n{AI_COMPACT_OUTPUT_PACK if packed else AI_COMPACT_OUTPUT_SINGLE}"
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"Target language: {target_lang_name}{references}\n\n{'JSON' if packed else 'Text'}:\n{content}"}
+        ]
+
+    if packed:
+        system_prompt = f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. You will receive a JSON object whose values are separate game text entries. Translate every value into {target_lang_name} accurately and naturally.
+
+{AI_TRANSLATION_RULES}
+
+OUTPUT FORMAT:
+- Return ONLY a JSON object with exactly the same keys as the input
+- Each value must be the translation of the input value with the same key
+- Translate each entry independently; never merge, split, drop or add keys
+- No explanations, notes, markdown or code fences{references}"""
+    else:
+        system_prompt = f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. Your task is to translate the following text into {target_lang_name} accurately and naturally.
+
+{AI_TRANSLATION_RULES}
 
 OUTPUT FORMAT:
 - Return ONLY the translated text
@@ -396,111 +991,794 @@ OUTPUT FORMAT:
 - No "Explanation:" or "**Explanation:**" sections
 - No asterisk (*) bullet points or markdown formatting
 - Maintain exact same structure and formatting as input
-- DO NOT add any conversational elements or offers to help further"""}, 
-                    {"role": "user", "content": processed_text}
-                ],
-                temperature=0.1,  # 더 일관된 번역을 위해 낮춤
-                max_tokens=1024
-            )
-            
-            translated_text = response.choices[0].message.content.strip()
-            
-            # AI 응답 정리 (불필요한 설명 제거)
-            translated_text = clean_ai_response(translated_text)
-            
-            # 텍스트 포맷팅 복원
-            translated_text = restore_text_formatting(translated_text)
-            
-            # 캐시 저장
-            self.cache[cache_key] = translated_text
-            return translated_text
-            
-        except openai.APIError as e:
-            logging.error(f"OpenAI API 오류: {e}")
-            return text
-        except openai.RateLimitError as e:
-            logging.error(f"OpenAI API 요청 한도 초과: {e}")
-            time.sleep(60)  # 1분 대기 후 원본 텍스트 반환
-            return text
-        except Exception as e:
-            logging.error(f"OpenAI API 번역 중 예상치 못한 오류: {e}")
-            return text
-    
-    def translate_with_ollama(self, text, target_language, endpoint="http://localhost:11434", model="llama3.1:8b"):
-        """Ollama API를 사용한 텍스트 번역"""
-        if not text.strip():
-            return text
-        
-        # 캐시 확인
-        cache_key = f"ollama_{text}_{target_language}_{model}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # 모델 유효성 검사
-        is_valid, message = validate_ollama_model(endpoint, model)
-        if not is_valid:
-            logging.error(f"Ollama 모델 검증 실패: {message}")
-            # 사용 가능한 첫 번째 모델로 대체 시도
-            available_models = get_available_ollama_models(endpoint)
-            if available_models:
-                model = available_models[0]
-                logging.info(f"사용 가능한 모델로 변경: {model}")
-            else:
-                logging.error("사용 가능한 Ollama 모델이 없습니다.")
-                return text
-        
-        target_lang_name = config.LANGUAGE_NAMES.get(target_language, target_language)
-        
-        # AI 번역을 위한 텍스트 전처리
-        processed_text = sanitize_text_for_ai(text)
-        
-        try:
-            response = requests.post(
-                f"{endpoint}/api/generate",
-                headers={"Content-Type": "application/json"},
-                json={
-                    "model": model,
-                    "prompt": f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. Translate the following text into {target_lang_name} accurately and naturally.
+- DO NOT add any conversational elements or offers to help further{references}"""
 
-CRITICAL RULES:
-1. NEVER translate anything between $ symbols (e.g., $PARAM$, $VALUE$, $COUNTRY_NAME$). Keep these exactly as they are.
-2. These $ tokens are game variables/placeholders that must remain untouched.
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": content}
+    ]
 
-TRANSLATION GUIDELINES:
-3. Use game-appropriate terminology and style for the target language.
-4. Preserve all formatting: \\n for line breaks, special punctuation, numbers, dates.
-5. For abbreviations/acronyms of organizations, expand to full official names:
-   - NATO → North Atlantic Treaty Organization → 북대서양 조약 기구
-   - USSR → Union of Soviet Socialist Republics → 소비에트 사회주의 공화국 연방
-   - EU → European Union → 유럽연합
-6. Use established official translations for:
-   - Historical figures and places
-   - Military ranks and titles  
-   - Political/governmental terms
-   - Religious and cultural terms
-7. Maintain consistency in terminology throughout the text.
-8. For numbers with units, preserve the format (e.g., "50 km", "1943년").
-9. Keep proper nouns (character names, place names) in their commonly accepted translated forms.
-10. If uncertain about a specific term, prioritize clarity and common usage over literal translation.
+_legacy_prompt_tokens = None
+
+def get_legacy_prompt_tokens():
+    """항목마다 전체 프롬프트를 보내던 방식의 항목당 고정 입력 토큰 추정치"""
+    global _legacy_prompt_tokens
+    if _legacy_prompt_tokens is None:
+        _legacy_prompt_tokens = estimate_tokens(build_openai_messages("Korean", "")[0]["content"]) + 8  # 메시지 구분 토큰 포함
+    return _legacy_prompt_tokens
+
+class TranslationCache:
+    """2단계 번역 캐시 (메모리 LRU + SQLite 디스크 저장소)"""
+
+    def __init__(self, max_bytes=None, db_path=None):
+        self.max_bytes = config.CACHE_MEMORY_LIMIT if max_bytes is None else max_bytes
+        self.db_path = config.CACHE_DB_PATH if db_path is None else db_path
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_opened = False  # 디스크 캐시는 처음 조회/저장할 때 엶 (모듈 불러오기만으로 파일을 만들지 않음)
+
+        # 적중/실패 통계
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _open_db(self):
+        """디스크 캐시(SQLite) 열기 - 처음 한 번만 시도, 실패 시 메모리 캐시만 사용 (락 안에서 호출)"""
+        if self._db_opened:
+            return
+        self._db_opened = True
+        if not self.db_path:
+            return
+
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._db.commit()
+        except (sqlite3.Error, OSError) as e:
+            logging.error(f"디스크 캐시 초기화 실패 (메모리 캐시만 사용): {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(backend, model, target_language, text):
+        """백엔드, 모델, 대상 언어, 프롬프트 버전, 원문으로 해시 키 생성"""
+        raw = '\x1f'.join([backend, model or '', target_language, config.PROMPT_VERSION, text])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _entry_size(key, value):
+        """메모리 캐시 항목의 대략적인 바이트 크기"""
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def _remember(self, key, value):
+        """메모리 LRU에 저장하고 바이트 한도를 넘으면 오래된 항목부터 제거 (락 안에서 호출)"""
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return
+
+        old_value = self._memory.pop(key, None)
+        if old_value is not None:
+            self._memory_bytes -= self._entry_size(key, old_value)
+
+        self._memory[key] = value
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_bytes and self._memory:
+            old_key, old_value = self._memory.popitem(last=False)
+            self._memory_bytes -= self._entry_size(old_key, old_value)
+
+    def get(self, key):
+        """캐시 조회 (메모리 → 디스크 순서), 없으면 None"""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return value
+
+            self._open_db()
+            if self._db is not None:
+                try:
+                    row = self._db.execute('SELECT value FROM translations WHERE key = ?', (key,)).fetchone()
+                except sqlite3.Error as e:
+                    logging.warning(f"디스크 캐시 조회 실패: {e}")
+                    row = None
+
+                if row:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        """캐시 저장 (메모리 + 디스크)"""
+        with self._lock:
+            self._remember(key, value)
+
+            self._open_db()
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO translations (key, value, created_at) VALUES (?, ?, ?)',
+                        (key, value, time.time())
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logging.warning(f"디스크 캐시 저장 실패: {e}")
+
+    def stats(self):
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_limit_bytes": self.max_bytes,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "disk_enabled": self._db is not None or (not self._db_opened and bool(self.db_path))
+            }
+
+    def close(self):
+        """디스크 캐시 연결 종료"""
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._db.close()
+                except sqlite3.Error:
+                    pass
+                self._db = None
+
+# 게임 변수 토큰 ($COUNTRY$, $VALUE|+=0$ 등)
+VARIABLE_TOKEN_PATTERN = re.compile(r'\$[^$\s]+\$')
+
+class FuzzyTranslationMemory:
+    """유사 번역 메모리 - 문자 n-gram MinHash LSH 색인 (근사 일치 예시 조회, $변수$만 다른 항목 재사용)
+    (scope: 항목을 나누는 키 - 전역 메모리는 (백엔드, 모델, 언어), 작업 번역 메모리는 언어)"""
+
+    NGRAM = 3  # 문자 n-gram 길이
+    BANDS = 6  # LSH 밴드 수
+    ROWS = 2  # 밴드당 해시 수
+    BUCKET_LIMIT = 32  # 버킷당 최대 항목 수 (반복이 많은 문장에서 조회 시간 제한)
+    CANDIDATE_LIMIT = 8  # 유사도를 직접 계산할 후보 수
+
+    def __init__(self, max_entries=None, threshold=None, seed=1):
+        self.max_entries = config.FUZZY_MEMORY_MAX_ENTRIES if max_entries is None else max_entries
+        self.threshold = config.FUZZY_MEMORY_THRESHOLD if threshold is None else threshold
+
+        # MinHash 순열: n-gram 해시에 XOR할 난수 (곱셈/나머지 연산보다 빠름)
+        rng = random.Random(seed)
+        self._salts = [rng.getrandbits(61) for _ in range(self.BANDS * self.ROWS)]
+        self._lock = threading.Lock()
+        self._entries = []  # (범위, 원문, 번역)
+        self._templates = {}  # (범위, 변수를 지운 원문) → 항목 번호
+        self._buckets = {}  # 밴드 해시 → 항목 번호 (여러 개면 리스트)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _shingles(self, template):
+        """문자 n-gram 집합 (변수 토큰은 $ 하나로 치환된 원문 기준)"""
+        text = ' '.join(template.lower().split())
+        if len(text) <= self.NGRAM:
+            return {text}
+        return {text[i:i + self.NGRAM] for i in range(len(text) - self.NGRAM + 1)}
+
+    def _band_keys(self, scope, shingles):
+        """MinHash 서명을 밴드별로 나눈 버킷 키"""
+        hashes = [hash(shingle) for shingle in shingles]
+        signature = [min([h ^ salt for h in hashes]) for salt in self._salts]
+        rows = self.ROWS
+        return [hash((scope, band) + tuple(signature[band * rows:(band + 1) * rows]))
+                for band in range(self.BANDS)]
+
+    def add(self, scope, source_text, translated_text):
+        """번역 쌍 추가 (변수만 다른 원문이 이미 있으면 추가하지 않음)"""
+        if not source_text.strip() or not translated_text or translated_text == source_text:
+            return False
+
+        template = VARIABLE_TOKEN_PATTERN.sub('$', source_text)
+        template_key = (scope, template)
+        if template_key in self._templates or len(self._entries) >= self.max_entries:
+            return False
+
+        band_keys = self._band_keys(scope, self._shingles(template))
+        with self._lock:
+            if template_key in self._templates:
+                return False
+            entry_id = len(self._entries)
+            self._entries.append((scope, source_text, translated_text))
+            self._templates[template_key] = entry_id
+
+            for band_key in band_keys:
+                bucket = self._buckets.get(band_key)
+                if bucket is None:
+                    self._buckets[band_key] = entry_id
+                elif isinstance(bucket, int):
+                    self._buckets[band_key] = [bucket, entry_id]
+                elif len(bucket) < self.BUCKET_LIMIT:
+                    bucket.append(entry_id)
+        return True
+
+    def add_many(self, scope, pairs):
+        """번역 쌍 여러 개 추가 [(원문, 번역)]"""
+        return sum(1 for source_text, translated_text in pairs if self.add(scope, source_text, translated_text))
+
+    def reuse(self, text, scope):
+        """$변수$만 다른 원문이 있으면 변수를 바꿔 끼운 번역 반환 (없으면 None, 원문이 같은 항목은 번역 캐시에서 처리)"""
+        entry_id = self._templates.get((scope, VARIABLE_TOKEN_PATTERN.sub('$', text)))
+        if entry_id is None:
+            return None
+
+        _, source_text, translated_text = self._entries[entry_id]
+        if source_text == text:
+            return None
+
+        # 이전 원문의 변수 → 새 원문의 변수 (같은 변수가 서로 다른 변수로 바뀌면 재사용 안 함)
+        mapping = {}
+        for old_token, new_token in zip(VARIABLE_TOKEN_PATTERN.findall(source_text), VARIABLE_TOKEN_PATTERN.findall(text)):
+            if mapping.setdefault(old_token, new_token) != new_token:
+                return None
+        if any(old_token not in translated_text for old_token in mapping):
+            return None  # 번역에서 변수가 빠진 경우
+
+        return VARIABLE_TOKEN_PATTERN.sub(lambda match: mapping.get(match.group(0), match.group(0)), translated_text)
+
+    def similar(self, text, scope, limit=None):
+        """유사도가 기준 이상인 이전 번역 [(유사도, 원문, 번역)] (유사도 높은 순)"""
+        template = VARIABLE_TOKEN_PATTERN.sub('$', text)
+        shingles = self._shingles(template)
+
+        # 같은 버킷에 많이 들어간 항목 순으로 후보 선정
+        hits = {}
+        for band_key in self._band_keys(scope, shingles):
+            bucket = self._buckets.get(band_key)
+            if bucket is None:
+                continue
+            for entry_id in ((bucket,) if isinstance(bucket, int) else bucket):
+                hits[entry_id] = hits.get(entry_id, 0) + 1
+        if not hits:
+            return []
+
+        candidates = sorted(hits, key=hits.get, reverse=True)[:self.CANDIDATE_LIMIT]
+        matches = []
+        for entry_id in candidates:
+            _, source_text, translated_text = self._entries[entry_id]
+            if source_text == text:
+                continue
+            candidate_shingles = self._shingles(VARIABLE_TOKEN_PATTERN.sub('$', source_text))
+            score = len(shingles & candidate_shingles) / len(shingles | candidate_shingles)
+            if score >= self.threshold:
+                matches.append((score, source_text, translated_text))
+
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return matches[:limit or config.FUZZY_MEMORY_EXAMPLES]
+
+class InFlightCall:
+    """진행 중인 번역 요청 (완료 신호와 결과)"""
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+class SingleFlight:
+    """프로세스 전역 중복 요청 합치기 - 같은 키의 번역이 진행 중이면 새로 요청하지 않고 결과를 기다림"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0  # 다른 요청의 결과를 받아 쓴 횟수
+
+    def begin(self, key):
+        """(진행 중인 요청, 직접 요청해야 하면 True) 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                return call, False
+            call = self._calls[key] = InFlightCall()
+            return call, True
+
+    def finish(self, key, call, result=None):
+        """직접 요청한 번역 완료 - 기다리던 요청에 결과 전달 (None이면 각자 다시 요청)"""
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.result = result
+        call.done.set()
+
+    def in_flight(self):
+        """진행 중인 요청 수"""
+        with self._lock:
+            return len(self._calls)
+
+class BackendLimiter:
+    """프로세스 전역 백엔드별 동시 요청 수 제한 - 여러 작업/파일이 동시에 번역해도 합계가 config.AI_CONCURRENCY를 넘지 않음"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def slots(self, backend):
+        """백엔드의 동시 요청 세마포어 (처음 사용할 때 설정값으로 생성)"""
+        with self._lock:
+            semaphore = self._semaphores.get(backend)
+            if semaphore is None:
+                semaphore = self._semaphores[backend] = threading.BoundedSemaphore(config.AI_CONCURRENCY.get(backend, 1))
+            return semaphore
+
+class TranslationService:
+    """번역 서비스 클래스"""
+
+    def __init__(self, cache=None, memory=None):
+        self.cache = cache if cache is not None else TranslationCache()  # 번역 캐시
+        self.memory = memory if memory is not None else FuzzyTranslationMemory()  # 유사 번역 메모리
+        self.inflight = SingleFlight()  # 동시에 들어온 같은 요청 합치기
+    
+    def translate_shared(self, backend, model, target_language, texts, translate_missing):
+        """같은 (백엔드, 모델, 언어, 텍스트)가 이미 요청 중이면 그 결과를 기다리고 나머지만 translate_missing으로 번역"""
+        results = list(texts)
+        claimed = []
+        waiting = []
+        for index, text in enumerate(texts):
+            if not text.strip():
+                continue
+            key = self.cache.make_key(backend, model, target_language, text)
+            call, leader = self.inflight.begin(key)
+            (claimed if leader else waiting).append((index, key, call))
+
+        # 직접 요청한 항목은 기다리기 전에 먼저 완료 처리 (서로 기다리며 멈추지 않도록)
+        translated = {}
+        try:
+            if claimed:
+                claimed_results = translate_missing([texts[index] for index, _, _ in claimed])
+                for (index, _, _), translated_text in zip(claimed, claimed_results):
+                    if translated_text is not None:
+                        results[index] = translated[index] = translated_text
+        finally:
+            for index, key, call in claimed:
+                self.inflight.finish(key, call, translated.get(index))
+
+        # 공유받은 결과가 없거나 실패(원문 그대로)한 항목은 직접 다시 요청 (대부분 캐시에서 처리)
+        retry = []
+        for index, _, call in waiting:
+            call.done.wait()
+            if call.result is None or call.result == texts[index]:
+                retry.append(index)
+            else:
+                results[index] = call.result
+        if retry:
+            for index, translated_text in zip(retry, translate_missing([texts[index] for index in retry])):
+                if translated_text is not None:
+                    results[index] = translated_text
+
+        return results
+    
+    def reference_examples(self, texts, scope):
+        """유사 번역 메모리에서 찾은 예시를 AI 프롬프트에 붙일 문자열로 반환 (없으면 빈 문자열, scope: (백엔드, 모델, 언어))"""
+        if not config.FUZZY_MEMORY_ENABLED or not len(self.memory):
+            return ""
+
+        examples = {}
+        for text in texts:
+            for _, source_text, translated_text in self.memory.similar(text, scope):
+                examples.setdefault(source_text, translated_text)
+            if len(examples) >= config.FUZZY_MEMORY_MAX_EXAMPLES:
+                break
+        if not examples:
+            return ""
+
+        lines = [
+            f"- {json.dumps(source_text, ensure_ascii=False)} → {json.dumps(translated_text, ensure_ascii=False)}"
+            for source_text, translated_text in list(examples.items())[:config.FUZZY_MEMORY_MAX_EXAMPLES]
+        ]
+        return "\n\nREFERENCE TRANSLATIONS (similar entries translated earlier; keep their terminology and style):\n" + "\n".join(lines)
+    
+    def retry_markup(self, backend, text, translate_strict, strict=False):
+        """마크업 토큰이 손상된 번역 처리 - 엄격한 마스킹으로 한 번 다시 번역, 그래도 손상되면 원문 유지"""
+        if strict:
+            metrics.inc("translator_markup_failures_total", backend=backend)
+            logging.warning(f"마크업 토큰 손상 - 원문 유지: {text[:80]}")
+            return text
+        metrics.inc("translator_markup_retries_total", backend=backend)
+        return translate_strict()
+    
+    def translate_with_google(self, text, target_language, strict=False):
+        """구글 클라우드 번역 API를 사용한 번역 (strict: 모든 마크업 토큰을 플레이스홀더로 보호)"""
+        if not text.strip():
+            return text
+        
+        client = get_google_client()
+        if not client:
+            raise Exception("Google Cloud Translate API가 설정되지 않았습니다.")
+        
+        # 캐시 확인
+        cache_key = self.cache.make_key("google", "default", target_language, text)
+        cached = self.cache.get(cache_key)
+        if cached is not None and has_markup_integrity(text, cached):
+            return cached
+        
+        # 구글 번역의 경우 토큰 보존을 위해 플레이스홀더 처리
+        text_to_translate, placeholders = preserve_tokens(text, strict)
+        
+        try:
+            with metrics.track("google", "single"):
+                result = client.translate(text_to_translate, target_language=target_language)
+            translated_text = result['translatedText']
+            
+            # HTML 엔티티 디코딩 (&quot; → " 등)
+            translated_text = html.unescape(translated_text)
+            
+            # 토큰 복원
+            translated_text = restore_tokens(translated_text, placeholders)
+            
+            # 마크업 토큰이 손상되었으면 엄격한 마스킹으로 한 번만 다시 번역
+            if not has_markup_integrity(text, translated_text):
+                return self.retry_markup("google", text, lambda: self.translate_with_google(text, target_language, True), strict)
+            
+            # 캐시 저장
+            self.cache.set(cache_key, translated_text)
+            return translated_text
+            
+        except Exception as e:
+            logging.error(f"Google 번역 API 오류: {e}")
+            return text
+
+    def translate_batch_with_google(self, texts, target_language, progress_callback=None, result_callback=None):
+        """구글 번역 배치 처리 - 여러 세그먼트를 한 요청으로 묶어 병렬 전송 (결과 순서 유지, 배치마다 result_callback(원문, 번역))"""
+        if not get_google_client():
+            raise Exception("Google Cloud Translate API가 설정되지 않았습니다.")
+
+        results = list(texts)
+        total = len(texts)
+        processed = 0
+
+        # 캐시 확인 후 번역이 필요한 항목만 토큰 보존 처리
+        pending = []
+        for index, text in enumerate(texts):
+            if not text.strip():
+                processed += 1
+                continue
+
+            cached = self.cache.get(self.cache.make_key("google", "default", target_language, text))
+            if cached is not None and has_markup_integrity(text, cached):
+                results[index] = cached
+                processed += 1
+                continue
+
+            text_to_translate, placeholders = preserve_tokens(text)
+            pending.append((index, text_to_translate, placeholders))
+
+        # API 한도(세그먼트 수, 문자 수)에 맞춰 배치 구성
+        batches = []
+        current_batch = []
+        current_chars = 0
+        for item in pending:
+            item_chars = len(item[1])
+            if current_batch and (len(current_batch) >= config.DEFAULT_BATCH_SIZE or
+                                  current_chars + item_chars > config.GOOGLE_BATCH_MAX_CHARS):
+                batches.append(current_batch)
+                current_batch = []
+                current_chars = 0
+            current_batch.append(item)
+            current_chars += item_chars
+        if current_batch:
+            batches.append(current_batch)
+
+        if progress_callback:
+            progress_callback(processed, total, f"배치 0/{len(batches)}")
+
+        # 배치 요청 병렬 전송
+        failed = []
+        markup_failed = []
+        completed_batches = 0
+        with ThreadPoolExecutor(max_workers=config.GOOGLE_BATCH_CONCURRENCY) as executor:
+            futures = {executor.submit(self._send_google_batch, batch, target_language): batch for batch in batches}
+
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    logging.error(f"Google 배치 번역 실패 ({len(batch)}개 항목 개별 재시도): {e}")
+                    batch_results = [None] * len(batch)
+
+                for (index, _, _), translated_text in zip(batch, batch_results):
+                    if translated_text is None:
+                        failed.append(index)
+                    elif not has_markup_integrity(texts[index], translated_text):
+                        # 마크업 토큰이 손상된 항목만 엄격한 마스킹으로 다시 번역 (파일 전체 재실행 불필요)
+                        markup_failed.append(index)
+                    else:
+                        results[index] = translated_text
+                        self.cache.set(self.cache.make_key("google", "default", target_language, texts[index]), translated_text)
+                if result_callback:
+                    result_callback([texts[index] for index, _, _ in batch], [results[index] for index, _, _ in batch])
+
+                completed_batches += 1
+                processed += len(batch)
+                if progress_callback:
+                    progress_callback(processed, total, f"배치 {completed_batches}/{len(batches)}")
+
+        # 실패한 세그먼트만 개별 번역으로 대체
+        for index in failed:
+            results[index] = self.translate_with_google(texts[index], target_language)
+        if markup_failed:
+            logging.warning(f"Google 번역에서 마크업 토큰이 손상된 {len(markup_failed)}개 항목 다시 번역")
+            for index in markup_failed:
+                results[index] = self.retry_markup(
+                    "google", texts[index], lambda: self.translate_with_google(texts[index], target_language, True)
+                )
+
+        return results
+
+    def _send_google_batch(self, batch, target_language):
+        """구글 번역 배치 요청 1회 - 항목별 결과 반환 (실패한 항목은 None)"""
+        with metrics.track("google", "batch"):
+            response = get_google_client().translate([item[1] for item in batch], target_language=target_language)
+        if not isinstance(response, list) or len(response) != len(batch):
+            raise ValueError("배치 응답의 항목 수가 요청과 일치하지 않습니다.")
+
+        batch_results = []
+        for (_, _, placeholders), item in zip(batch, response):
+            translated_text = item.get('translatedText') if isinstance(item, dict) else None
+            if translated_text is None:
+                batch_results.append(None)
+                continue
+
+            # HTML 엔티티 디코딩 후 토큰 복원
+            translated_text = html.unescape(translated_text)
+
+            # 플레이스홀더가 손상된 항목은 실패로 처리
+            if any(placeholder not in translated_text for placeholder in placeholders):
+                batch_results.append(None)
+                continue
+
+            batch_results.append(restore_tokens(translated_text, placeholders))
+
+        return batch_results
+
+    def translate_with_openai(self, text, target_language, api_key, model="gpt-3.5-turbo", compact=False, usage=None, strict=False):
+        """OpenAI API를 사용한 텍스트 번역 (compact: 압축 프롬프트, usage: 작업별 토큰 집계, strict: 모든 마크업 토큰을 플레이스홀더로 보호)"""
+        import openai
+
+        if not text.strip():
+            return text
+        
+        if not api_key:
+            raise ValueError("OpenAI API 키가 필요합니다.")
+        
+        # 캐시 확인
+        cache_key = self.cache.make_key("openai", model, target_language, text)
+        cached = self.cache.get(cache_key)
+        if cached is not None and has_markup_integrity(text, cached):
+            return cached
+        
+        target_lang_name = config.LANGUAGE_NAMES.get(target_language, target_language)
+        
+        # AI 번역을 위한 텍스트 전처리 (strict면 마크업 토큰을 플레이스홀더로 치환)
+        masked_text, placeholders = preserve_tokens(text, True) if strict else (text, {})
+        processed_text = sanitize_text_for_ai(masked_text)
+        references = self.reference_examples([text], ("openai", model, target_language))
+        
+        try:
+            client = client_registry.openai(api_key)
+            
+            with metrics.track("openai", "single"):
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=build_openai_messages(target_lang_name, processed_text, references, compact=compact),
+                    temperature=0.1,  # 더 일관된 번역을 위해 낮춤
+                    max_tokens=1024
+                )
+                metrics.record_openai_usage(response, model)
+            if usage is not None:
+                usage.add(response, model, [text])
+            
+            translated_text = response.choices[0].message.content.strip()
+            
+            # AI 응답 정리 (불필요한 설명 제거, 텍스트 포맷팅/플레이스홀더 복원)
+            translated_text = postprocess_ai_text(translated_text, placeholders)
+            
+            # 마크업 토큰이 손상되었으면 엄격한 마스킹으로 한 번만 다시 번역
+            if not has_markup_integrity(text, translated_text):
+                return self.retry_markup("openai", text, lambda: self.translate_with_openai(
+                    text, target_language, api_key, model, compact, usage, True
+                ), strict)
+            
+            # 캐시 저장
+            self.cache.set(cache_key, translated_text)
+            return translated_text
+            
+        except openai.APIError as e:
+            logging.error(f"OpenAI API 오류: {e}")
+            return text
+        except openai.RateLimitError as e:
+            logging.error(f"OpenAI API 요청 한도 초과: {e}")
+            time.sleep(60)  # 1분 대기 후 원본 텍스트 반환
+            return text
+        except Exception as e:
+            logging.error(f"OpenAI API 번역 중 예상치 못한 오류: {e}")
+            return text
+
+    def translate_pack_with_openai(self, texts, target_language, api_key, model="gpt-3.5-turbo", compact=False, usage=None):
+        """OpenAI 묶음 번역 - 여러 항목을 키가 있는 JSON 객체 하나로 요청 (누락/오류 항목은 개별 재시도)"""
+        import openai
+
+        if not api_key:
+            raise ValueError("OpenAI API 키가 필요합니다.")
+
+        results = list(texts)
+
+        # 캐시에 없는 항목만 "1", "2", ... 키로 묶음
+        pending = {}
+        for index, text in enumerate(texts):
+            if not text.strip():
+                continue
+            cached = self.cache.get(self.cache.make_key("openai", model, target_language, text))
+            if cached is not None and has_markup_integrity(text, cached):
+                results[index] = cached
+            else:
+                pending[str(len(pending) + 1)] = index
+
+        if not pending:
+            return results
+
+        # 항목이 하나뿐이면 묶음 요청이 의미 없으므로 개별 번역
+        if len(pending) == 1:
+            index = next(iter(pending.values()))
+            results[index] = self.translate_with_openai(texts[index], target_language, api_key, model, compact, usage)
+            return results
+
+        target_lang_name = config.LANGUAGE_NAMES.get(target_language, target_language)
+        payload = {item_id: sanitize_text_for_ai(texts[index]) for item_id, index in pending.items()}
+        references = self.reference_examples([texts[index] for index in pending.values()], ("openai", model, target_language))
+        payload_json = json.dumps(payload, ensure_ascii=False)
+
+        translated_items = {}
+        try:
+            client = client_registry.openai(api_key)
+
+            request_options = {}
+            if supports_openai_json_mode(model):
+                request_options["response_format"] = {"type": "json_object"}
+
+            with metrics.track("openai", "pack"):
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=build_openai_messages(target_lang_name, payload_json, references, packed=True, compact=compact),
+                    temperature=0.1,  # 더 일관된 번역을 위해 낮춤
+                    max_tokens=min(config.OPENAI_PACK_MAX_OUTPUT_TOKENS, estimate_tokens(payload_json) * 3 + 256),
+                    **request_options
+                )
+                metrics.record_openai_usage(response, model)
+            if usage is not None:
+                usage.add(response, model, [texts[index] for index in pending.values()])
+
+            translated_items = parse_json_object_response(response.choices[0].message.content)
+
+        except openai.RateLimitError as e:
+            logging.error(f"OpenAI API 요청 한도 초과 (묶음 {len(pending)}개 항목 개별 재시도): {e}")
+            time.sleep(60)  # 1분 대기 후 개별 재시도
+        except openai.APIError as e:
+            logging.error(f"OpenAI API 오류 (묶음 {len(pending)}개 항목 개별 재시도): {e}")
+        except Exception as e:
+            logging.error(f"OpenAI 묶음 응답 처리 실패 ({len(pending)}개 항목 개별 재시도): {e}")
+
+        # 모든 키가 돌아왔는지 확인하고 누락/오류 항목은 개별 재시도, 마크업 토큰이 손상된 항목은 엄격한 마스킹으로 재시도
+        retry_indices = []
+        markup_indices = []
+        returned = []
+        for item_id, index in pending.items():
+            translated_text = translated_items.get(item_id)
+            if not isinstance(translated_text, str) or not translated_text.strip():
+                retry_indices.append(index)
+            else:
+                returned.append((index, translated_text))
+
+        # AI 응답 정리 및 텍스트 포맷팅 복원 (묶음 전체를 한 번에)
+        for (index, _), translated_text in zip(returned, postprocess_ai_texts([text for _, text in returned])):
+            if not has_markup_integrity(texts[index], translated_text):
+                markup_indices.append(index)
+                continue
+
+            self.cache.set(self.cache.make_key("openai", model, target_language, texts[index]), translated_text)
+            results[index] = translated_text
+
+        if retry_indices and translated_items:
+            logging.warning(f"OpenAI 묶음 응답에서 {len(retry_indices)}/{len(pending)}개 항목 누락 또는 오류 - 개별 재시도")
+        if markup_indices:
+            logging.warning(f"OpenAI 묶음 응답에서 마크업 토큰이 손상된 {len(markup_indices)}/{len(pending)}개 항목 다시 번역")
+
+        for index in retry_indices:
+            results[index] = self.translate_with_openai(texts[index], target_language, api_key, model, compact, usage)
+        for index in markup_indices:
+            results[index] = self.retry_markup("openai", texts[index], lambda: self.translate_with_openai(texts[index], target_language, api_key, model, compact, usage, True))
+
+        return results
+
+    def translate_with_ollama(self, text, target_language, endpoint="http://localhost:11434", model="llama3.1:8b", keep_alive=None, num_ctx=None,
+                              strict=False):
+        """Ollama API를 사용한 텍스트 번역 (모델 검증/로드는 작업 시작 시 prepare_ollama_model에서 처리, strict: 모든 마크업 토큰을 플레이스홀더로 보호)"""
+        if not text.strip():
+            return text
+        
+        # 캐시 확인
+        backend = "ollama_chat" if config.OLLAMA_USE_CHAT else "ollama"
+        cache_key = self.cache.make_key(backend, model, target_language, text)
+        cached = self.cache.get(cache_key)
+        if cached is not None and has_markup_integrity(text, cached):
+            return cached
+        
+        target_lang_name = config.LANGUAGE_NAMES.get(target_language, target_language)
+        
+        # AI 번역을 위한 텍스트 전처리 (strict면 마크업 토큰을 플레이스홀더로 치환)
+        masked_text, placeholders = preserve_tokens(text, True) if strict else (text, {})
+        processed_text = sanitize_text_for_ai(masked_text)
+        references = self.reference_examples([text], (backend, model, target_language))
+        
+        client = get_ollama_client(endpoint)
+        options = {
+            "temperature": 0.1,  # 더 일관된 번역을 위해 낮춤
+            "top_p": 0.9,
+            "top_k": 40,
+            "num_ctx": num_ctx or config.OLLAMA_NUM_CTX
+        }
+        
+        try:
+            if config.OLLAMA_USE_CHAT:
+                # /api/chat: 시스템 프롬프트(규칙)와 번역할 텍스트 분리
+                response = client.chat(
+                    model,
+                    [
+                        {"role": "system", "content": f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. Translate the text given by the user into {target_lang_name} accurately and naturally.
+
+{AI_TRANSLATION_RULES}{references}
+
+IMPORTANT: Return ONLY the translated text. No explanations, no "Let me know if you have any other text", no markdown formatting."""},
+                        {"role": "user", "content": processed_text}
+                    ],
+                    options=options,
+                    keep_alive=keep_alive
+                )
+            else:
+                response = client.generate(
+                    model,
+                    f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. Translate the following text into {target_lang_name} accurately and naturally.
+
+{AI_TRANSLATION_RULES}{references}
 
 Text to translate: "{processed_text}"
 
 IMPORTANT: Return ONLY the translated text. No explanations, no "Let me know if you have any other text", no markdown formatting.
 
 Translation:""",
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,  # 더 일관된 번역을 위해 낮춤
-                        "top_p": 0.9,
-                        "top_k": 40
-                    }
-                },
-                timeout=60  # 60초 타임아웃
-            )
+                    options=options,
+                    keep_alive=keep_alive
+                )
             
             if response.status_code == 200:
                 result = response.json()
-                translated_text = result.get('response', '').strip()
+                if config.OLLAMA_USE_CHAT:
+                    translated_text = result.get('message', {}).get('content', '').strip()
+                else:
+                    translated_text = result.get('response', '').strip()
                 
                 # 응답에서 번역된 텍스트만 추출
                 # "Translation:" 다음의 텍스트나 따옴표 안의 텍스트 추출
@@ -510,14 +1788,17 @@ Translation:""",
                 # 따옴표 제거
                 translated_text = translated_text.strip('"\'')
                 
-                # AI 응답 정리 (불필요한 설명 제거)
-                translated_text = clean_ai_response(translated_text)
+                # AI 응답 정리 (불필요한 설명 제거, 텍스트 포맷팅/플레이스홀더 복원)
+                translated_text = postprocess_ai_text(translated_text, placeholders)
                 
-                # 텍스트 포맷팅 복원
-                translated_text = restore_text_formatting(translated_text)
+                # 마크업 토큰이 손상되었으면 엄격한 마스킹으로 한 번만 다시 번역
+                if not has_markup_integrity(text, translated_text):
+                    return self.retry_markup("ollama", text, lambda: self.translate_with_ollama(
+                        text, target_language, endpoint, model, keep_alive, num_ctx, True
+                    ), strict)
                 
                 # 캐시 저장
-                self.cache[cache_key] = translated_text
+                self.cache.set(cache_key, translated_text)
                 return translated_text
             else:
                 error_msg = f"{response.status_code} - {response.text}"
@@ -525,7 +1806,7 @@ Translation:""",
                 
                 # 404 오류(모델 없음)인 경우 더 구체적인 메시지
                 if response.status_code == 404:
-                    available_models = get_available_ollama_models(endpoint)
+                    available_models = client.list_models(refresh=True)
                     if available_models:
                         logging.error(f"사용 가능한 모델: {', '.join(available_models)}")
                     else:
@@ -540,954 +1821,1433 @@ Translation:""",
             logging.error(f"Ollama API 번역 중 예상치 못한 오류: {e}")
             return text
 
-# 번역 서비스 인스턴스
-translation_service = TranslationService()
+    def translate_pack_with_ollama(self, texts, target_language, endpoint="http://localhost:11434", model="llama3.1:8b", keep_alive=None, num_ctx=None):
+        """Ollama 묶음 번역 - /api/chat 한 번에 여러 항목을 JSON 객체로 요청 (누락/오류 항목은 개별 재시도)"""
+        results = list(texts)
 
-def translate_paradox_file(file_path, target_language, translation_api="google", api_settings=None, progress_callback=None):
-    """파라독스 로컬라이제이션 파일 번역"""
-    try:
-        data = load_paradox_localization_file(file_path)
-        total_items = sum(len(lang_data) for lang_data in data.values())
-        translation_progress = 0
+        # 캐시에 없는 항목만 "1", "2", ... 키로 묶음
+        pending = {}
+        for index, text in enumerate(texts):
+            if not text.strip():
+                continue
+            cached = self.cache.get(self.cache.make_key("ollama_chat", model, target_language, text))
+            if cached is not None and has_markup_integrity(text, cached):
+                results[index] = cached
+            else:
+                pending[str(len(pending) + 1)] = index
 
-        if total_items == 0:
-            raise ValueError("번역할 텍스트가 파일에서 발견되지 않았습니다.")
+        if not pending:
+            return results
 
-        # 번역할 항목 수집
-        tasks = []
-        result = {}
-        
-        for lang_code, lang_data in data.items():
-            result.setdefault(lang_code, {})
-            for key, value in lang_data.items():
-                if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
-                    original_text = value.strip('"')
-                    tasks.append((lang_code, key, original_text))
-                else:
-                    result[lang_code][key] = value
+        translate_single = lambda index, strict=False: self.translate_with_ollama(
+            texts[index], target_language, endpoint, model, keep_alive, num_ctx, strict
+        )
 
-        # 번역 처리
-        if translation_api == "google" and translate_client:
-            # 구글 번역: 배치 처리 (개선된 방식)
-            translated_results = []
-            texts_to_translate = [task[2] for task in tasks if task[2].strip()]
-            
-            # 배치 처리
-            batch_size = config.DEFAULT_BATCH_SIZE
-            for i in range(0, len(texts_to_translate), batch_size):
-                batch_texts = texts_to_translate[i:i+batch_size]
-                batch_results = []
-                
-                for text in batch_texts:
-                    try:
-                        translated_text = translation_service.translate_with_google(text, target_language)
-                        batch_results.append({'translatedText': translated_text})
-                    except Exception as e:
-                        logging.error(f"개별 번역 실패: {e}")
-                        batch_results.append({'translatedText': text})
-                
-                translated_results.extend(batch_results)
-                
-                # 진행률 업데이트
-                processed = min(i + batch_size, len(texts_to_translate))
-                progress_percentage = int((processed / len(tasks)) * 100) if len(tasks) > 0 else 0
-                if progress_callback:
-                    progress_callback(processed, len(tasks), f"배치 {i//batch_size + 1}/{(len(texts_to_translate) + batch_size - 1)//batch_size}")
-
-            # 번역 결과를 각 항목에 적용
-            translation_index = 0
-            for task_index, task in enumerate(tasks):
-                lang_code, key, original_text = task
-                if original_text.strip():
-                    if translation_index < len(translated_results):
-                        translated_text = translated_results[translation_index]['translatedText']
-                        translation_index += 1
-                    else:
-                        translated_text = original_text
-                    result[lang_code][key] = f'"{translated_text}"'
-                else:
-                    result[lang_code][key] = f'"{original_text}"'
-                
-                # 진행률 업데이트 (각 항목별)
-                if progress_callback:
-                    progress_callback(task_index + 1, len(tasks), key)
+        # 항목이 하나뿐이거나 chat API를 쓰지 않으면 개별 번역
+        if len(pending) == 1 or not config.OLLAMA_USE_CHAT:
+            for index in pending.values():
+                results[index] = translate_single(index)
+            return results
 
-        else:
-            # AI 번역 (OpenAI 또는 Ollama): 항목별 개별 처리
-            for task_index, task in enumerate(tasks):
-                lang_code, key, original_text = task
-                
-                # 현재 번역 중인 항목 정보 업데이트
-                if progress_callback:
-                    progress_callback(task_index, len(tasks), key)
-                
-                if original_text.strip():
-                    try:
-                        # API에 따라 번역 함수 선택
-                        if translation_api == "openai":
-                            api_key = api_settings.get("openai_api_key", "") if api_settings else ""
-                            model = api_settings.get("openai_model", "gpt-3.5-turbo") if api_settings else "gpt-3.5-turbo"
-                            translated_text = translation_service.translate_with_openai(original_text, target_language, api_key, model)
-                        elif translation_api == "ollama":
-                            endpoint = api_settings.get("ollama_endpoint", "http://localhost:11434") if api_settings else "http://localhost:11434"
-                            model = api_settings.get("ollama_model", "llama3.1:8b") if api_settings else "llama3.1:8b"
-                            translated_text = translation_service.translate_with_ollama(original_text, target_language, endpoint, model)
-                        else:
-                            # 기본값은 구글 번역
-                            translated_text = translation_service.translate_with_google(original_text, target_language)
-                        
-                        result[lang_code][key] = f'"{translated_text}"'
-                        
-                    except Exception as e:
-                        logging.error(f"번역 실패 - {key}: {e}")
-                        result[lang_code][key] = f'"{original_text}"'
-                else:
-                    result[lang_code][key] = f'"{original_text}"'
-                
-                # AI 번역은 속도 제한을 위해 간격 추가
-                if translation_api in ["openai", "ollama"]:
-                    time.sleep(config.AI_REQUEST_DELAY)
-        
-        return result
-        
-    except Exception as e:
-        logging.error(f"파일 번역 중 오류 발생: {e}")
-        raise
+        target_lang_name = config.LANGUAGE_NAMES.get(target_language, target_language)
+        payload = {item_id: sanitize_text_for_ai(texts[index]) for item_id, index in pending.items()}
+        references = self.reference_examples([texts[index] for index in pending.values()], ("ollama_chat", model, target_language))
+
+        translated_items = {}
+        try:
+            response = get_ollama_client(endpoint).chat(
+                model,
+                [
+                    {"role": "system", "content": f"""You are a professional game localization translator specializing in strategy games, RPGs, and historical simulations. You will receive a JSON object whose values are separate game text entries. Translate every value into {target_lang_name} accurately and naturally.
+
+{AI_TRANSLATION_RULES}{references}
+
+OUTPUT FORMAT:
+- Return ONLY a JSON object with exactly the same keys as the input
+- Each value must be the translation of the input value with the same key
+- Translate each entry independently; never merge, split, drop or add keys
+- No explanations, notes or markdown"""},
+                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
+                ],
+                options={
+                    "temperature": 0.1,  # 더 일관된 번역을 위해 낮춤
+                    "top_p": 0.9,
+                    "top_k": 40,
+                    "num_ctx": num_ctx or config.OLLAMA_NUM_CTX
+                },
+                keep_alive=keep_alive,
+                response_format="json"
+            )
+
+            if response.status_code == 200:
+                translated_items = parse_json_object_response(response.json().get('message', {}).get('content', ''))
+            else:
+                logging.error(f"Ollama 묶음 번역 오류 ({len(pending)}개 항목 개별 재시도): {response.status_code} - {response.text}")
+
+        except requests.RequestException as e:
+            logging.error(f"Ollama API 네트워크 오류 ({len(pending)}개 항목 개별 재시도): {e}")
+        except Exception as e:
+            logging.error(f"Ollama 묶음 응답 처리 실패 ({len(pending)}개 항목 개별 재시도): {e}")
+
+        # 모든 키가 돌아왔는지 확인하고 누락/오류 항목은 개별 재시도, 마크업 토큰이 손상된 항목은 엄격한 마스킹으로 재시도
+        retry_indices = []
+        markup_indices = []
+        returned = []
+        for item_id, index in pending.items():
+            translated_text = translated_items.get(item_id)
+            if not isinstance(translated_text, str) or not translated_text.strip():
+                retry_indices.append(index)
+            else:
+                returned.append((index, translated_text))
+
+        # AI 응답 정리 및 텍스트 포맷팅 복원 (묶음 전체를 한 번에)
+        for (index, _), translated_text in zip(returned, postprocess_ai_texts([text for _, text in returned])):
+            if not has_markup_integrity(texts[index], translated_text):
+                markup_indices.append(index)
+                continue
+
+            self.cache.set(self.cache.make_key("ollama_chat", model, target_language, texts[index]), translated_text)
+            results[index] = translated_text
+
+        if retry_indices and translated_items:
+            logging.warning(f"Ollama 묶음 응답에서 {len(retry_indices)}/{len(pending)}개 항목 누락 또는 오류 - 개별 재시도")
+        if markup_indices:
+            logging.warning(f"Ollama 묶음 응답에서 마크업 토큰이 손상된 {len(markup_indices)}/{len(pending)}개 항목 다시 번역")
+
+        for index in retry_indices:
+            results[index] = translate_single(index)
+        for index in markup_indices:
+            results[index] = self.retry_markup("ollama", texts[index], lambda: translate_single(index, True))
+
+        return results
+
+# 번역 서비스 인스턴스
+translation_service = TranslationService()
+backend_limiter = BackendLimiter()
+
+def get_text_translator(translation_api, target_language, api_settings=None, usage=None):
+    """번역 API 설정에 맞는 단일 텍스트 번역 함수 반환 (usage: OpenAI 토큰 집계)"""
+    api_settings = api_settings or {}
+
+    if translation_api == "openai":
+        api_key = api_settings.get("openai_api_key", "")
+        model = api_settings.get("openai_model", "gpt-3.5-turbo")
+        compact = api_settings.get("openai_compact_prompt", config.OPENAI_COMPACT_PROMPT)
+        return lambda text: translation_service.translate_with_openai(text, target_language, api_key, model, compact, usage)
+
+    if translation_api == "ollama":
+        endpoint = api_settings.get("ollama_endpoint", "http://localhost:11434")
+        model = api_settings.get("ollama_model", "llama3.1:8b")
+        keep_alive = api_settings.get("ollama_keep_alive")
+        num_ctx = api_settings.get("ollama_num_ctx")
+        return lambda text: translation_service.translate_with_ollama(text, target_language, endpoint, model, keep_alive, num_ctx)
+
+    # 기본값은 구글 번역
+    return lambda text: translation_service.translate_with_google(text, target_language)
+
+def get_translator_identity(translation_api, api_settings=None):
+    """캐시/중복 요청 합치기에 쓰는 (백엔드, 모델) 이름"""
+    api_settings = api_settings or {}
+
+    if translation_api == "openai":
+        return "openai", api_settings.get("openai_model", "gpt-3.5-turbo")
+
+    if translation_api == "ollama":
+        backend = "ollama_chat" if config.OLLAMA_USE_CHAT else "ollama"
+        return backend, api_settings.get("ollama_model", "llama3.1:8b")
+
+    return "google", "default"
+
+def get_memory_scope(translation_api, target_language, api_settings=None):
+    """유사 번역 메모리 범위 (백엔드, 모델, 언어) - 번역 캐시 키와 같은 기준이라 다른 백엔드/모델의 번역은 재사용하지 않음"""
+    return get_translator_identity(translation_api, api_settings) + (target_language,)
+
+def resolve_concurrency(translation_api, api_settings=None):
+    """작업별 동시 요청 수 결정 (작업 설정값은 백엔드 전체 상한보다 낮게만 적용, 없으면 백엔드 상한)"""
+    backend_concurrency = config.AI_CONCURRENCY.get(translation_api, 1)
+    requested = (api_settings or {}).get("concurrency")
+
+    try:
+        concurrency = int(requested) if requested else backend_concurrency
+    except (TypeError, ValueError):
+        concurrency = backend_concurrency
 
-def save_paradox_localization(translated_data, original_filename):
-    """번역된 데이터를 파라독스 로컬라이제이션 파일 형식으로 저장"""
-    os.makedirs(config.DOWNLOAD_FOLDER, exist_ok=True)
+    return max(1, min(concurrency, backend_concurrency))
+
+async def _run_translation_engine(items, worker, concurrency, on_complete=None):
+    """동시 실행 수를 제한하며 worker를 실행하는 asyncio 엔진 (결과는 입력 순서)"""
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    results = [None] * len(items)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def run_item(index, item):
+            async with semaphore:
+                try:
+                    results[index] = await loop.run_in_executor(executor, worker, item)
+                except Exception as e:
+                    logging.error(f"번역 작업 실패 (항목 {index}): {e}")
+
+            # 완료 콜백은 이벤트 루프 스레드에서만 호출됨
+            if on_complete:
+                on_complete(index, item, results[index])
+
+        await asyncio.gather(*(run_item(index, item) for index, item in enumerate(items)))
+
+    return results
+
+def run_translation_engine(items, worker, concurrency, on_complete=None):
+    """asyncio 번역 엔진 실행 - 실패한 항목의 결과는 None"""
+    if not items:
+        return []
+    return asyncio.run(_run_translation_engine(items, worker, concurrency, on_complete))
+
+def count_untranslated(texts, translated_texts):
+    """번역에 실패해 원문 그대로 남은 항목 수 (마크업 토큰/숫자/기호만 있는 항목은 원문 그대로가 정상이므로 제외)"""
+    return sum(
+        1 for text, translated_text in zip(texts, translated_texts)
+        if (translated_text is None or translated_text == text)
+        and any(char.isalpha() for char in MARKUP_TOKEN_PATTERN.sub('', text))
+    )
+
+def translate_texts(texts, target_language, translation_api="google", api_settings=None, progress_callback=None, labels=None,
+                    usage=None, result_callback=None):
+    """텍스트 목록 번역 - 백엔드별 배치/동시 처리 후 입력 순서대로 결과 반환
+    (usage: OpenAI 토큰 집계, result_callback: 요청 단위가 끝날 때마다 (원문 목록, 번역 목록)으로 호출)"""
+    api_settings = api_settings or {}
     
-    # 파일명 보안 처리
-    safe_filename = secure_filename(original_filename)
-    output_path = os.path.join(config.DOWNLOAD_FOLDER, safe_filename)
+    # 작업 내 중복 제거: 같은 값은 한 번만 번역하고 결과를 모든 키에 적용
+    first_indices = {}
+    for index, text in enumerate(texts):
+        first_indices.setdefault(text, index)
+    if len(first_indices) < len(texts):
+        logging.info(f"중복 제거: {len(texts)}개 항목 중 고유 값 {len(first_indices)}개만 번역")
+        unique_texts = list(first_indices)
+        unique_labels = [labels[index] for index in first_indices.values()] if labels else None
+        unique_results = translate_texts(unique_texts, target_language, translation_api, api_settings, progress_callback, unique_labels,
+                                         usage, result_callback)
+        translated_by_text = dict(zip(unique_texts, unique_results))
+        return [translated_by_text[text] for text in texts]
     
-    try:
-        with open(output_path, 'w', encoding='utf-8-sig') as file:
-            for lang_code, lang_data in translated_data.items():
-                file.write(f"{lang_code}:\n")
-                for key, value in lang_data.items():
-                    # 값이 따옴표로 둘러싸여 있는지 확인
-                    if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
-                        file.write(f" {key} {value}\n")
-                    else:
-                        # 따옴표가 없으면 추가
-                        file.write(f' {key} "{value}"\n')
-        
-        return output_path
-        
-    except Exception as e:
-        logging.error(f"파일 저장 중 오류: {e}")
-        raise
+    total = len(texts)
 
-# Flask 웹 애플리케이션 설정
-app = Flask(__name__)
-app.config['MAX_CONTENT_LENGTH'] = config.MAX_FILE_SIZE
-
-# 진행률 저장을 위한 전역 변수
-translation_progress = {
-    "current": 0, 
-    "total": 100, 
-    "current_count": 0, 
-    "total_count": 100,
-    "current_item": ""
-}
+    if translation_api == "google" and get_google_client():
+        # 구글 번역: 여러 세그먼트를 한 요청으로 묶어 병렬 전송 (다른 작업에서 번역 중인 값은 결과 공유)
+        translated_texts = translation_service.translate_shared(
+            "google", "default", target_language, texts,
+            lambda missing: translation_service.translate_batch_with_google(missing, target_language, progress_callback, result_callback)
+        )
+        if result_callback:
+            # 캐시/다른 작업에서 받은 결과와 개별 재시도 결과 (이미 기록된 항목은 저널에서 건너뜀)
+            result_callback(texts, translated_texts)
+        if progress_callback:
+            progress_callback(total, total, "번역 완료")
+        return translated_texts
 
-@app.route('/')
-def index():
-    """메인 페이지"""
-    # HTML을 직접 반환 (템플릿 파일 불필요)
-    html_content = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>게임 로컬라이제이션 번역기</title>
-    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-    <style>
-        body { 
-            font-family: 'Malgun Gothic', '맑은 고딕', sans-serif; 
-            margin: 0; 
-            padding: 20px; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        .container { 
-            max-width: 900px; 
-            margin: 0 auto; 
-            background-color: white; 
-            padding: 30px; 
-            border-radius: 15px; 
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }
-        h1 { 
-            color: #333; 
-            text-align: center; 
-            margin-bottom: 10px;
-            font-size: 2.5em;
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        .subtitle {
-            text-align: center;
-            color: #666;
-            margin-bottom: 30px;
-            font-size: 1.1em;
-        }
-        form { margin-bottom: 20px; }
-        label { 
-            display: block; 
-            margin-bottom: 8px; 
-            font-weight: bold;
-            color: #333;
-        }
-        select, input[type="file"], input[type="text"], input[type="password"] { 
-            width: 100%; 
-            padding: 12px; 
-            margin-bottom: 15px; 
-            border: 2px solid #e1e1e1; 
-            border-radius: 8px; 
-            box-sizing: border-box;
-            font-size: 14px;
-            transition: border-color 0.3s ease;
-        }
-        select:focus, input[type="file"]:focus, input[type="text"]:focus, input[type="password"]:focus {
-            border-color: #667eea;
-            outline: none;
-        }
-        input[type="submit"] { 
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            color: white; 
-            padding: 15px 20px; 
-            border: none; 
-            border-radius: 8px; 
-            cursor: pointer; 
-            font-size: 16px; 
-            width: 100%;
-            font-weight: bold;
-            transition: transform 0.2s ease;
-        }
-        input[type="submit"]:hover { 
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.3);
-        }
-        input[type="submit"]:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-            transform: none;
-        }
-        #progress { 
-            margin-top: 20px; 
-            display: none;
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            border: 1px solid #e9ecef;
-        }
-        progress { 
-            width: 100%; 
-            height: 25px;
-            border-radius: 12px;
-        }
-        #percentage { 
-            text-align: center; 
-            font-weight: bold; 
-            margin-top: 10px;
-            font-size: 18px;
-            color: #667eea;
-        }
-        #currentItem {
-            text-align: center;
-            margin-top: 10px;
-            color: #666;
-            font-style: italic;
-            min-height: 20px;
-        }
-        .error-message { 
-            color: #dc3545; 
-            margin-top: 10px; 
-            padding: 15px; 
-            background-color: #f8d7da; 
-            border: 1px solid #f5c6cb;
-            border-radius: 8px; 
-            display: none;
-        }
-        .success-message {
-            color: #155724;
-            margin-top: 10px;
-            padding: 15px;
-            background-color: #d4edda;
-            border: 1px solid #c3e6cb;
-            border-radius: 8px;
-            display: none;
-        }
-        .info-section { 
-            margin-top: 30px; 
-            padding: 20px; 
-            background: linear-gradient(135deg, #e8f4f8 0%, #f0f8e8 100%);
-            border-radius: 10px;
-            border-left: 5px solid #667eea;
-        }
-        .info-section h3 { 
-            margin-top: 0;
-            color: #333;
-        }
-        #downloadLink { 
-            text-align: center; 
-            margin-top: 20px; 
-            font-size: 18px;
-        }
-        .download-item {
-            display: inline-block;
-            margin: 10px;
-            padding: 15px 25px;
-            background: linear-gradient(45deg, #28a745, #20c997);
-            color: white;
-            text-decoration: none;
-            border-radius: 25px;
-            font-weight: bold;
-            transition: all 0.3s ease;
-        }
-        .download-item:hover {
-            transform: scale(1.05);
-            text-decoration: none;
-            color: white;
-        }
-        .translation-settings { 
-            padding: 20px; 
-            background: #f8f9fa;
-            border-radius: 10px; 
-            margin-bottom: 20px;
-            border: 1px solid #e9ecef;
-        }
-        .translation-option { 
-            margin-bottom: 15px;
-            padding: 10px;
-            border-radius: 5px;
-            transition: background-color 0.3s ease;
-        }
-        .translation-option:hover {
-            background-color: #e9ecef;
-        }
-        .translation-option input[type="radio"] {
-            margin-right: 10px;
-            width: auto;
-        }
-        .translation-option label {
-            display: inline;
-            margin-left: 5px;
-            cursor: pointer;
-        }
-        .api-key-input, .ollama-settings { 
-            display: none; 
-            margin-top: 15px;
-            padding: 15px;
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }
-        .status-indicator {
-            display: inline-block;
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        .status-ready { background-color: #28a745; }
-        .status-working { background-color: #ffc107; }
-        .status-error { background-color: #dc3545; }
-        
-        .file-info {
-            background: #e9ecef;
-            padding: 10px;
-            border-radius: 5px;
-            margin-top: 10px;
-            font-size: 14px;
-            color: #495057;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>게임 로컬라이제이션 번역기</h1>
-        <p class="subtitle">파라독스 인터랙티브 게임 등의 로컬라이제이션 파일 (예: l_english.yml)을 다른 언어로 번역합니다.</p>
-        
-        <form id="uploadForm" enctype="multipart/form-data">
-            <label for="file">번역할 파일 선택 (여러 파일 선택 가능):</label>
-            <input type="file" name="file" id="fileInput" accept=".yml" multiple required>
-            <div id="fileInfo" class="file-info" style="display: none;"></div>
-            
-            <div class="translation-settings">
-                <label>번역 API 선택:</label>
-                <div class="translation-option">
-                    <input type="radio" id="googleTranslate" name="translationApi" value="google" checked>
-                    <label for="googleTranslate">
-                        <span class="status-indicator status-ready"></span>
-                        구글 클라우드 번역 (빠름, 기본)
-                    </label>
-                </div>
-                
-                <div class="translation-option">
-                    <input type="radio" id="openaiApi" name="translationApi" value="openai">
-                    <label for="openaiApi">
-                        <span class="status-indicator status-ready"></span>
-                        OpenAI API (ChatGPT/GPT-4) - 고품질
-                    </label>
-                    <div id="openaiSettings" class="api-key-input">
-                        <label for="openaiApiKey">OpenAI API 키:</label>
-                        <input type="password" id="openaiApiKey" name="openaiApiKey" placeholder="sk-...">
-                        <label for="openaiModel">모델 선택:</label>
-                        <select id="openaiModel" name="openaiModel">
-                            <option value="gpt-4o">GPT-4o (최신)</option>
-                            <option value="gpt-4-turbo">GPT-4 Turbo</option>
-                            <option value="gpt-4">GPT-4</option>
-                            <option value="gpt-3.5-turbo" selected>GPT-3.5 Turbo (경제적)</option>
-                        </select>
-                    </div>
-                </div>
-                
-                <div class="translation-option">
-                    <input type="radio" id="ollamaApi" name="translationApi" value="ollama">
-                    <label for="ollamaApi">
-                        <span class="status-indicator status-ready"></span>
-                        Ollama (로컬 AI) - 무료
-                    </label>
-                    <div id="ollamaSettings" class="ollama-settings">
-                        <label for="ollamaEndpoint">Ollama 엔드포인트:</label>
-                        <input type="text" id="ollamaEndpoint" name="ollamaEndpoint" value="http://localhost:11434" placeholder="http://localhost:11434">
-                        <label for="ollamaModel">모델 선택:</label>
-                        <select id="ollamaModel" name="ollamaModel">
-                            <option value="llama3.1:8b">Llama 3.1 8B (추천)</option>
-                            <option value="gemma2:27b">Gemma 2 27B (고품질)</option>
-                            <option value="mistral">Mistral 7B</option>
-                            <option value="llama2">Llama 2 7B</option>
-                        </select>
-                        <button type="button" id="testOllama" style="margin-top: 10px; padding: 8px 15px; background: #6c757d; color: white; border: none; border-radius: 5px; cursor: pointer;">연결 테스트</button>
-                    </div>
-                </div>
-            </div>
-            
-            <label for="language">번역할 언어:</label>
-            <select name="language" id="languageSelect">
-                <option value="ko">한국어 (Korean)</option>
-                <option value="en">영어 (English)</option>
-                <option value="ja">일본어 (Japanese)</option>
-                <option value="zh">중국어 (Chinese)</option>
-                <option value="es">스페인어 (Spanish)</option>
-                <option value="fr">프랑스어 (French)</option>
-                <option value="de">독일어 (German)</option>
-                <option value="ru">러시아어 (Russian)</option>
-                <option value="it">이탈리아어 (Italian)</option>
-                <option value="pt">포르투갈어 (Portuguese)</option>
-                <option value="nl">네덜란드어 (Dutch)</option>
-                <option value="sv">스웨덴어 (Swedish)</option>
-                <option value="no">노르웨이어 (Norwegian)</option>
-                <option value="da">덴마크어 (Danish)</option>
-                <option value="fi">핀란드어 (Finnish)</option>
-            </select>
-            
-            <input type="submit" value="번역 시작" id="submitBtn">
-        </form>
-
-        <div id="progress">
-            <h2>번역 진행률</h2>
-            <progress id="progressBar" value="0" max="100"></progress>
-            <p id="percentage">0%</p>
-            <p id="currentItem"></p>
-            <p id="estimatedTime" style="color: #666; font-size: 14px;"></p>
-        </div>
-        
-        <div id="errorMessage" class="error-message"></div>
-        <div id="successMessage" class="success-message"></div>
-        
-        <div id="downloadLink"></div>
-        
-        <div class="info-section">
-            <h3>🎮 사용 안내</h3>
-            <p><strong>1단계:</strong> 번역할 YML 파일을 선택합니다 (여러 파일 선택 가능).</p>
-            <p><strong>2단계:</strong> 번역 API를 선택합니다.</p>
-            <p><strong>3단계:</strong> 번역할 언어를 선택합니다.</p>
-            <p><strong>4단계:</strong> '번역 시작' 버튼을 클릭하면 파일들이 순차적으로 번역됩니다.</p>
-            <p><strong>5단계:</strong> 번역 완료 후 개별 파일 또는 ZIP 파일로 다운로드할 수 있습니다.</p>
-            
-            <h3>⚙️ API별 특징</h3>
-            <p><strong>구글 클라우드 번역:</strong> 빠른 속도, 환경변수 설정 필요</p>
-            <p><strong>OpenAI API:</strong> 최고 품질, 게임 맥락 이해 우수, API 키 필요</p>
-            <p><strong>Ollama:</strong> 완전 무료, 로컬 처리, 프라이버시 보장</p>
-            
-            <h3>🔧 고급 기능</h3>
-            <p>• AI 번역 시 들여쓰기는 자동으로 줄바꿈(\\n)으로 변환됩니다</p>
-            <p>• 게임 변수 ($VARIABLE$) 는 번역되지 않고 보존됩니다</p>
-            <p>• HTML 엔티티(&quot;, &amp; 등)가 자동으로 정상 문자로 변환됩니다</p>
-            <p>• 약어와 줄임말을 자동으로 풀어서 번역합니다 (예: NATO → 북대서양 조약 기구)</p>
-            <p>• 역사적, 정치적, 군사적 조직명을 해당 언어의 공식 명칭으로 번역합니다</p>
-            <p>• 여러 파일 선택 시 자동으로 ZIP 파일로 묶어서 다운로드 제공</p>
-            <p>• 실시간 진행률 표시 및 예상 완료 시간 제공</p>
-            <p>• 대용량 파일 지원 및 시간 제한 없음</p>
-            <p>• 번역 캐시로 중복 텍스트 처리 최적화</p>
-        </div>
-    </div>
-
-    <script>
-        $(document).ready(function(){
-            let startTime;
-            
-            // 파일 선택 시 정보 표시
-            $('#fileInput').change(function(){
-                const files = this.files;
-                if(files.length > 0) {
-                    let info = `선택된 파일 ${files.length}개:\\n`;
-                    for(let i = 0; i < files.length; i++) {
-                        info += `• ${files[i].name} (${(files[i].size / 1024).toFixed(1)} KB)\\n`;
-                    }
-                    $('#fileInfo').text(info).show();
-                } else {
-                    $('#fileInfo').hide();
-                }
-            });
-            
-            // 라디오 버튼 변경 시 관련 설정 표시/숨김
-            $('input[name="translationApi"]').change(function(){
-                $('.api-key-input, .ollama-settings').hide();
-                
-                if($(this).val() === 'openai') {
-                    $('#openaiSettings').show();
-                } else if($(this).val() === 'ollama') {
-                    $('#ollamaSettings').show();
-                }
-            });
-            
-            // Ollama 연결 테스트
-            $('#testOllama').click(function(){
-                const endpoint = $('#ollamaEndpoint').val();
-                const btn = $(this);
-                btn.text('테스트 중...').prop('disabled', true);
-                
-                $.get('/ollama/models?endpoint=' + encodeURIComponent(endpoint))
-                    .done(function(data) {
-                        if(data.models && data.models.length > 0) {
-                            btn.text('연결 성공!').css('background', '#28a745');
-                            
-                            // 모델 선택 옵션 업데이트
-                            const modelSelect = $('#ollamaModel');
-                            const currentModel = modelSelect.val();
-                            modelSelect.empty();
-                            
-                            data.models.forEach(function(model) {
-                                const option = $('<option></option>')
-                                    .attr('value', model)
-                                    .text(model);
-                                if(model === currentModel) {
-                                    option.attr('selected', true);
-                                }
-                                modelSelect.append(option);
-                            });
-                            
-                            // 현재 모델이 사용 가능한 모델에 없으면 첫 번째 모델 선택
-                            if(!data.models.includes(currentModel)) {
-                                modelSelect.val(data.models[0]);
-                            }
-                            
-                            setTimeout(() => {
-                                btn.text('연결 테스트').css('background', '#6c757d').prop('disabled', false);
-                            }, 2000);
-                        } else {
-                            btn.text('모델 없음').css('background', '#ffc107');
-                            setTimeout(() => {
-                                btn.text('연결 테스트').css('background', '#6c757d').prop('disabled', false);
-                            }, 3000);
-                        }
-                    })
-                    .fail(function() {
-                        btn.text('연결 실패').css('background', '#dc3545');
-                        setTimeout(() => {
-                            btn.text('연결 테스트').css('background', '#6c757d').prop('disabled', false);
-                        }, 2000);
-                    });
-            });
-            
-            // 폼 제출 처리
-            $('#uploadForm').submit(function(event){
-                event.preventDefault();
-                
-                // 기본 검증
-                const files = $('#fileInput')[0].files;
-                if(files.length === 0) {
-                    showError('파일을 선택해주세요.');
-                    return;
-                }
-                
-                const translationApi = $('input[name="translationApi"]:checked').val();
-                if(translationApi === 'openai' && !$('#openaiApiKey').val().trim()) {
-                    showError('OpenAI API 키를 입력해주세요.');
-                    return;
-                }
-                
-                var formData = new FormData(this);
-                
-                // UI 상태 변경
-                $('#submitBtn').prop('disabled', true).val('번역 중...');
-                $('#progress').show();
-                $('#errorMessage, #successMessage').hide();
-                $('#downloadLink').html('');
-                startTime = Date.now();
-                
-                $.ajax({
-                    url: '/upload',
-                    type: 'POST',
-                    data: formData,
-                    contentType: false,
-                    processData: false,
-                    // 시간 초과 제거 - 대용량 파일도 완료될 때까지 기다림
-                    timeout: 0,
-                    success: function(response) {
-                        if(response.error) {
-                            showError('번역 오류: ' + response.error);
-                        } else if(response.download_urls) {
-                            $('#progressBar').val(100);
-                            $('#percentage').text('100% - 번역 완료!');
-                            
-                            // 다운로드 링크 생성
-                            let links = '<h3>✅ 번역 완료!</h3>';
-                            
-                            // ZIP 다운로드 링크 (파일이 2개 이상일 때)
-                            if(response.zip_download_url) {
-                                links += `<div style="margin-bottom: 20px;">`;
-                                links += `<a href="${response.zip_download_url}" class="download-item" style="background: linear-gradient(45deg, #ff6b6b, #ee5a24); font-size: 18px; padding: 20px 30px;">📦 모든 파일 ZIP 다운로드</a>`;
-                                links += `</div>`;
-                                links += `<h4>개별 파일 다운로드:</h4>`;
-                            }
-                            
-                            // 개별 파일 다운로드 링크
-                            response.download_urls.forEach(function(url, index){
-                                const filename = url.split('/').pop();
-                                links += `<a href="${url}" class="download-item">📁 ${filename} 다운로드</a>`;
-                            });
-                            
-                            $('#downloadLink').html(links);
-                            
-                            let successMsg = `총 ${response.download_urls.length}개 파일이 성공적으로 번역되었습니다.`;
-                            if(response.zip_download_url) {
-                                successMsg += ' ZIP 파일로 한번에 다운로드하거나 개별적으로 다운로드할 수 있습니다.';
-                            }
-                            showSuccess(successMsg);
-                        }
-                    },
-                    error: function(xhr, status, error) {
-                        let errorMsg = '서버 오류가 발생했습니다.';
-                        if(xhr.responseJSON && xhr.responseJSON.error) {
-                            errorMsg = xhr.responseJSON.error;
-                        } else if(status === 'error') {
-                            errorMsg = '네트워크 오류가 발생했습니다. 연결을 확인해주세요.';
-                        }
-                        showError(errorMsg);
-                    },
-                    complete: function() {
-                        $('#submitBtn').prop('disabled', false).val('번역 시작');
-                    }
-                });
-                
-                // 진행률 폴링
-                startProgressPolling();
-            });
-            
-            function startProgressPolling() {
-                const progressInterval = setInterval(function() {
-                    $.get('/progress', function(data) {
-                        const percent = Math.max(0, Math.min(100, data.progress || 0)); // 0-100 범위 강제
-                        $('#progressBar').val(percent);
-                        $('#percentage').text(`${Math.round(percent)}% (${data.current_count || 0}/${data.total_count || 0})`);
-                        
-                        // 현재 번역 중인 항목 정보 표시
-                        if(data.current_item) {
-                            $('#currentItem').text(`현재 번역 중: ${data.current_item}`);
-                        }
-                        
-                        // 예상 완료 시간 계산 (진행률이 5% 이상일 때만)
-                        if(percent > 5 && percent < 100 && startTime) {
-                            const elapsed = Date.now() - startTime;
-                            const estimated = (elapsed / percent) * (100 - percent);
-                            const minutes = Math.ceil(estimated / 60000);
-                            const seconds = Math.ceil((estimated % 60000) / 1000);
-                            
-                            if(minutes > 0) {
-                                $('#estimatedTime').text(`예상 완료: 약 ${minutes}분 ${seconds}초 후`);
-                            } else {
-                                $('#estimatedTime').text(`예상 완료: 약 ${seconds}초 후`);
-                            }
-                        } else if(percent >= 100) {
-                            $('#estimatedTime').text('완료!');
-                        }
-                        
-                        if (percent >= 100) {
-                            clearInterval(progressInterval);
-                            setTimeout(function() {
-                                if($('#downloadLink').html() !== '') {
-                                    $('#progress').hide();
-                                }
-                            }, 3000);
-                        }
-                    }).fail(function() {
-                        // 진행률 조회 실패 시 폴링 중단
-                        clearInterval(progressInterval);
-                    });
-                }, 1000);
-            }
-            
-            function showError(message) {
-                $('#errorMessage').text(message).show();
-                $('#progress').hide();
-                $('#successMessage').hide();
-            }
-            
-            function showSuccess(message) {
-                $('#successMessage').text(message).show();
-                $('#errorMessage').hide();
-            }
-        });
-    </script>
-</body>
-</html>"""
-    return html_content
-
-@app.route('/ollama/models')
-def get_ollama_models():
-    """Ollama 사용 가능한 모델 목록 조회 API"""
-    endpoint = request.args.get('endpoint', 'http://localhost:11434')
-    models = get_available_ollama_models(endpoint)
-    return jsonify({"models": models})
-
-@app.route('/health')
-def health_check():
-    """헬스체크 엔드포인트"""
-    services = {
-        "google_translate": translate_client is not None,
-        "timestamp": datetime.now().isoformat(),
-        "status": "healthy"
+    if translation_api == "ollama":
+        # Ollama: 작업 시작 전 모델 확인 및 예열 (항목마다 검증하지 않음)
+        model = prepare_ollama_model(
+            api_settings.get("ollama_endpoint", "http://localhost:11434"),
+            api_settings.get("ollama_model", "llama3.1:8b"),
+            api_settings.get("ollama_keep_alive")
+        )
+        if model is None:
+            return list(texts)
+        api_settings = dict(api_settings, ollama_model=model)
+
+    # AI 번역 (OpenAI 또는 Ollama): 작업 단위를 asyncio 엔진으로 동시 처리
+    if translation_api == "openai" and api_settings.get("openai_packing", config.OPENAI_PACKING):
+        # OpenAI 묶음 요청: 토큰 예산에 맞춰 여러 항목을 한 요청으로
+        api_key = api_settings.get("openai_api_key", "")
+        model = api_settings.get("openai_model", "gpt-3.5-turbo")
+        compact = api_settings.get("openai_compact_prompt", config.OPENAI_COMPACT_PROMPT)
+        units = pack_texts_by_token_budget(texts, config.OPENAI_PACK_TOKEN_BUDGET, config.OPENAI_PACK_MAX_ENTRIES)
+
+        def translate_unit(indices):
+            return translation_service.translate_shared(
+                "openai", model, target_language, [texts[index] for index in indices],
+                lambda missing: translation_service.translate_pack_with_openai(missing, target_language, api_key, model, compact, usage)
+            )
+    elif translation_api == "ollama" and config.OLLAMA_USE_CHAT and api_settings.get("ollama_packing", config.OLLAMA_PACKING):
+        # Ollama 묶음 요청: /api/chat 한 번에 여러 항목을 번역
+        endpoint = api_settings.get("ollama_endpoint", "http://localhost:11434")
+        model = api_settings["ollama_model"]
+        keep_alive = api_settings.get("ollama_keep_alive")
+        num_ctx = api_settings.get("ollama_num_ctx")
+        units = pack_texts_by_token_budget(texts, config.OLLAMA_PACK_TOKEN_BUDGET, config.OLLAMA_PACK_MAX_ENTRIES)
+
+        def translate_unit(indices):
+            return translation_service.translate_shared(
+                "ollama_chat", model, target_language, [texts[index] for index in indices],
+                lambda missing: translation_service.translate_pack_with_ollama(missing, target_language, endpoint, model, keep_alive, num_ctx)
+            )
+    else:
+        translate_text = get_text_translator(translation_api, target_language, api_settings, usage)
+        backend, model = get_translator_identity(translation_api, api_settings)
+        units = [[index] for index in range(total)]
+
+        def translate_unit(indices):
+            return translation_service.translate_shared(
+                backend, model, target_language, [texts[indices[0]]],
+                lambda missing: [translate_text(text) for text in missing]
+            )
+
+    completed_count = 0
+
+    def on_unit_complete(unit_index, indices, unit_results):
+        nonlocal completed_count
+        completed_count += len(indices)
+        if result_callback and unit_results is not None:
+            result_callback([texts[index] for index in indices], unit_results)
+        if progress_callback:
+            label = labels[indices[-1]] if labels else ""
+            progress_callback(completed_count, total, label)
+
+    # 작업별 동시 요청 수 안에서, 다른 작업/파일과 함께 백엔드 전체 상한을 나눠 씀
+    concurrency = resolve_concurrency(translation_api, api_settings)
+    backend_slots = backend_limiter.slots(translation_api)
+
+    def translate_limited_unit(indices):
+        with backend_slots:
+            return translate_unit(indices)
+
+    unit_results = run_translation_engine(units, translate_limited_unit, concurrency, on_unit_complete)
+
+    # 작업 단위 결과를 입력 순서대로 펼침 (실패한 항목은 원문 유지)
+    translated_texts = list(texts)
+    for indices, results in zip(units, unit_results):
+        if results is None:
+            continue
+        for index, translated_text in zip(indices, results):
+            if translated_text is not None:
+                translated_texts[index] = translated_text
+
+    return translated_texts
+
+# 작업 저널 (중단된 작업 이어서 처리)
+class TranslationJournal:
+    """작업별 번역 결과 저널 - 추가 전용 JSON Lines 파일에 일정 개수/시간마다 기록, 다시 열면 기록된 번역을 불러옴"""
+
+    def __init__(self, path, flush_entries=None, flush_interval=None):
+        self.path = path
+        self.flush_entries = config.JOURNAL_FLUSH_ENTRIES if flush_entries is None else flush_entries
+        self.flush_interval = config.JOURNAL_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.entries = {}  # 원문 → 번역 (이전 실행에서 기록된 항목 포함)
+        self.loaded = 0
+        self._pending = []
+        self._file = None
+        self._lock = threading.Lock()
+        self._last_flush = time.time()
+        self._load()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _load(self):
+        """기존 저널 읽기 - 중단 시 마지막 줄이 잘렸으면 그 앞까지만 사용하고 파일을 잘라냄"""
+        if not os.path.exists(self.path):
+            return
+
+        valid_size = 0
+        with open(self.path, 'rb') as file:
+            for raw in file:
+                try:
+                    source_text, translated_text = json.loads(raw)
+                except ValueError:
+                    break
+                if not raw.endswith(b'\n'):
+                    break
+                self.entries[source_text] = translated_text
+                valid_size += len(raw)
+
+        if valid_size < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as file:
+                file.truncate(valid_size)
+        self.loaded = len(self.entries)
+        if self.loaded:
+            logging.info(f"작업 저널에서 {self.loaded}개 항목을 불러왔습니다: {self.path}")
+
+    def get(self, text):
+        """기록된 번역 (없으면 None)"""
+        return self.entries.get(text)
+
+    def record(self, texts, translated_texts):
+        """번역 결과 기록 (실패해 원문 그대로인 항목과 이미 기록된 항목 제외)"""
+        with self._lock:
+            for text, translated_text in zip(texts, translated_texts):
+                if translated_text is None or translated_text == text or text in self.entries:
+                    continue
+                self.entries[text] = translated_text
+                self._pending.append((text, translated_text))
+
+            if len(self._pending) >= self.flush_entries or \
+                    (self._pending and time.time() - self._last_flush >= self.flush_interval):
+                self._flush()
+
+    def _flush(self):
+        """대기 중인 항목을 파일 끝에 추가하고 디스크에 반영 (락 안에서 호출)"""
+        self._last_flush = time.time()
+        if not self._pending:
+            return
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in self._pending))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = []
+
+    def flush(self):
+        """대기 중인 항목 기록"""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """남은 항목을 기록하고 파일 닫기 (저널은 다음 실행을 위해 남김)"""
+        with self._lock:
+            self._flush()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """작업이 끝나 더 이상 필요 없는 저널 삭제"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def get_job_fingerprint(file_paths, target_language, translation_api="google", api_settings=None):
+    """같은 작업을 다시 제출했는지 판별하는 값 (입력 파일 내용, 대상 언어, 백엔드/모델, 프롬프트 버전)"""
+    backend, model = get_translator_identity(translation_api, api_settings)
+    digest = hashlib.sha256('\x1f'.join([backend, model, target_language, config.PROMPT_VERSION]).encode('utf-8'))
+    for file_path in file_paths:
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        digest.update(b'\x1e')
+    return digest.hexdigest()
+
+def get_journal_path(fingerprint):
+    """작업 지문에 해당하는 저널 파일 경로"""
+    return os.path.join(config.JOURNAL_FOLDER, f"{fingerprint}.jsonl")
+
+def open_translation_journal(file_paths, target_language, translation_api="google", api_settings=None):
+    """작업 저널 열기 (이전에 중단된 같은 작업이 있으면 이어서 사용, 비활성화 시 None)"""
+    if not config.JOURNAL_ENABLED:
+        return None
+    fingerprint = get_job_fingerprint(file_paths, target_language, translation_api, api_settings)
+    return TranslationJournal(get_journal_path(fingerprint))
+
+# 증분 번역 (모드 업데이트 시 추가/변경된 항목만 번역)
+def base_localization_key(key):
+    """버전 숫자를 뺀 키 (예: tech_name:0 → tech_name)"""
+    return key.split(':', 1)[0]
+
+def load_localization_values(sources):
+    """여러 로컬라이제이션 파일(경로 또는 바이너리 스트림)에서 키 → 값 매핑 생성 (버전 숫자 제외)"""
+    values = {}
+    for source in sources:
+        for entry in iter_paradox_localization(source):
+            values[entry.key] = entry.value
+    return values
+
+def load_previous_translation(old_source_files, old_translation_files):
+    """이전 원문 파일과 이전 번역 파일로 증분 번역 기준 데이터 생성"""
+    return {
+        "source": load_localization_values(old_source_files),
+        "translation": load_localization_values(old_translation_files)
     }
-    return jsonify(services)
 
-@app.route('/upload', methods=['POST'])
-def upload_file():
-    """파일 업로드 및 번역 처리"""
-    global translation_progress
+def classify_incremental_entry(previous, key, text):
+    """이전 원문/번역과 비교 - ('added' | 'changed' | 'missing' | 'unchanged', 재사용할 번역)"""
+    base_key = base_localization_key(key)
+    old_text = previous["source"].get(base_key)
+
+    if old_text is None:
+        return "added", None
+    if old_text != text:
+        return "changed", None
+
+    translated_text = previous["translation"].get(base_key)
+    if translated_text is None:
+        # 원문은 그대로지만 이전 번역 파일에 없는 항목
+        return "missing", None
+    return "unchanged", translated_text
+
+# 번역 메모리 (기존 번역 파일 재사용)
+def get_localization_language(target_language):
+    """번역 대상 언어 코드의 로컬라이제이션 헤더 (예: ko → l_korean)"""
+    if target_language in config.LOCALIZATION_LANGUAGES:
+        return config.LOCALIZATION_LANGUAGES[target_language]
+    return 'l_' + config.LANGUAGE_NAMES.get(target_language, target_language).lower()
+
+class TranslationMemory:
+    """기존 번역 파일로 만든 번역 메모리 (원문 텍스트 기준 + 키 기준 정확 일치)"""
+
+    def __init__(self, target_language):
+        self.target_language = target_language
+        self.language_header = get_localization_language(target_language)
+        self.language_name = self.language_header[2:]  # 폴더/파일 이름 판별용 (예: korean)
+        self.by_source = {}  # 원문 텍스트 → 번역
+        self.by_key = {}  # 키 → 번역
+        self.sources = {}  # 키 → 원문 텍스트 (키 기준 일치 시 원문 변경 여부 확인용)
+        self.fuzzy = FuzzyTranslationMemory()  # $변수$만 다른 항목 재사용 (이 작업에서만 사용, 전역 메모리에 넣지 않음)
+        self.file_count = 0
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def is_translation_file(self, path, language):
+        """번역 파일 여부 - 언어 헤더 또는 경로(예: localisation/korean/, *_l_korean.yml)로 판별"""
+        if language == self.language_header:
+            return True
+        parts = re.split(r'[\\/_.\-]+', path.lower())
+        return self.language_name in parts
+
+    def add_file(self, path, source, translation=None):
+        """로컬라이제이션 파일 하나 추가 (translation이 None이면 언어 헤더/경로로 원문/번역 판별, 다른 언어 파일은 건너뜀)"""
+        entries = list(iter_paradox_localization(source))
+        if not entries:
+            return 0
+        if translation is None:
+            language = entries[0].language
+            if self.is_translation_file(path, language):
+                translation = True
+            elif language == config.MOD_SOURCE_LANGUAGE:
+                translation = False
+            else:
+                return 0  # 원문도 대상 언어도 아닌 파일 (예: l_french)은 원문을 덮어쓰지 않도록 제외
+
+        target = self.by_key if translation else self.sources
+        for entry in entries:
+            target[entry.key] = entry.value
+        self.file_count += 1
+        return len(entries)
+
+    def add_archive(self, archive):
+        """ZIP 압축 파일 안의 로컬라이제이션 파일 전부 추가"""
+        with zipfile.ZipFile(archive) as zip_file:
+            for name in zip_file.namelist():
+                _, ext = os.path.splitext(name.lower())
+                if ext not in config.SUPPORTED_EXTENSIONS:
+                    continue
+                with zip_file.open(name) as member:
+                    self.add_file(name, member)
+
+    def build(self):
+        """원문 파일과 번역 파일을 키로 짝지어 원문 텍스트 기준 색인 생성"""
+        for key, translated_text in self.by_key.items():
+            source_text = self.sources.get(key)
+            if source_text is not None and source_text != translated_text:
+                self.by_source.setdefault(source_text, translated_text)
+        if config.FUZZY_MEMORY_ENABLED:
+            self.fuzzy.add_many(self.target_language, self.by_source.items())
+        logging.info(f"번역 메모리: 파일 {self.file_count}개, 번역 {len(self.by_key)}개, 원문 일치 색인 {len(self.by_source)}개")
+        return self
+
+    def lookup(self, key, text):
+        """정확히 일치하는 번역 조회 - 원문 텍스트 우선, 원문이 바뀌지 않은 경우에만 키 기준"""
+        translated_text = self.by_source.get(text)
+        if translated_text is not None:
+            return translated_text
+
+        base_key = base_localization_key(key)
+        translated_text = self.by_key.get(base_key)
+        if translated_text is None:
+            return None
+        source_text = self.sources.get(base_key)
+        if source_text is not None and source_text != text:
+            return None  # 원문이 바뀐 항목은 이전 번역을 쓰지 않음
+        return translated_text
+
+def load_translation_memory(target_language, memory_files):
+    """업로드된 기존 번역 파일/폴더/ZIP으로 번역 메모리 생성 [(경로, 바이너리 스트림)]"""
+    memory = TranslationMemory(target_language)
+    for path, stream in memory_files:
+        if path.lower().endswith('.zip'):
+            memory.add_archive(stream)
+        else:
+            memory.add_file(path, stream)
+    return memory.build()
+
+def get_output_path(output_folder, original_filename):
+    """결과 파일 경로 (original_filename은 하위 폴더 포함 가능, 경로 구성 요소별로 보안 처리)"""
+    safe_parts = [secure_filename(part) for part in original_filename.split('/')]
+    return os.path.join(output_folder, *[part for part in safe_parts if part])
+
+class LocalizationWriter:
+    """원문 파일을 줄 단위 틀로 삼아 번역된 줄을 원문 순서대로 스트리밍 저장 (주석, 빈 줄, 줄 배치, 중복 키 유지)
+    - 번역이 끝난 항목까지 앞에서부터 바로 기록하고, 아직 번역 중인 항목 뒤의 결과만 메모리에 보관
+    - 원문/결과 파일은 기록할 때만 열고 닫음 (읽은 위치를 보관해 이어 읽음, 파일이 많은 모드에서도 열린 파일 수가 늘지 않음)"""
+
+    def __init__(self, source_path, output_path, language_header=None):
+        self.source_path = source_path
+        self.output_path = output_path
+        self.language_header = language_header  # 설정 시 l_* 헤더를 바꿔 씀
+        self.finished = False
+
+        self._lock = threading.Lock()
+        self._position = {"offset": 0, "line_num": 0, "encoding": 'utf-8'}  # 원문에서 다음에 읽을 위치
+        self._held = None  # 번역을 기다리는 항목 줄 (줄 번호, 줄, LocEntry)
+        self._entry_index = 0  # 다음에 기록할 항목 번호
+        self._ready = {}  # 항목 번호 → 번역 (앞 항목이 끝나기를 기다리는 결과)
+        self._line_num = 0  # 기록을 마친 마지막 원문 줄 번호
+        self._written_bytes = 0
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, 'wb'):
+            pass
+        self._write([], bom=True)
+
+    def _write(self, lines, bom=False):
+        """줄 목록을 결과 파일 끝에 한 번에 추가 (부분 다운로드가 읽을 수 있도록 바로 닫음, 락 안에서 호출)"""
+        data = ('\ufeff' if bom else '') + ''.join(line + '\n' for line in lines)
+        if data:
+            encoded = data.encode('utf-8')
+            with open(self.output_path, 'ab') as file:
+                file.write(encoded)
+            self._written_bytes += len(encoded)
+
+    def render_line(self, line):
+        """번역하지 않는 줄 (헤더만 대상 언어로 바꿈)"""
+        if self.language_header and line.lstrip().startswith('l_'):
+            header = LOC_HEADER_PATTERN.match(line)
+            if header:
+                return line[:header.start(1)] + self.language_header + line[header.end(1):]
+        return line
+
+    @staticmethod
+    def render_entry(entry, text):
+        """원문 항목 줄의 값 위치에 번역을 넣음 (따옴표가 깨진 줄은 정상 형식으로 다시 씀)"""
+        line = entry.raw_line
+        start, end = entry.value_span
+        if line[start - 1:start] == '"' and line[end:end + 1] == '"':
+            return line[:start] + text + line[end:]
+        indent = line[:len(line) - len(line.lstrip())] or ' '
+        return f'{indent}{entry.key}:{entry.version} "{text}"'
+
+    def resolve(self, items):
+        """번역 결과 반영 [(항목 번호, 번역)] - 앞 항목이 모두 끝난 줄까지 기록 (이미 기록한 항목은 무시)"""
+        with self._lock:
+            if self.finished:
+                return
+            for index, text in items:
+                if index >= self._entry_index:
+                    self._ready.setdefault(index, text)
+            self._advance()
+
+    def _advance(self):
+        """기록할 수 있는 줄까지 진행 (락 안에서 호출)"""
+        if self._held is not None and self._entry_index not in self._ready:
+            return  # 기다리는 항목이 아직 번역되지 않음 (원문을 읽지 않음)
+
+        output = []
+        decoded = iter_decoded_lines(self.source_path, self._position)
+        lines = iter_localization_lines(decoded)
+        try:
+            while True:
+                if self._held is not None:
+                    line_num, line, entry = self._held
+                else:
+                    item = next(lines, None)
+                    if item is None:
+                        break
+                    line_num, line, entry = item
+
+                if entry is not None:
+                    text = self._ready.pop(self._entry_index, None)
+                    if text is None:
+                        self._held = (line_num, line, entry)
+                        break
+                    output.append(self.render_entry(entry, text))
+                    self._entry_index += 1
+                else:
+                    output.append(self.render_line(line))
+                self._held = None
+                self._line_num = line_num
+        finally:
+            lines.close()
+            decoded.close()
+
+        self._write(output)
+
+    def finish(self):
+        """모든 항목이 기록됐는지 확인하고 완료 표시"""
+        with self._lock:
+            self._advance()
+            if self._held is not None:
+                entry = self._held[2]
+                raise ValueError(f"번역되지 않은 항목이 남았습니다: {entry.key} (라인 {entry.line_num})")
+            self.finished = True
+
+    def write_snapshot(self, output):
+        """지금까지 번역된 줄 + 아직 번역되지 않은 나머지 원문 줄로 만든 완전한 파일을 output(바이너리 스트림)에 기록"""
+        with self._lock:
+            finished, written_bytes, line_num = self.finished, self._written_bytes, self._line_num
+
+        with open(self.output_path, 'rb') as file:
+            remaining = written_bytes
+            while remaining > 0:
+                chunk = file.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                output.write(chunk)
+                remaining -= len(chunk)
+        if finished:
+            return
+
+        lines = []
+        for source_line_num, line in iter_decoded_lines(self.source_path):
+            if source_line_num > line_num:
+                lines.append(self.render_line(line) + '\n')
+                if len(lines) >= 1000:
+                    output.write(''.join(lines).encode('utf-8'))
+                    lines = []
+        output.write(''.join(lines).encode('utf-8'))
+
+def prepare_paradox_translation(writer, target_language, translation_api="google", api_settings=None, previous=None, memory=None):
+    """파일 하나의 번역할 항목 수집 - (번역할 항목 [(항목 번호, 키, 원문)], 항목 수 집계)
+    (증분 번역/번역 메모리/유사 번역 메모리로 채울 수 있는 항목은 바로 writer에 넘김)"""
+    tasks = []
+    resolved = []
+    counts = {"entries": 0, "translated": 0}
+    parsing_errors = []
+    memory_scope = get_memory_scope(translation_api, target_language, api_settings)
     
-    try:
-        # 파일 검증
-        files = request.files.getlist('file')
-        if not files or len(files) == 0:
-            return jsonify({"error": "파일이 선택되지 않았습니다."}), 400
-        
-        # 각 파일 유효성 검사
-        for file in files:
-            validate_file(file)
-        
-        target_language = request.form.get('language')
-        if not target_language:
-            return jsonify({"error": "번역할 언어를 선택해주세요."}), 400
+    for index, entry in enumerate(iter_paradox_localization(writer.source_path, parsing_errors)):
+        # 재사용 항목은 모아서 넘김 (앞 항목이 끝났으면 바로 기록되어 메모리에 쌓이지 않음, 재사용 경로의 continue보다 먼저 확인)
+        if len(resolved) >= 1000:
+            writer.resolve(resolved)
+            resolved = []
         
-        translation_api = request.form.get('translationApi', 'google')
+        key = f"{entry.key}:{entry.version}"
+        original_text = entry.value
+        counts["entries"] += 1
         
-        # API 설정 정보 수집 및 검증
-        api_settings = {}
-        if translation_api == "openai":
-            api_key = request.form.get('openaiApiKey', '').strip()
-            if not api_key:
-                return jsonify({"error": "OpenAI API 키가 필요합니다."}), 400
-            api_settings = {
-                "openai_api_key": api_key,
-                "openai_model": request.form.get('openaiModel', 'gpt-3.5-turbo')
-            }
-        elif translation_api == "ollama":
-            api_settings = {
-                "ollama_endpoint": request.form.get('ollamaEndpoint', 'http://localhost:11434'),
-                "ollama_model": request.form.get('ollamaModel', 'llama3.1:8b')
-            }
-            
-            # Ollama 연결 및 모델 확인
-            endpoint = api_settings["ollama_endpoint"]
-            model = api_settings["ollama_model"]
-            is_valid, message = validate_ollama_model(endpoint, model)
-            if not is_valid:
-                available_models = get_available_ollama_models(endpoint)
-                if available_models:
-                    return jsonify({
-                        "error": f"모델 '{model}'을 찾을 수 없습니다. 사용 가능한 모델을 선택해주세요: {', '.join(available_models)}"
-                    }), 400
-                else:
-                    return jsonify({
-                        "error": "Ollama 서버에 연결할 수 없거나 설치된 모델이 없습니다. 'ollama pull <model>' 명령으로 모델을 설치해주세요."
-                    }), 400
-        elif translation_api == "google" and not translate_client:
-            return jsonify({"error": "Google Cloud Translate API가 설정되지 않았습니다."}), 500
-        
-        download_urls = []
-        translated_files = []  # 번역된 파일 경로 저장
+        # 증분 번역: 원문이 바뀌지 않은 항목은 이전 번역 재사용
+        if previous:
+            status, previous_text = classify_incremental_entry(previous, key, original_text)
+            counts[status] = counts.get(status, 0) + 1
+            if previous_text is not None:
+                resolved.append((index, previous_text))
+                continue
         
-        # 업로드 폴더 생성
-        os.makedirs(config.UPLOAD_FOLDER, exist_ok=True)
+        # 번역 메모리: 기존 번역 파일과 정확히 일치하는 항목은 API 호출 없이 채움
+        if memory:
+            memory_text = memory.lookup(key, original_text)
+            if memory_text is not None:
+                resolved.append((index, memory_text))
+                counts["memory"] = counts.get("memory", 0) + 1
+                continue
         
-        # 파일마다 개별적으로 번역 처리
-        for file_index, file in enumerate(files):
-            if file.filename == '':
+        # 유사 번역 메모리: $변수$만 다른 이전 번역은 변수만 바꿔 재사용 (작업 번역 메모리, 같은 백엔드/모델의 이전 번역 순)
+        if config.FUZZY_MEMORY_ENABLED:
+            reused_text = memory.fuzzy.reuse(original_text, target_language) if memory else None
+            if reused_text is None:
+                reused_text = translation_service.memory.reuse(original_text, memory_scope)
+            if reused_text is not None:
+                resolved.append((index, reused_text))
+                counts["fuzzy"] = counts.get("fuzzy", 0) + 1
                 continue
-            
-            # 안전한 파일명 생성
-            safe_filename = secure_filename(file.filename)
-            file_path = os.path.join(config.UPLOAD_FOLDER, f"{int(time.time())}_{safe_filename}")
-            file.save(file_path)
-            
-            # 진행률 초기화
-            translation_progress = {
-                "current": 0, 
-                "total": 100, 
-                "current_count": 0, 
-                "total_count": 100, 
-                "current_item": f"파일 {file_index + 1}/{len(files)}: {file.filename}"
-            }
+        
+        tasks.append((index, key, original_text))
+    writer.resolve(resolved)
+    
+    if counts["entries"] == 0:
+        raise ValueError("번역할 텍스트가 파일에서 발견되지 않았습니다.")
+    if parsing_errors:
+        logging.warning(f"파일 '{writer.source_path}' 파싱 중 {len(parsing_errors)}개 오류 발견:")
+        for error in parsing_errors[:5]:  # 최대 5개만 로깅
+            logging.warning(f"  {error}")
+        if len(parsing_errors) > 5:
+            logging.warning(f"  ... 그 외 {len(parsing_errors) - 5}개 오류")
+    
+    counts["translated"] = len(tasks)
+    for source in ("memory", "unchanged", "fuzzy"):
+        if counts.get(source):
+            metrics.inc("translator_entries_total", counts[source], source="previous" if source == "unchanged" else source,
+                        backend=translation_api)
+    file_name = os.path.basename(writer.source_path)
+    if memory:
+        logging.info(f"[{file_name}] 번역 메모리: {counts.get('memory', 0)}개 항목 재사용")
+    if previous:
+        logging.info(f"[{file_name}] 증분 번역: 전체 {counts['entries']}개 중 {len(tasks)}개 번역, "
+                     f"{counts.get('unchanged', 0)}개 이전 번역 재사용")
+    return tasks, counts
+
+def translate_paradox_files(file_paths, output_paths, target_language, translation_api="google", api_settings=None,
+                            progress_callback=None, previous=None, stats=None, memory=None, usage=None, journal=None,
+                            language_header=None, writers=None):
+    """여러 파일을 번역 작업 하나로 처리 - 파일 읽기는 병렬, 모든 파일의 항목을 모아 한 번에 번역 (파일 간 중복 제거,
+    파일 경계에서 백엔드 요청이 끊기지 않음, journal이 있으면 기록된 항목은 건너뛰고 결과를 기록).
+    결과는 원문 줄 구조를 유지해 output_paths에 번역이 끝나는 대로 스트리밍 저장 (writers: 부분 다운로드용 writer 목록을 받을 리스트)"""
+    file_writers = []
+    for file_path, output_path in zip(file_paths, output_paths):
+        file_writers.append(LocalizationWriter(file_path, output_path, language_header))
+    if writers is not None:
+        writers.extend(file_writers)
+
+    workers = max(1, min(config.MOD_FILE_WORKERS, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="localization-load") as executor:
+        prepared = list(executor.map(
+            lambda writer: prepare_paradox_translation(writer, target_language, translation_api, api_settings, previous, memory),
+            file_writers
+        ))
+
+    tasks = [(writer, index, key, original_text)
+             for writer, (file_tasks, _) in zip(file_writers, prepared)
+             for index, key, original_text in file_tasks]
+
+    # 작업 저널: 이전 실행에서 번역된 항목은 백엔드 호출 없이 채움
+    resumed = 0
+    if journal is not None and len(journal):
+        remaining = []
+        journaled = {}
+        for task in tasks:
+            journaled_text = journal.get(task[3])
+            if journaled_text is None:
+                remaining.append(task)
+            else:
+                journaled.setdefault(task[0], []).append((task[1], journaled_text))
+                resumed += 1
+        for writer, items in journaled.items():
+            writer.resolve(items)
+        tasks = remaining
+        metrics.inc("translator_entries_total", resumed, source="journal", backend=translation_api)
+        logging.info(f"작업 저널: {resumed}개 항목 이어서 처리, 남은 항목 {len(tasks)}개")
+
+    metrics.inc("translator_entries_total", len(tasks), source="backend", backend=translation_api)
+    if stats is not None:
+        for _, counts in prepared:
+            for name, count in counts.items():
+                stats[name] = stats.get(name, 0) + count
+        if resumed:
+            stats["translated"] -= resumed
+            stats["resumed"] = stats.get("resumed", 0) + resumed
+    if len(file_paths) > 1:
+        logging.info(f"파일 {len(file_paths)}개, 번역할 항목 {len(tasks)}개를 작업 하나로 번역")
+
+    # 요청 단위가 끝날 때마다 저널에 기록하고 해당 원문을 쓰는 항목을 각 파일에 넘김
+    waiting = {}
+    for writer, index, _, original_text in tasks:
+        waiting.setdefault(original_text, []).append((writer, index))
+    waiting_lock = threading.Lock()
+
+    def on_result(texts, translated_texts):
+        if journal is not None:
+            journal.record(texts, translated_texts)
+        completed = {}
+        with waiting_lock:
+            for text, translated_text in zip(texts, translated_texts):
+                if translated_text is None or translated_text == text:
+                    continue  # 실패했을 수 있는 항목은 최종 결과로 처리
+                for writer, index in waiting.pop(text, ()):
+                    completed.setdefault(writer, []).append((index, translated_text))
+        for writer, items in completed.items():
+            writer.resolve(items)
+
+    # 번역 처리
+    translated_texts = translate_texts(
+        [task[3] for task in tasks],
+        target_language,
+        translation_api,
+        api_settings,
+        progress_callback,
+        labels=[task[2] for task in tasks],
+        usage=usage,
+        result_callback=on_result
+    )
+    if journal is not None:
+        journal.flush()
+
+    # 번역에 실패해 원문 그대로 남은 항목 집계 (백엔드는 오류 시 원문을 돌려줌)
+    untranslated = count_untranslated([task[3] for task in tasks], translated_texts)
+    if untranslated:
+        logging.warning(f"번역 실패: {len(tasks)}개 항목 중 {untranslated}개는 원문 그대로 저장")
+        metrics.inc("translator_entries_total", untranslated, source="untranslated", backend=translation_api)
+    if stats is not None:
+        stats["untranslated"] = stats.get("untranslated", 0) + untranslated
+    
+    # 남은 항목(실패해 원문 유지 등)을 반영하고 파일 마무리
+    remaining = {}
+    for (writer, index, _, _), translated_text in zip(tasks, translated_texts):
+        remaining.setdefault(writer, []).append((index, translated_text))
+    for writer in file_writers:
+        writer.resolve(remaining.get(writer, []))
+        writer.finish()
+    
+    # 다음 번역에서 예시/재사용할 수 있도록 유사 번역 메모리에 추가 (실패해 원문 그대로인 항목 제외)
+    if config.FUZZY_MEMORY_ENABLED:
+        translation_service.memory.add_many(get_memory_scope(translation_api, target_language, api_settings),
+                                            zip([task[3] for task in tasks], translated_texts))
+    
+    return list(output_paths)
+
+def translate_paradox_file(file_path, output_path, target_language, translation_api="google", api_settings=None,
+                           progress_callback=None, previous=None, stats=None, memory=None, usage=None, journal=None,
+                           writers=None):
+    """파라독스 로컬라이제이션 파일 번역 후 output_path에 스트리밍 저장 (previous가 있으면 변경된 항목만 번역,
+    memory가 있으면 일치 항목 재사용, journal이 있으면 중단된 번역을 이어서 처리, stats에 항목 수 집계)"""
+    try:
+        return translate_paradox_files([file_path], [output_path], target_language, translation_api, api_settings,
+                                       progress_callback, previous, stats, memory, usage, journal, writers=writers)[0]
+    except Exception as e:
+        logging.error(f"파일 번역 중 오류 발생: {e}")
+        raise
+
+# 모드 전체 번역 (localisation 폴더 구조 유지)
+def read_localization_language(file_path):
+    """파일(경로 또는 바이너리 스트림)의 첫 항목 언어 헤더 (예: l_english, 항목이 없으면 None)"""
+    entries = iter_paradox_localization(file_path)
+    try:
+        return next(entries).language
+    except StopIteration:
+        return None
+    finally:
+        entries.close()
+
+def get_mod_output_path(relative_path, target_language):
+    """모드 안 원문 파일 경로를 대상 언어 경로로 변환
+    (예: MyMod/localisation/english/events_l_english.yml → localisation/korean/events_l_korean.yml)"""
+    source_name = config.MOD_SOURCE_LANGUAGE[2:]
+    target_header = get_localization_language(target_language)
+    target_name = target_header[2:]
+
+    parts = [part for part in re.split(r'[\\/]+', relative_path) if part not in ('', '.', '..')]
+    directories, file_name = parts[:-1], parts[-1]
+
+    # localisation 폴더 위(모드 이름 등)는 버리고, 원문 언어 폴더는 대상 언어 폴더로 바꿈
+    lowered = [directory.lower() for directory in directories]
+    root = next((index for index, directory in enumerate(lowered) if directory in ('localisation', 'localization')), None)
+    directories = directories[root + 1:] if root is not None else directories
+    if directories and directories[0].lower() == source_name:
+        directories = directories[1:]
+    directories = ['localisation', target_name] + directories
+
+    # 파일 이름의 언어 표시 (게임은 파일 이름이 _l_<언어>.yml로 끝나야 읽음)
+    renamed = re.sub(f'l_{source_name}', target_header, file_name, flags=re.IGNORECASE)
+    if renamed == file_name:
+        stem, ext = os.path.splitext(file_name)
+        renamed = f"{stem}_{target_header}{ext}"
+    return '/'.join(directories + [renamed])
+
+# 백그라운드 번역 작업 처리
+class JobProgress:
+    """작업별 진행률 (스레드 안전, 값이 바뀌면 대기 중인 SSE 스트림을 깨움)"""
+
+    def __init__(self, file_count):
+        self._condition = threading.Condition()
+        self.version = 0
+
+        self.file_index = 0
+        self.file_count = file_count
+        self.file_name = ""
+        self.current_count = 0
+        self.total_count = 0
+        self.current_item = ""
+
+        # 처리 속도 계산용 (이전 파일까지 완료된 항목 수 포함)
+        self._completed_before_file = 0
+        self._started_at = time.time()
+
+    def _changed(self):
+        """변경 알림 (락 안에서 호출)"""
+        self.version += 1
+        self._condition.notify_all()
+
+    def start_file(self, file_index, file_name):
+        """다음 파일 처리 시작"""
+        with self._condition:
+            self._completed_before_file += self.current_count
+            self.file_index = file_index
+            self.file_name = file_name
+            self.current_count = 0
+            self.total_count = 0
+            self.current_item = file_name
+            self._changed()
+
+    def update(self, processed, total, current_item=""):
+        """번역 진행률 갱신 (progress_callback 형식)"""
+        with self._condition:
+            self.current_count = processed
+            self.total_count = total
+            self.current_item = current_item
+            self._changed()
+
+    def notify(self):
+        """작업 상태 변경 등 진행률 외 변경 알림"""
+        with self._condition:
+            self._changed()
+
+    def _snapshot(self):
+        """현재 진행률 (락 안에서 호출)"""
+        elapsed = max(time.time() - self._started_at, 1e-6)
+        entries_done = self._completed_before_file + self.current_count
+        rate = entries_done / elapsed
+        remaining = max(self.total_count - self.current_count, 0)
+
+        return {
+            "version": self.version,
+            "file_index": self.file_index + 1,
+            "file_count": self.file_count,
+            "file_name": self.file_name,
+            "current_count": self.current_count,
+            "total_count": self.total_count,
+            "progress": int(self.current_count / self.total_count * 100) if self.total_count else 0,
+            "current_item": self.current_item,
+            "entries_per_second": round(rate, 2),
+            "eta_seconds": round(remaining / rate, 1) if rate > 0 else None,
+            "elapsed_seconds": round(elapsed, 1)
+        }
+
+    def snapshot(self):
+        """현재 진행률"""
+        with self._condition:
+            return self._snapshot()
+
+    def wait_for_change(self, version, timeout):
+        """version 이후 변경이 생길 때까지 대기 - 시간 초과 시 None"""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.version != version, timeout):
+                return None
+            return self._snapshot()
+
+class TranslationJob:
+    """번역 작업 (업로드 1회 = 작업 1개)"""
+
+    def __init__(self, files, target_language, translation_api="google", api_settings=None, previous=None, memory=None,
+                 mod=False, memory_files=None):
+        self.id = uuid.uuid4().hex
+        self.files = files  # [(원본 파일명 또는 모드 안 상대 경로, 업로드 저장 경로)]
+        self.target_language = target_language
+        self.translation_api = translation_api
+        self.api_settings = api_settings or {}
+        self.previous = previous  # 증분 번역 기준 (이전 원문/번역)
+        self.memory = memory  # 기존 번역 파일로 만든 번역 메모리
+        self.memory_files = memory_files or []  # 번역 메모리로 색인할 업로드 파일 [(원본 파일명, 업로드 저장 경로)]
+        self.stats = {}  # 항목 수 집계 (전체, 번역, 재사용 등)
+        self.usage = TokenUsage()  # OpenAI 토큰 사용량과 예상 비용
+        self.mod = mod  # 모드 전체 번역 (모든 파일을 한 번에 번역, 대상 언어 폴더 구조로 저장)
+        self.journal = None  # 작업 저널 (실행 시작 시 JobManager가 열어 줌)
+        self.writers = []  # 번역 중인 결과 파일 (부분 다운로드용)
+
+        self.status = "queued"  # queued → running → completed / failed
+        self.error = None
+        self.progress = JobProgress(1 if mod else len(files))
+        self.output_files = []
+
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def output_folder(self):
+        """작업별 결과 폴더 (다른 작업과 파일명 충돌 방지)"""
+        return os.path.join(config.DOWNLOAD_FOLDER, self.id)
+
+    def file_url(self, file_path):
+        """결과 파일 다운로드 URL (모드 번역은 결과 폴더 기준 상대 경로)"""
+        relative_path = os.path.relpath(file_path, self.output_folder).replace(os.sep, '/')
+        return f"/jobs/{self.id}/files/{relative_path}"
+
+    @property
+    def has_archive(self):
+        """결과를 ZIP으로 받는 작업인지 (모드 번역 또는 파일 2개 이상)"""
+        return self.mod or len(self.files) > 1
+
+    @property
+    def archive_name(self):
+        """결과 ZIP 파일명"""
+        return f"translated_{'mod' if self.mod else 'files'}_{int(self.created_at)}.zip"
+
+    def iter_archive_members(self):
+        """완성된 결과 파일을 끝나는 순서대로 반환 [(ZIP 안 경로, 파일 경로)] - 작업이 끝날 때까지 대기, 실패하면 예외"""
+        index = 0
+        version = -1
+        while True:
+            writers = self.writers
+            while index < len(writers) and writers[index].finished:
+                file_path = writers[index].output_path
+                yield os.path.relpath(file_path, self.output_folder).replace(os.sep, '/'), file_path
+                index += 1
+
+            if self.status == "failed":
+                raise RuntimeError(f"번역 작업이 실패했습니다: {self.error}")
+            if self.status == "completed" and index >= len(self.writers):
+                return
+            snapshot = self.progress.wait_for_change(version, config.SSE_KEEPALIVE_INTERVAL)
+            if snapshot is not None:
+                version = snapshot["version"]
+
+    def to_dict(self):
+        """작업 상태 (JSON 응답용)"""
+        def iso(timestamp):
+            return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "files": [filename for filename, _ in self.files],
+            "translation_api": self.translation_api,
+            "target_language": self.target_language,
+            "concurrency": self.api_settings.get("concurrency"),
+            "created_at": iso(self.created_at),
+            "started_at": iso(self.started_at),
+            "finished_at": iso(self.finished_at),
+            "progress": self.progress.snapshot(),
+            "mod": self.mod,
+            "incremental": self.previous is not None,
+            "memory_entries": len(self.memory) if self.memory else 0,
+            "stats": dict(self.stats),
+            "usage": self.usage.to_dict() if self.usage.requests else None,
+            "status_url": f"/jobs/{self.id}",
+            "events_url": f"/jobs/{self.id}/events",
+            "result_url": f"/jobs/{self.id}/result"
+        }
+        if self.error:
+            data["error"] = self.error
+        if self.status == "running" and self.writers:
+            data["partial_url"] = f"/jobs/{self.id}/partial"
+        if self.has_archive and self.status != "failed":
+            # 작업 중에도 받을 수 있음 (파일이 완성되는 대로 ZIP에 추가되어 전송)
+            data["archive_url"] = f"/jobs/{self.id}/archive"
+        if self.status == "completed":
+            data["download_urls"] = [self.file_url(path) for path in self.output_files]
+            if self.has_archive:
+                data["zip_download_url"] = data["archive_url"]
+        return data
+
+class JobManager:
+    """번역 작업 큐 - 워커 풀에서 작업을 처리하고 상태를 보관"""
+
+    def __init__(self, max_workers=None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.JOB_WORKERS,
+            thread_name_prefix="translation-job"
+        )
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._journals = {}  # 작업 지문 → [저널, 사용 중인 작업 수, 완료된 작업 있음]
+        self._journal_lock = threading.Lock()
+
+    def submit(self, job):
+        """작업 등록 후 워커 풀에 전달"""
+        self.cleanup()
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job):
+        """워커 스레드에서 작업 실행"""
+        job.status = "running"
+        job.started_at = time.time()
+        job.progress.notify()
+        fingerprint = None
+        try:
+            fingerprint = self._acquire_journal(job)
+            run_translation_job(job)
+            job.status = "completed"
+        except Exception as e:
+            logging.error(f"번역 작업 {job.id} 실패: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            if fingerprint is not None:
+                self._release_journal(fingerprint, job.status == "completed")
+            job.finished_at = time.time()
+            metrics.inc("translator_jobs_total", status=job.status, backend=job.translation_api)
+            metrics.observe("translator_pipeline_seconds", job.finished_at - job.started_at, stage="job", backend=job.translation_api)
+            # 상태가 확정된 뒤 SSE 스트림에 알림
+            job.progress.notify()
+
+    def _acquire_journal(self, job):
+        """작업 저널 열기 - 같은 입력의 작업이 이미 실행 중이면 그 저널을 함께 사용 (한 파일에 핸들 하나)
+        (반환한 작업 지문으로 _release_journal 호출, 저널 비활성화 시 None)"""
+        if not config.JOURNAL_ENABLED:
+            return None
+        fingerprint = get_job_fingerprint([file_path for _, file_path in job.files], job.target_language,
+                                          job.translation_api, job.api_settings)
+        with self._journal_lock:
+            shared = self._journals.get(fingerprint)
+            if shared is None:
+                shared = self._journals[fingerprint] = [TranslationJournal(get_journal_path(fingerprint)), 0, False]
+            shared[1] += 1
+        job.journal = shared[0]
+        return fingerprint
+
+    def _release_journal(self, fingerprint, completed):
+        """작업 저널 반환 - 마지막 사용 작업이 끝날 때 완료된 작업이 있었으면 삭제, 모두 실패했으면 닫고 남김"""
+        with self._journal_lock:
+            shared = self._journals[fingerprint]
+            shared[1] -= 1
+            shared[2] = shared[2] or completed
+            if shared[1]:
+                shared[0].flush()
+                return
+            del self._journals[fingerprint]
+        if shared[2]:
+            shared[0].remove()
+        else:
+            shared[0].close()
+
+    def cleanup(self):
+        """보관 기간이 지난 완료/실패 작업과 결과 파일 삭제"""
+        now = time.time()
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job.finished_at and now - job.finished_at > config.JOB_RETENTION
+            ]
+            for job in expired:
+                del self._jobs[job.id]
+
+        for job in expired:
+            shutil.rmtree(job.output_folder, ignore_errors=True)
+
+    def status_counts(self):
+        """상태별 작업 수 (queued, running, completed, failed)"""
+        counts = {"queued": 0, "running": 0, "completed": 0, "failed": 0}
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+    def active_progress(self):
+        """실행 중인 작업의 진행 상황 목록"""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.status == "running"]
+        return [job.progress.snapshot() for job in jobs]
+
+    def shutdown(self):
+        """워커 풀 종료 (대기 중인 작업은 취소)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+def remove_uploaded_files(files):
+    """업로드된 임시 파일 삭제 [(원본 파일명, 업로드 저장 경로)]"""
+    for _, file_path in files:
+        try:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        except Exception as e:
+            logging.warning(f"임시 파일 삭제 실패: {e}")
+
+def load_job_translation_memory(job):
+    """업로드된 번역 메모리 파일을 작업 워커에서 파싱/색인 (업로드 응답을 늦추지 않도록) - 끝나면 업로드 파일 삭제"""
+    try:
+        job.memory = load_translation_memory(job.target_language, job.memory_files)
+    except zipfile.BadZipFile:
+        raise ValueError("번역 메모리 ZIP 파일을 읽을 수 없습니다.")
+    finally:
+        remove_uploaded_files(job.memory_files)
+
+def run_translation_job(job):
+    """작업 워커에서 실행되는 번역 파이프라인 - 같은 작업을 다시 제출하면 작업 저널에 기록된 항목부터 이어서 처리
+    (저널은 JobManager가 열고 닫음 - 같은 입력의 작업이 동시에 실행되면 저널 하나를 함께 사용)"""
+    if job.memory_files and job.memory is None:
+        try:
+            load_job_translation_memory(job)
+        except Exception:
+            remove_uploaded_files(job.files)
+            raise
+    if job.mod:
+        run_mod_translation_job(job)
+    else:
+        run_file_translation_job(job)
+
+def run_file_translation_job(job):
+    """파일별 번역 (결과 파일에 바로 저장, ZIP은 다운로드할 때 생성)"""
+    try:
+        for file_index, (original_filename, file_path) in enumerate(job.files):
+            job.progress.start_file(file_index, original_filename)
             
             def progress_callback(processed, total, current_key=""):
-                global translation_progress
-                if total > 0:
-                    progress_percentage = int((processed / total) * 100)
-                    translation_progress["current"] = progress_percentage
-                    translation_progress["current_count"] = processed
-                    translation_progress["total_count"] = total
-                    translation_progress["current_item"] = f"파일 {file_index + 1}/{len(files)}: {current_key}"
+                job.progress.update(processed, total, current_key)
                 # 로깅 빈도 줄임 (10% 단위로만 로깅)
+                progress_percentage = int((processed / total) * 100) if total > 0 else 0
                 if progress_percentage % 10 == 0 or progress_percentage >= 95:
-                    logging.info(f"[{file.filename}] 번역 진행률: {processed}/{total} ({progress_percentage}%)")
+                    logging.info(f"[{original_filename}] 번역 진행률: {processed}/{total} ({progress_percentage}%)")
             
             try:
-                if safe_filename.lower().endswith(('.yml', '.yaml')):
-                    translated_data = translate_paradox_file(
-                        file_path, 
-                        target_language,
-                        translation_api,
-                        api_settings,
-                        progress_callback
+                with metrics.timer("translator_pipeline_seconds", stage="translate_file", backend=job.translation_api):
+                    output_file_path = translate_paradox_file(
+                        file_path,
+                        get_output_path(job.output_folder, original_filename),
+                        job.target_language,
+                        job.translation_api,
+                        job.api_settings,
+                        progress_callback,
+                        previous=job.previous,
+                        stats=job.stats,
+                        memory=job.memory,
+                        usage=job.usage,
+                        journal=job.journal,
+                        writers=job.writers
                     )
-                    output_file_path = save_paradox_localization(translated_data, safe_filename)
-                    download_url = f"/download/{os.path.basename(output_file_path)}"
-                    download_urls.append(download_url)
-                    translated_files.append(output_file_path)  # 파일 경로 저장
-                else:
-                    logging.error(f"{file.filename}은(는) 지원하지 않는 파일 형식입니다.")
-                    
             except Exception as e:
-                logging.error(f"{file.filename} 번역 처리 중 오류 발생: {e}")
-                return jsonify({"error": f"파일 번역 중 오류: {str(e)}"}), 500
-            finally:
-                # 업로드된 임시 파일 삭제
-                try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                except Exception as e:
-                    logging.warning(f"임시 파일 삭제 실패: {e}")
-        
-        if not download_urls:
-            return jsonify({"error": "번역할 수 있는 파일이 없습니다."}), 400
-        
-        # ZIP 파일 생성 (파일이 2개 이상일 때)
-        zip_download_url = None
-        if len(translated_files) > 1:
-            zip_filename = f"translated_files_{int(time.time())}.zip"
-            zip_path = os.path.join(config.DOWNLOAD_FOLDER, zip_filename)
+                logging.error(f"{original_filename} 번역 처리 중 오류 발생: {e}")
+                raise Exception(f"파일 번역 중 오류: {str(e)}")
             
-            try:
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in translated_files:
-                        if os.path.exists(file_path):
-                            # ZIP 내에서의 파일명 (경로 없이 파일명만)
-                            arcname = os.path.basename(file_path)
-                            zipf.write(file_path, arcname)
-                
-                zip_download_url = f"/download/{zip_filename}"
-                logging.info(f"ZIP 파일 생성 완료: {zip_filename}")
-                
-            except Exception as e:
-                logging.error(f"ZIP 파일 생성 실패: {e}")
+            job.output_files.append(output_file_path)
+    finally:
+        # 업로드된 임시 파일 삭제
+        remove_uploaded_files(job.files)
+    
+    if not job.output_files:
+        raise ValueError("번역할 수 있는 파일이 없습니다.")
+
+def run_mod_translation_job(job):
+    """모드 전체 번역 파이프라인 (원문 언어 파일 선택 → 모든 파일을 한 번에 번역하며 대상 언어 폴더 구조로 저장)
+    (폴더 구조를 유지한 ZIP은 다운로드할 때 생성, 모드 폴더에 그대로 풀어 사용)"""
+    try:
+        source_files = []
+        for relative_path, file_path in job.files:
+            language = read_localization_language(file_path)
+            if language == config.MOD_SOURCE_LANGUAGE:
+                source_files.append((relative_path, file_path))
+            else:
+                logging.info(f"[{relative_path}] 원문 언어({config.MOD_SOURCE_LANGUAGE}) 파일이 아니므로 건너뜀: {language}")
         
-        # 최종 완료 상태 설정
-        translation_progress["current"] = 100
-        translation_progress["current_item"] = "번역 완료"
+        if not source_files:
+            raise ValueError(f"번역할 {config.MOD_SOURCE_LANGUAGE} 파일이 없습니다.")
         
-        response_data = {"download_urls": download_urls}
-        if zip_download_url:
-            response_data["zip_download_url"] = zip_download_url
+        job.progress.start_file(0, f"모드 전체 ({len(source_files)}개 파일)")
         
-        return jsonify(response_data)
+        def progress_callback(processed, total, current_key=""):
+            job.progress.update(processed, total, current_key)
         
-    except Exception as e:
-        logging.error(f"업로드 처리 중 예상치 못한 오류: {e}")
-        return jsonify({"error": f"서버 오류가 발생했습니다: {str(e)}"}), 500
-
-@app.route('/progress')
-def get_progress():
-    """번역 진행률 조회"""
-    global translation_progress
-    
-    # 진행률이 유효한 범위(0-100)에 있는지 확인
-    current_progress = max(0, min(100, translation_progress.get("current", 0)))
+        with metrics.timer("translator_pipeline_seconds", stage="translate_file", backend=job.translation_api):
+            job.output_files = translate_paradox_files(
+                [file_path for _, file_path in source_files],
+                [get_output_path(job.output_folder, get_mod_output_path(relative_path, job.target_language))
+                 for relative_path, _ in source_files],
+                job.target_language,
+                job.translation_api,
+                job.api_settings,
+                progress_callback,
+                previous=job.previous,
+                stats=job.stats,
+                memory=job.memory,
+                usage=job.usage,
+                journal=job.journal,
+                language_header=get_localization_language(job.target_language),
+                writers=job.writers
+            )
+    finally:
+        # 업로드된 임시 파일 삭제
+        remove_uploaded_files(job.files)
     
-    return jsonify({
-        "progress": current_progress,
-        "current_count": translation_progress.get("current_count", 0),
-        "total_count": translation_progress.get("total_count", 0),
-        "current_item": translation_progress.get("current_item", "")
-    })
-
-@app.route('/download/<filename>')
-def download_file(filename):
-    """번역된 파일 다운로드"""
-    try:
-        safe_filename = secure_filename(filename)
-        output_path = os.path.join(config.DOWNLOAD_FOLDER, safe_filename)
-        
-        if not os.path.exists(output_path):
-            return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
+def extract_localization_archive(archive, folder, language=None):
+    """ZIP 안의 로컬라이제이션 파일을 병렬로 꺼내 폴더에 저장 - [(ZIP 안 경로, 저장 경로)]
+    (language가 있으면 첫 항목이 그 언어인 파일만 저장 - 모드 ZIP의 다른 언어 파일은 디스크에 쓰지 않음,
+    도중에 실패하면 이미 저장한 파일은 삭제)"""
+    written = []
+    with zipfile.ZipFile(archive) as zip_file:
+        members = [info for info in zip_file.infolist()
+                   if not info.is_dir() and os.path.splitext(info.filename.lower())[1] in config.SUPPORTED_EXTENSIONS]
+        for info in members:
+            if info.file_size > config.MAX_FILE_SIZE:
+                raise ValueError(f"ZIP 안 파일 크기가 너무 큽니다: {info.filename} "
+                                 f"(최대 크기: {config.MAX_FILE_SIZE // (1024*1024)}MB)")
         
-        return send_file(output_path, as_attachment=True, download_name=safe_filename)
+        def extract(info):
+            if language:
+                with zip_file.open(info) as member:
+                    member_language = read_localization_language(member)
+                if member_language != language:
+                    return None
+            file_path = os.path.join(folder, f"{uuid.uuid4().hex}_{secure_filename(os.path.basename(info.filename))}")
+            written.append((info.filename, file_path))
+            with zip_file.open(info) as member, open(file_path, 'wb') as output:
+                shutil.copyfileobj(member, output, 1024 * 1024)
+            return info.filename, file_path
         
-    except Exception as e:
-        logging.error(f"파일 다운로드 중 오류: {e}")
-        return jsonify({"error": "파일 다운로드 중 오류가 발생했습니다."}), 500
+        # 압축 해제(zlib)는 GIL을 놓으므로 파일별로 병렬 처리 (ZipFile은 항목별 읽기 위치를 따로 관리)
+        workers = max(1, min(config.MOD_FILE_WORKERS, len(members)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="localization-extract") as executor:
+                extracted = [item for item in executor.map(extract, members) if item is not None]
+        except BaseException:
+            remove_uploaded_files(written)
+            raise
+    
+    if language:
+        logging.info(f"ZIP에서 {language} 파일 {len(extracted)}개 추출 (로컬라이제이션 파일 {len(members)}개 중)")
+    return extracted
+
+class ZipStreamBuffer(io.RawIOBase):
+    """ZipFile이 쓰는 내용을 모아 두었다가 조각으로 꺼내는 쓰기 전용 스트림 (탐색 불가 - ZIP은 데이터 설명자로 기록)"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        return len(data)
+
+    def __len__(self):
+        return self._size
+
+    def pop(self):
+        """모인 내용을 꺼내고 비움"""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self._size = 0
+        return data
+
+def iter_zip_stream(members, compression=None, compress_level=None, chunk_size=256 * 1024):
+    """[(ZIP 안 경로, 파일 경로)]로 ZIP을 만들며 조각 단위로 반환 (디스크에 ZIP을 만들지 않고 바로 응답으로 전송,
+    members는 파일이 완성되는 대로 내보내는 제너레이터여도 됨)"""
+    compression = config.ZIP_COMPRESSION if compression is None else compression
+    compress_level = config.ZIP_COMPRESS_LEVEL if compress_level is None else compress_level
+    if compression == zipfile.ZIP_STORED:
+        compress_level = None
+
+    buffer = ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression, compresslevel=compress_level) as zip_file:
+        for arcname, file_path in members:
+            with open(file_path, 'rb') as source, zip_file.open(arcname, 'w') as member:
+                for data in iter(lambda: source.read(chunk_size), b''):
+                    member.write(data)
+                    if len(buffer) >= chunk_size:
+                        yield buffer.pop()
+            yield buffer.pop()
+    yield buffer.pop()
 
-# 임시 파일 정리 등록
+# 번역 작업 큐
+job_manager = JobManager()
+
+# 임시 파일 정리 및 캐시 종료 등록
+atexit.register(job_manager.shutdown)
 atexit.register(clean_temporary_files)
+atexit.register(translation_service.cache.close)
+
+def __getattr__(name):
+    """웹 앱(app)은 처음 참조할 때 불러옴 (명령줄 실행은 Flask를 불러오지 않음)"""
+    if name == "app":
+        from translator_web import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
-    # 필요한 디렉토리 생성
-    for folder in [config.UPLOAD_FOLDER, config.DOWNLOAD_FOLDER]:
-        if not os.path.exists(folder):
-            os.makedirs(folder)
-    
-    # 로깅 설정 (성능 최적화)
-    log_handlers = [logging.StreamHandler()]
-    
-    # 파일 로깅은 ERROR 레벨 이상만 (성능 향상)
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-    
-    file_handler = logging.FileHandler('logs/translator_errors.log')
-    file_handler.setLevel(logging.ERROR)
-    log_handlers.append(file_handler)
-    
-    logging.basicConfig(
-        level=config.LOG_LEVEL,  # WARNING 레벨로 설정
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=log_handlers
-    )
-    
-    logging.warning("게임 로컬라이제이션 번역기 시작 (백그라운드 최적화 모드)")
-    
-    # Flask 앱 실행 (백그라운드 최적화)
-    app.run(
-        host='0.0.0.0', 
-        port=5000, 
-        debug=False,  # 디버그 모드 비활성화
-        threaded=True,  # 멀티 스레드 활성화
-        use_reloader=False  # 자동 재시작 비활성화
-    )
+    # 웹 서버 실행 (translator_web이 이 파일을 모듈로 다시 불러오지 않도록 같은 모듈로 등록)
+    sys.modules.setdefault("improved_translator_python", sys.modules[__name__])
+    from translator_web import main
+    main()
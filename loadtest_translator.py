@@ -0,0 +1,259 @@
+# 번역기 부하 테스트 스크립트 (모의 백엔드로 비용 없이 처리량 측정)
+# 사용법: python loadtest_translator.py --spawn --api google --jobs 20 --concurrency 4 --entries 500
+#         python loadtest_translator.py --url http://127.0.0.1:5000 --server-pid 1234 --api openai
+# --spawn: 모의 백엔드(mock_translation_backends.py)와 번역기를 임시 폴더에서 실행 후 측정
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmark_translator import generate_corpus
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def build_localization_file(entries, seed):
+    """업로드할 HOI4 형식 로컬라이제이션 파일 내용 생성"""
+    lines = ["l_english:"]
+    for index, text in enumerate(generate_corpus(entries, seed)):
+        lines.append(f' load_key_{index}:0 "{text}"')
+    return ("\ufeff" + "\n".join(lines) + "\n").encode('utf-8')
+
+def percentile(values, ratio):
+    """정렬된 값 목록의 백분위수"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+def read_rss_mb(pid):
+    """프로세스 메모리 사용량 (MB, Linux /proc 기준 - 읽을 수 없으면 None)"""
+    try:
+        with open(f"/proc/{pid}/status", 'r') as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+class MemorySampler(threading.Thread):
+    """서버 프로세스 메모리를 주기적으로 측정해 최대값 기록"""
+
+    def __init__(self, pid, interval=0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak_mb = None
+        self.last_mb = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            rss = read_rss_mb(self.pid)
+            if rss is not None:
+                self.last_mb = rss
+                self.peak_mb = rss if self.peak_mb is None else max(self.peak_mb, rss)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+def wait_until_ready(url, timeout=30):
+    """서버가 응답할 때까지 대기"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(url, timeout=2).status_code < 500:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    return False
+
+def spawn_servers(args, work_dir):
+    """모의 백엔드와 번역기를 하위 프로세스로 실행 - (프로세스 목록, 번역기 주소, 모의 백엔드 주소)"""
+    mock_url = f"http://127.0.0.1:{args.mock_port}"
+    mock = subprocess.Popen([
+        sys.executable, os.path.join(SCRIPT_DIR, "mock_translation_backends.py"),
+        "--port", str(args.mock_port),
+        "--latency", str(args.mock_latency),
+        "--error-rate", str(args.mock_error_rate),
+        "--rate-limit-rate", str(args.mock_rate_limit_rate),
+        "--models", args.ollama_model,
+    ], cwd=work_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    env = dict(os.environ,
+               TRANSLATOR_PORT=str(args.app_port),
+               GOOGLE_TRANSLATE_ENDPOINT=mock_url,
+               OPENAI_BASE_URL=f"{mock_url}/v1")
+    server = subprocess.Popen([sys.executable, os.path.join(SCRIPT_DIR, "improved_translator_python.py")],
+                              cwd=work_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    app_url = f"http://127.0.0.1:{args.app_port}"
+    if not wait_until_ready(f"{mock_url}/mock/stats") or not wait_until_ready(f"{app_url}/health"):
+        for process in (server, mock):
+            process.terminate()
+        raise RuntimeError("모의 백엔드 또는 번역기가 시작되지 않았습니다.")
+    return [server, mock], app_url, mock_url
+
+def run_job(args, job_index, mock_url):
+    """번역 작업 하나 제출 후 완료까지 대기 - 결과 정보 반환"""
+    seed = job_index if args.distinct else 0
+    files = [
+        ("file", (f"load_{job_index}_{file_index}_l_english.yml",
+                  build_localization_file(args.entries, seed * 1000 + file_index), "application/octet-stream"))
+        for file_index in range(args.files_per_job)
+    ]
+    form = {"language": args.language, "translationApi": args.api}
+    if args.api == "openai":
+        form.update({"openaiApiKey": "mock-key", "openaiModel": args.openai_model,
+                     "openaiCompactPrompt": "on" if args.openai_compact_prompt else "off"})
+    elif args.api == "ollama":
+        form.update({"ollamaEndpoint": args.ollama_endpoint or mock_url, "ollamaModel": args.ollama_model})
+
+    started = time.perf_counter()
+    response = requests.post(f"{args.url}/upload", data=form, files=files, timeout=args.timeout)
+    upload_seconds = time.perf_counter() - started
+    if response.status_code != 202:
+        return {"ok": False, "error": f"업로드 실패 {response.status_code}: {response.text[:200]}",
+                "upload_seconds": upload_seconds}
+
+    status_url = f"{args.url}/jobs/{response.json()['job_id']}"
+    deadline = time.time() + args.timeout
+    while time.time() < deadline:
+        job = requests.get(status_url, timeout=10).json()
+        if job["status"] in ("completed", "failed"):
+            return {
+                "ok": job["status"] == "completed",
+                "error": job.get("error"),
+                "upload_seconds": upload_seconds,
+                "job_seconds": time.perf_counter() - started,
+                "entries": args.entries * args.files_per_job,
+            }
+        time.sleep(args.poll_interval)
+    return {"ok": False, "error": "시간 초과", "upload_seconds": upload_seconds}
+
+def summarize(results, elapsed, sampler, mock_stats):
+    """측정 결과 요약"""
+    completed = [result for result in results if result["ok"]]
+    job_seconds = sorted(result["job_seconds"] for result in completed)
+    upload_seconds = sorted(result["upload_seconds"] for result in results)
+    entries = sum(result["entries"] for result in completed)
+
+    return {
+        "jobs": len(results),
+        "completed": len(completed),
+        "failed": len(results) - len(completed),
+        "elapsed_seconds": round(elapsed, 3),
+        "jobs_per_minute": round(len(completed) / elapsed * 60, 2) if elapsed else 0,
+        "entries_per_second": round(entries / elapsed, 1) if elapsed else 0,
+        "job_latency": {name: round(percentile(job_seconds, ratio), 3)
+                        for name, ratio in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))},
+        "upload_latency": {name: round(percentile(upload_seconds, ratio), 3)
+                           for name, ratio in (("p50", 0.5), ("p99", 0.99))},
+        "server_memory_mb": {
+            "peak": round(sampler.peak_mb, 1) if sampler and sampler.peak_mb else None,
+            "last": round(sampler.last_mb, 1) if sampler and sampler.last_mb else None,
+        },
+        "backend": mock_stats,
+        "errors": sorted({result["error"] for result in results if not result["ok"] and result.get("error")})[:5],
+    }
+
+def print_summary(summary):
+    """요약 출력"""
+    print(f"\n작업 {summary['completed']}/{summary['jobs']}개 완료 ({summary['failed']}개 실패), {summary['elapsed_seconds']:.1f}초")
+    print(f"처리량: {summary['jobs_per_minute']:.1f} 작업/분, {summary['entries_per_second']:,.0f} 항목/초")
+    latency = summary["job_latency"]
+    print(f"작업 지연(초): p50 {latency['p50']:.2f}, p95 {latency['p95']:.2f}, p99 {latency['p99']:.2f}, 최대 {latency['max']:.2f}")
+    upload = summary["upload_latency"]
+    print(f"업로드 응답(초): p50 {upload['p50']:.3f}, p99 {upload['p99']:.3f}")
+    memory = summary["server_memory_mb"]
+    if memory["peak"] is not None:
+        print(f"서버 메모리(MB): 최대 {memory['peak']:.1f}, 종료 시 {memory['last']:.1f}")
+    if summary["backend"]:
+        print(f"백엔드 요청: {summary['backend']}")
+    for error in summary["errors"]:
+        print(f"오류: {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="번역기 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="번역기 주소 (--spawn이면 무시)")
+    parser.add_argument("--spawn", action="store_true", help="모의 백엔드와 번역기를 직접 실행")
+    parser.add_argument("--app-port", type=int, default=5055)
+    parser.add_argument("--mock-port", type=int, default=8765)
+    parser.add_argument("--mock-url", default="", help="이미 실행 중인 모의 백엔드 주소 (통계 조회, Ollama 엔드포인트)")
+    parser.add_argument("--mock-latency", type=float, default=200, help="모의 백엔드 응답 지연 (ms)")
+    parser.add_argument("--mock-error-rate", type=float, default=0.0)
+    parser.add_argument("--mock-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--server-pid", type=int, default=None, help="메모리를 측정할 번역기 프로세스 ID")
+    parser.add_argument("--api", choices=["google", "openai", "ollama"], default="google")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--openai-model", default="gpt-4o-mini")
+    parser.add_argument("--openai-compact-prompt", action="store_true", help="OpenAI 압축 프롬프트 사용")
+    parser.add_argument("--ollama-endpoint", default="")
+    parser.add_argument("--ollama-model", default="llama3.1:8b")
+    parser.add_argument("--jobs", type=int, default=20, help="제출할 작업 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 제출할 작업 수")
+    parser.add_argument("--entries", type=int, default=500, help="파일당 항목 수")
+    parser.add_argument("--files-per-job", type=int, default=1)
+    parser.add_argument("--same-file", dest="distinct", action="store_false", help="모든 작업에 같은 파일 사용 (캐시/중복 합치기 측정)")
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--json", default="", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    processes = []
+    mock_url = args.mock_url
+    server_pid = args.server_pid
+    work_dir = tempfile.TemporaryDirectory() if args.spawn else None
+    try:
+        if args.spawn:
+            processes, args.url, mock_url = spawn_servers(args, work_dir.name)
+            server_pid = processes[0].pid
+
+        sampler = MemorySampler(server_pid) if server_pid else None
+        if sampler:
+            sampler.start()
+
+        print(f"부하 테스트: {args.api}, 작업 {args.jobs}개 (동시 {args.concurrency}), 작업당 항목 {args.entries * args.files_per_job:,}개")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(lambda job_index: run_job(args, job_index, mock_url), range(args.jobs)))
+        elapsed = time.perf_counter() - started
+
+        if sampler:
+            sampler.stop()
+
+        mock_stats = None
+        if mock_url:
+            try:
+                mock_stats = requests.get(f"{mock_url}/mock/stats", timeout=5).json()
+            except requests.RequestException:
+                pass
+
+        summary = summarize(results, elapsed, sampler, mock_stats)
+        print_summary(summary)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as file:
+                json.dump(summary, file, ensure_ascii=False, indent=2)
+        return 0 if summary["failed"] == 0 else 1
+    finally:
+        for process in processes:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if work_dir:
+            work_dir.cleanup()
+
+if __name__ == "__main__":
+    sys.exit(main())
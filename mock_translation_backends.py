@@ -0,0 +1,198 @@
+# 부하 테스트용 모의 번역 백엔드 (Google Translate v2, OpenAI chat completions, Ollama)
+# 사용법: python mock_translation_backends.py --port 8765 --latency 200 --error-rate 0.01 --rate-limit-rate 0.02
+# 번역기 연결: GOOGLE_TRANSLATE_ENDPOINT=http://127.0.0.1:8765
+#             OPENAI_BASE_URL=http://127.0.0.1:8765/v1
+#             Ollama 엔드포인트 입력란에 http://127.0.0.1:8765
+
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+
+from flask import Flask, jsonify, request
+
+app = Flask(__name__)
+
+# 모의 서버 동작 설정 (명령줄 인자로 변경)
+settings = {
+    "latency": 0.2,  # 기본 응답 지연 (초)
+    "jitter": 0.05,  # 지연 편차 (초)
+    "per_item_latency": 0.002,  # 묶음 요청 항목당 추가 지연 (초)
+    "error_rate": 0.0,  # 500 오류 비율
+    "rate_limit_rate": 0.0,  # 429 응답 비율
+    "rate_limit_rpm": 0,  # 분당 요청 한도 (0이면 제한 없음, 초과 시 429)
+    "models": ["llama3.1:8b"],
+}
+
+# 요청 통계
+stats_lock = threading.Lock()
+stats = {"requests": 0, "items": 0, "errors": 0, "rate_limited": 0}
+request_times = []
+
+def mock_translate(text, target_language):
+    """모의 번역 - 언어 표시만 붙여 반환 ($변수$와 플레이스홀더는 그대로 유지, 표시는 마크업 토큰으로 보이지 않는 형식)"""
+    return f"<{target_language}> {text}"
+
+def simulate(item_count=1):
+    """지연/오류/요청 한도 흉내 - 오류 응답이 필요하면 (응답, 상태 코드) 반환"""
+    now = time.time()
+    with stats_lock:
+        stats["requests"] += 1
+        stats["items"] += item_count
+        request_times.append(now)
+        while request_times and request_times[0] < now - 60:
+            request_times.pop(0)
+        over_limit = settings["rate_limit_rpm"] and len(request_times) > settings["rate_limit_rpm"]
+
+    if over_limit or random.random() < settings["rate_limit_rate"]:
+        with stats_lock:
+            stats["rate_limited"] += 1
+        response = jsonify({"error": {"code": 429, "message": "Rate limit exceeded (mock)"}})
+        response.headers["Retry-After"] = "1"
+        return response, 429
+
+    delay = settings["latency"] + random.uniform(-settings["jitter"], settings["jitter"])
+    time.sleep(max(0.0, delay + settings["per_item_latency"] * item_count))
+
+    if random.random() < settings["error_rate"]:
+        with stats_lock:
+            stats["errors"] += 1
+        return jsonify({"error": {"code": 500, "message": "Internal error (mock)"}}), 500
+    return None
+
+# Google Translate v2
+@app.route('/language/translate/v2', methods=['POST'])
+def google_translate():
+    """Google Translate v2 번역 요청"""
+    data = request.get_json(silent=True) or request.form.to_dict(flat=False)
+    values = data.get("q") or []
+    if isinstance(values, str):
+        values = [values]
+    target_language = data.get("target", "ko")
+    if isinstance(target_language, list):
+        target_language = target_language[0]
+
+    failure = simulate(len(values))
+    if failure:
+        return failure
+
+    return jsonify({"data": {"translations": [
+        {"translatedText": mock_translate(value, target_language), "detectedSourceLanguage": "en"}
+        for value in values
+    ]}})
+
+# OpenAI chat completions
+def translate_message(content, target_language="ko"):
+    """사용자 메시지 번역 - JSON 객체면 값마다 번역해 같은 키로 반환 (묶음 요청, 압축 프롬프트의 머리말은 건너뜀)"""
+    try:
+        payload = json.loads(content[content.index('{'):]) if '{' in content else None
+    except ValueError:
+        payload = None
+    if "\nText:\n" in content:
+        content = content.split("\nText:\n", 1)[1]
+    if isinstance(payload, dict):
+        return json.dumps({key: mock_translate(str(value), target_language) for key, value in payload.items()},
+                          ensure_ascii=False), len(payload)
+    return mock_translate(content, target_language), 1
+
+@app.route('/v1/chat/completions', methods=['POST'])
+def openai_chat_completions():
+    """OpenAI chat completions 요청"""
+    data = request.get_json(silent=True) or {}
+    messages = data.get("messages") or []
+    user_content = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+    content, item_count = translate_message(user_content)
+
+    failure = simulate(item_count)
+    if failure:
+        return failure
+
+    prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+    completion_tokens = len(content) // 4
+    return jsonify({
+        "id": f"chatcmpl-mock-{int(time.time() * 1000)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": data.get("model", "mock"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens}
+    })
+
+# Ollama
+@app.route('/api/tags')
+def ollama_tags():
+    """설치된 모델 목록"""
+    return jsonify({"models": [{"name": name, "model": name} for name in settings["models"]]})
+
+@app.route('/api/generate', methods=['POST'])
+def ollama_generate():
+    """Ollama generate 요청 (prompt가 없으면 모델 로드만)"""
+    data = request.get_json(silent=True) or {}
+    prompt = data.get("prompt")
+    if not prompt:
+        return jsonify({"model": data.get("model"), "response": "", "done": True})
+
+    failure = simulate()
+    if failure:
+        return failure
+
+    # 프롬프트의 'Text to translate: "..."' 부분만 번역
+    text = prompt.split('Text to translate: "', 1)[-1].split('"\n', 1)[0]
+    return jsonify({"model": data.get("model"), "response": mock_translate(text, "ko"), "done": True})
+
+@app.route('/api/chat', methods=['POST'])
+def ollama_chat():
+    """Ollama chat 요청 (format이 json이면 묶음 요청)"""
+    data = request.get_json(silent=True) or {}
+    messages = data.get("messages") or []
+    user_content = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+    content, item_count = translate_message(user_content)
+
+    failure = simulate(item_count)
+    if failure:
+        return failure
+
+    return jsonify({"model": data.get("model"), "message": {"role": "assistant", "content": content}, "done": True})
+
+@app.route('/mock/stats')
+def mock_stats():
+    """모의 서버 요청 통계"""
+    with stats_lock:
+        return jsonify(dict(stats))
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 모의 번역 백엔드")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=200, help="기본 응답 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=50, help="지연 편차 (ms)")
+    parser.add_argument("--per-item-latency", type=float, default=2, help="묶음 요청 항목당 추가 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류 비율 (0~1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit-rpm", type=int, default=0, help="분당 요청 한도 (초과 시 429, 0이면 제한 없음)")
+    parser.add_argument("--models", nargs="+", default=settings["models"], help="Ollama 모델 목록")
+    parser.add_argument("--seed", type=int, default=None, help="오류/429 발생 난수 seed")
+    args = parser.parse_args()
+
+    settings.update({
+        "latency": args.latency / 1000,
+        "jitter": args.jitter / 1000,
+        "per_item_latency": args.per_item_latency / 1000,
+        "error_rate": args.error_rate,
+        "rate_limit_rate": args.rate_limit_rate,
+        "rate_limit_rpm": args.rate_limit_rpm,
+        "models": args.models,
+    })
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    print(f"모의 번역 백엔드 실행: http://{args.host}:{args.port} (지연 {args.latency:.0f}ms, "
+          f"오류 {args.error_rate:.1%}, 429 {args.rate_limit_rate:.1%})")
+    app.run(host=args.host, port=args.port, threaded=True, use_reloader=False)
+
+if __name__ == "__main__":
+    main()
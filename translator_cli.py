@@ -0,0 +1,298 @@
+# 게임 로컬라이제이션 번역기 명령줄 실행 (웹 서버 없이 파일/폴더 번역, 자동화용 종료 코드)
+# 사용법: python -m translator_cli a_l_english.yml b_l_english.yml -l ko -o translated
+#         python -m translator_cli MyMod/localisation --mod -l ko --api openai --openai-model gpt-4o-mini
+#         python -m translator_cli mod.zip --mod --api ollama --ollama-model llama3.1:8b --jobs 2
+# 중단된 번역은 같은 명령을 다시 실행하면 작업 저널(journals/)에서 이어서 처리
+# 종료 코드: 0 성공, 1 번역에 실패한 파일 또는 원문 그대로 남은 항목 있음, 2 잘못된 인자/입력 파일, 3 번역 API 설정 오류,
+#           130 사용자 중단
+# Flask는 불러오지 않고, google.cloud/openai는 해당 API를 사용할 때만 불러옴
+
+import time
+
+STARTED_AT = time.perf_counter()  # 시작 시간 측정 기준 (번역 모듈 import 전)
+
+import os
+import sys
+import json
+import logging
+import zipfile
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import improved_translator_python as translator
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_BACKEND = 3
+EXIT_INTERRUPTED = 130
+
+class UsageError(Exception):
+    """잘못된 인자 또는 입력 파일 (종료 코드 2)"""
+
+class BackendError(Exception):
+    """번역 API 설정 오류 (종료 코드 3)"""
+
+def is_localization_file(path):
+    """지원하는 로컬라이제이션 파일 확장자 여부"""
+    return os.path.splitext(path.lower())[1] in translator.config.SUPPORTED_EXTENSIONS
+
+def collect_input_files(paths, work_dir, language=None):
+    """입력 파일/폴더/ZIP에서 번역할 파일 목록 생성 - [(상대 경로, 실제 경로)]
+    (폴더는 폴더 이름부터의 상대 경로, ZIP은 압축 안 경로 유지 - language가 있으면 그 언어 파일만 꺼냄)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            base = os.path.dirname(os.path.abspath(path))
+            for root, directories, names in os.walk(path):
+                directories.sort()
+                for name in sorted(names):
+                    file_path = os.path.join(root, name)
+                    if is_localization_file(name):
+                        files.append((os.path.relpath(os.path.abspath(file_path), base).replace(os.sep, '/'), file_path))
+        elif path.lower().endswith('.zip'):
+            try:
+                files.extend(translator.extract_localization_archive(path, work_dir, language))
+            except (OSError, ValueError, zipfile.BadZipFile) as e:
+                raise UsageError(f"ZIP 파일을 읽을 수 없습니다: {path} ({e})")
+        elif os.path.isfile(path):
+            if not is_localization_file(path):
+                raise UsageError(f"지원하지 않는 파일 형식입니다: {path}")
+            files.append((os.path.basename(path), path))
+        else:
+            raise UsageError(f"파일을 찾을 수 없습니다: {path}")
+
+    if not files:
+        raise UsageError("번역할 로컬라이제이션 파일이 없습니다.")
+    return files
+
+def collect_memory_files(paths):
+    """번역 메모리 입력 목록 - [(경로, 경로)] (폴더는 하위 파일 전체)"""
+    memory_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                memory_files.extend(
+                    (os.path.join(root, name), os.path.join(root, name))
+                    for name in sorted(names) if is_localization_file(name) or name.lower().endswith('.zip')
+                )
+        elif os.path.isfile(path):
+            memory_files.append((path, path))
+        else:
+            raise UsageError(f"번역 메모리 파일을 찾을 수 없습니다: {path}")
+    return memory_files
+
+def build_api_settings(args):
+    """명령줄 인자로 번역 API 설정 생성 (웹 업로드와 같은 형식) - 사용할 수 없으면 BackendError"""
+    config = translator.config
+    api_settings = {}
+    if args.api == "google":
+        if not translator.get_google_client():
+            raise BackendError("Google Cloud Translate API가 설정되지 않았습니다. (GOOGLE_APPLICATION_CREDENTIALS 확인)")
+    elif args.api == "openai":
+        api_key = args.openai_api_key or os.getenv('OPENAI_API_KEY', '')
+        if not api_key:
+            raise BackendError("OpenAI API 키가 필요합니다. (--openai-api-key 또는 OPENAI_API_KEY)")
+        api_settings = {
+            "openai_api_key": api_key,
+            "openai_model": args.openai_model,
+            "openai_packing": config.OPENAI_PACKING if args.packing is None else args.packing,
+            "openai_compact_prompt": args.compact_prompt
+        }
+    elif args.api == "ollama":
+        api_settings = {
+            "ollama_endpoint": args.ollama_endpoint,
+            "ollama_model": args.ollama_model,
+            "ollama_packing": config.OLLAMA_PACKING if args.packing is None else args.packing,
+            "ollama_keep_alive": args.ollama_keep_alive,
+            "ollama_num_ctx": args.ollama_num_ctx
+        }
+        is_valid, message = translator.validate_ollama_model(args.ollama_endpoint, args.ollama_model)
+        if not is_valid:
+            raise BackendError(message)
+
+    api_settings["concurrency"] = translator.resolve_concurrency(args.api, {"concurrency": args.concurrency})
+    return api_settings
+
+def translate_each_file(args, files, api_settings, previous, memory, usage, journal):
+    """파일별 번역 (--jobs개 파일 동시 처리) - (결과 파일 목록, 실패 목록, 항목 수 집계, 건너뛴 파일 목록)"""
+    def translate_one(item):
+        relative_path, file_path = item
+        file_stats = {}
+        output_path = translator.translate_paradox_file(
+            file_path, translator.get_output_path(args.output, relative_path), args.language, args.api, api_settings,
+            previous=previous, stats=file_stats, memory=memory, usage=usage, journal=journal
+        )
+        return output_path, file_stats
+
+    def run(item):
+        try:
+            return translate_one(item), None
+        except Exception as e:
+            return None, f"{item[0]}: {e}"
+
+    output_files, failures, stats = [], [], {}
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs), thread_name_prefix="cli-file") as executor:
+        for (relative_path, _), (result, error) in zip(files, executor.map(run, files)):
+            if error:
+                failures.append(error)
+                logging.error(f"번역 실패 - {error}")
+                continue
+            output_path, file_stats = result
+            output_files.append(output_path)
+            for name, count in file_stats.items():
+                stats[name] = stats.get(name, 0) + count
+            if not args.quiet:
+                print(f"완료: {relative_path} → {output_path}")
+    return output_files, failures, stats, []
+
+def translate_mod(args, files, api_settings, previous, memory, usage, journal):
+    """모드 전체 번역 (모든 원문 파일을 작업 하나로) - (결과 파일 목록, 실패 목록, 항목 수 집계, 건너뛴 파일 목록)
+    (원문 언어가 아닌 파일은 번역하지 않고 건너뜀)"""
+    source_language = translator.config.MOD_SOURCE_LANGUAGE
+    source_files, skipped_files = [], []
+    for relative_path, file_path in files:
+        if translator.read_localization_language(file_path) == source_language:
+            source_files.append((relative_path, file_path))
+        else:
+            skipped_files.append(relative_path)
+    if not source_files:
+        raise UsageError(f"번역할 {source_language} 파일이 없습니다.")
+
+    stats = {}
+    output_files = translator.translate_paradox_files(
+        [file_path for _, file_path in source_files],
+        [translator.get_output_path(args.output, translator.get_mod_output_path(relative_path, args.language))
+         for relative_path, _ in source_files],
+        args.language, args.api, api_settings,
+        previous=previous, stats=stats, memory=memory, usage=usage, journal=journal,
+        language_header=translator.get_localization_language(args.language)
+    )
+    if not args.quiet:
+        print(f"완료: 원문 파일 {len(source_files)}개 → {os.path.join(args.output, 'localisation')}")
+    return output_files, [], stats, skipped_files
+
+def run(args):
+    """번역 실행 - 요약 정보 반환"""
+    memory = None
+    if args.memory:
+        memory = translator.load_translation_memory(args.language, collect_memory_files(args.memory))
+
+    previous = None
+    if args.old_source or args.old_translation:
+        if not (args.old_source and args.old_translation):
+            raise UsageError("증분 번역에는 --old-source와 --old-translation이 모두 필요합니다.")
+        previous = translator.load_previous_translation(args.old_source, args.old_translation)
+
+    api_settings = build_api_settings(args)
+    startup_seconds = time.perf_counter() - STARTED_AT
+
+    usage = translator.TokenUsage()
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="translator_cli_") as work_dir:
+        files = collect_input_files(args.inputs, work_dir, translator.config.MOD_SOURCE_LANGUAGE if args.mod else None)
+
+        # 작업 저널: 같은 명령을 다시 실행하면 중단된 지점부터 이어서 번역
+        journal = None if args.no_resume else translator.open_translation_journal(
+            [file_path for _, file_path in files], args.language, args.api, api_settings
+        )
+        translate = translate_mod if args.mod else translate_each_file
+        try:
+            output_files, failures, stats, skipped_files = translate(args, files, api_settings, previous, memory, usage, journal)
+        except BaseException:
+            if journal is not None:
+                journal.close()
+            raise
+        if journal is not None:
+            journal.close() if failures or stats.get("untranslated") else journal.remove()
+
+    return {
+        "files": len(files) - len(skipped_files),  # 번역 대상 파일 (건너뛴 파일 제외)
+        "skipped_files": len(skipped_files),
+        "output_files": output_files,
+        "failures": failures,
+        "stats": stats,
+        "usage": usage.to_dict() if usage.requests else None,
+        "startup_seconds": round(startup_seconds, 3),
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+def print_summary(summary):
+    """요약 출력"""
+    stats = summary["stats"]
+    print(f"\n파일 {len(summary['output_files'])}/{summary['files']}개 번역 완료 ({len(summary['failures'])}개 실패), "
+          f"{summary['elapsed_seconds']:.1f}초 (시작 {summary['startup_seconds']:.2f}초)")
+    if summary["skipped_files"]:
+        print(f"원문 언어({translator.config.MOD_SOURCE_LANGUAGE})가 아닌 파일 {summary['skipped_files']}개는 건너뜀")
+    print(f"항목: 전체 {stats.get('entries', 0)}개, 번역 {stats.get('translated', 0)}개, 이어서 처리 {stats.get('resumed', 0)}개, "
+          f"번역 메모리 {stats.get('memory', 0)}개, 이전 번역 {stats.get('unchanged', 0)}개, 유사 번역 {stats.get('fuzzy', 0)}개")
+    if stats.get("untranslated"):
+        print(f"번역 실패: {stats['untranslated']}개 항목은 원문 그대로 저장 (같은 명령을 다시 실행하면 해당 항목만 다시 번역)")
+    usage = summary["usage"]
+    if usage:
+        cost = f", 예상 비용 ${usage['estimated_cost_usd']:.4f}" if usage["estimated_cost_usd"] is not None else ""
+        print(f"OpenAI 토큰: 입력 {usage['prompt_tokens']} (캐시 {usage['cached_tokens']}), 출력 {usage['completion_tokens']}{cost}")
+    for failure in summary["failures"]:
+        print(f"실패: {failure}")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="translator_cli", description="게임 로컬라이제이션 파일 번역 (명령줄)")
+    parser.add_argument("inputs", nargs="+", help="번역할 파일, 폴더 또는 모드 ZIP")
+    parser.add_argument("-l", "--language", default="ko", help="번역할 언어 코드 (기본 ko)")
+    parser.add_argument("-o", "--output", default="translated", help="결과 폴더 (기본 translated)")
+    parser.add_argument("--api", choices=["google", "openai", "ollama"], default="google", help="번역 API")
+    parser.add_argument("--mod", action="store_true", help="모드 전체 번역 (localisation/<언어>/ 폴더 구조와 l_<언어> 헤더로 저장)")
+    parser.add_argument("--jobs", type=int, default=translator.config.JOB_WORKERS, help="동시에 번역할 파일 수 (--mod가 아닐 때)")
+    parser.add_argument("--concurrency", type=int, default=None, help="파일당 AI 번역 동시 요청 수 (기본: API별 상한, 모든 파일 합계도 상한을 넘지 않음)")
+    parser.add_argument("--openai-api-key", default="", help="OpenAI API 키 (기본: OPENAI_API_KEY 환경 변수)")
+    parser.add_argument("--openai-model", default="gpt-3.5-turbo")
+    parser.add_argument("--compact-prompt", action="store_true", help="OpenAI 압축 프롬프트 사용 (입력 토큰 절약)")
+    parser.add_argument("--packing", dest="packing", action="store_true", default=None, help="여러 항목 묶음 요청 (OpenAI/Ollama)")
+    parser.add_argument("--no-packing", dest="packing", action="store_false", help="항목별 개별 요청")
+    parser.add_argument("--ollama-endpoint", default="http://localhost:11434")
+    parser.add_argument("--ollama-model", default="llama3.1:8b")
+    parser.add_argument("--ollama-keep-alive", default=translator.config.OLLAMA_KEEP_ALIVE)
+    parser.add_argument("--ollama-num-ctx", type=int, default=translator.config.OLLAMA_NUM_CTX)
+    parser.add_argument("--memory", nargs="+", default=[], help="번역 메모리로 쓸 기존 번역 파일/폴더/ZIP")
+    parser.add_argument("--old-source", nargs="+", default=[], help="증분 번역: 이전 버전 원문 파일")
+    parser.add_argument("--old-translation", nargs="+", default=[], help="증분 번역: 이전 번역 결과 파일")
+    parser.add_argument("--no-resume", action="store_true", help="작업 저널을 쓰지 않음 (중단된 번역을 이어서 처리하지 않음)")
+    parser.add_argument("--json", default="", help="요약을 저장할 JSON 파일")
+    parser.add_argument("-q", "--quiet", action="store_true", help="요약 외 출력 생략")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그 출력")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else translator.config.LOG_LEVEL,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    try:
+        summary = run(args)
+    except UsageError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except BackendError as e:
+        print(f"번역 API 오류: {e}", file=sys.stderr)
+        return EXIT_BACKEND
+    except KeyboardInterrupt:
+        print("중단되었습니다.", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        logging.error(f"번역 중 오류 발생: {e}")
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_FAILED
+
+    untranslated = summary["stats"].get("untranslated", 0)
+    if not args.quiet or summary["failures"] or untranslated:
+        print_summary(summary)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+    return EXIT_FAILED if summary["failures"] or untranslated else EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1105 @@
+# 게임 로컬라이제이션 번역기 웹 서버 (Flask 화면, 업로드/작업/다운로드 API)
+# 사용법: python improved_translator_python.py  (또는 python translator_web.py)
+# 번역 파이프라인은 improved_translator_python.py, 명령줄 실행은 translator_cli.py
+
+import os
+import json
+import time
+import uuid
+import logging
+import zipfile
+import tempfile
+from datetime import datetime
+
+from flask import Flask, Request, Response, request, send_file, jsonify, stream_with_context
+from werkzeug.utils import cached_property, secure_filename
+
+from improved_translator_python import (
+    config, metrics, job_manager, translation_service, TranslationJob, validate_file, resolve_concurrency,
+    load_previous_translation, extract_localization_archive, iter_zip_stream, get_google_client,
+    get_available_ollama_models, validate_ollama_model, remove_uploaded_files
+)
+
+class UploadRequest(Request):
+    """업로드 파일을 임시 파일 대신 업로드 폴더에 바로 기록 (요청 스트림에서 한 번만 저장, 작업은 그 파일을 그대로 사용)"""
+
+    @cached_property
+    def upload_streams(self):
+        """이 요청에서 업로드 폴더에 기록한 파일 {경로: 스트림} (작업에 넘기지 않은 파일은 요청이 끝나면 삭제)"""
+        return {}
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        os.makedirs(config.UPLOAD_FOLDER, exist_ok=True)
+        safe_filename = secure_filename(os.path.basename(filename or '')) or 'upload'
+        file_path = os.path.join(config.UPLOAD_FOLDER, f"{uuid.uuid4().hex}_{safe_filename}")
+        stream = open(file_path, 'w+b')
+        self.upload_streams[file_path] = stream
+        return stream
+
+def claim_upload(file):
+    """업로드 파일을 작업 파일로 넘김 (요청이 끝나도 삭제하지 않음) - 저장 경로 반환"""
+    file.stream.close()
+    request.upload_streams.pop(file.stream.name, None)
+    return file.stream.name
+
+# Flask 웹 애플리케이션 설정
+app = Flask(__name__)
+app.request_class = UploadRequest
+app.config['MAX_CONTENT_LENGTH'] = config.MAX_UPLOAD_SIZE
+
+@app.teardown_request
+def remove_unclaimed_uploads(exception=None):
+    """작업에 넘기지 않은 업로드 파일 삭제 (모드 ZIP, 증분 번역/번역 메모리 파일, 오류로 중단된 업로드)"""
+    if 'upload_streams' not in request.__dict__:
+        return
+    for file_path, stream in request.upload_streams.items():
+        stream.close()
+        try:
+            os.remove(file_path)
+        except OSError as e:
+            logging.warning(f"업로드 파일 삭제 실패: {e}")
+
+@app.route('/')
+def index():
+    """메인 페이지"""
+    # HTML을 직접 반환 (템플릿 파일 불필요)
+    html_content = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>게임 로컬라이제이션 번역기</title>
+    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
+    <style>
+        body { 
+            font-family: 'Malgun Gothic', '맑은 고딕', sans-serif; 
+            margin: 0; 
+            padding: 20px; 
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+        }
+        .container { 
+            max-width: 900px; 
+            margin: 0 auto; 
+            background-color: white; 
+            padding: 30px; 
+            border-radius: 15px; 
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+        }
+        h1 { 
+            color: #333; 
+            text-align: center; 
+            margin-bottom: 10px;
+            font-size: 2.5em;
+            background: linear-gradient(45deg, #667eea, #764ba2);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+        }
+        .subtitle {
+            text-align: center;
+            color: #666;
+            margin-bottom: 30px;
+            font-size: 1.1em;
+        }
+        form { margin-bottom: 20px; }
+        label { 
+            display: block; 
+            margin-bottom: 8px; 
+            font-weight: bold;
+            color: #333;
+        }
+        select, input[type="file"], input[type="text"], input[type="password"], input[type="number"] { 
+            width: 100%; 
+            padding: 12px; 
+            margin-bottom: 15px; 
+            border: 2px solid #e1e1e1; 
+            border-radius: 8px; 
+            box-sizing: border-box;
+            font-size: 14px;
+            transition: border-color 0.3s ease;
+        }
+        select:focus, input[type="file"]:focus, input[type="text"]:focus, input[type="password"]:focus {
+            border-color: #667eea;
+            outline: none;
+        }
+        input[type="submit"] { 
+            background: linear-gradient(45deg, #667eea, #764ba2);
+            color: white; 
+            padding: 15px 20px; 
+            border: none; 
+            border-radius: 8px; 
+            cursor: pointer; 
+            font-size: 16px; 
+            width: 100%;
+            font-weight: bold;
+            transition: transform 0.2s ease;
+        }
+        input[type="submit"]:hover { 
+            transform: translateY(-2px);
+            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.3);
+        }
+        input[type="submit"]:disabled {
+            background: #ccc;
+            cursor: not-allowed;
+            transform: none;
+        }
+        #progress { 
+            margin-top: 20px; 
+            display: none;
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 10px;
+            border: 1px solid #e9ecef;
+        }
+        progress { 
+            width: 100%; 
+            height: 25px;
+            border-radius: 12px;
+        }
+        #percentage { 
+            text-align: center; 
+            font-weight: bold; 
+            margin-top: 10px;
+            font-size: 18px;
+            color: #667eea;
+        }
+        #currentItem {
+            text-align: center;
+            margin-top: 10px;
+            color: #666;
+            font-style: italic;
+            min-height: 20px;
+        }
+        .error-message { 
+            color: #dc3545; 
+            margin-top: 10px; 
+            padding: 15px; 
+            background-color: #f8d7da; 
+            border: 1px solid #f5c6cb;
+            border-radius: 8px; 
+            display: none;
+        }
+        .success-message {
+            color: #155724;
+            margin-top: 10px;
+            padding: 15px;
+            background-color: #d4edda;
+            border: 1px solid #c3e6cb;
+            border-radius: 8px;
+            display: none;
+        }
+        .info-section { 
+            margin-top: 30px; 
+            padding: 20px; 
+            background: linear-gradient(135deg, #e8f4f8 0%, #f0f8e8 100%);
+            border-radius: 10px;
+            border-left: 5px solid #667eea;
+        }
+        .info-section h3 { 
+            margin-top: 0;
+            color: #333;
+        }
+        #downloadLink { 
+            text-align: center; 
+            margin-top: 20px; 
+            font-size: 18px;
+        }
+        .download-item {
+            display: inline-block;
+            margin: 10px;
+            padding: 15px 25px;
+            background: linear-gradient(45deg, #28a745, #20c997);
+            color: white;
+            text-decoration: none;
+            border-radius: 25px;
+            font-weight: bold;
+            transition: all 0.3s ease;
+        }
+        .download-item:hover {
+            transform: scale(1.05);
+            text-decoration: none;
+            color: white;
+        }
+        .translation-settings { 
+            padding: 20px; 
+            background: #f8f9fa;
+            border-radius: 10px; 
+            margin-bottom: 20px;
+            border: 1px solid #e9ecef;
+        }
+        .translation-option { 
+            margin-bottom: 15px;
+            padding: 10px;
+            border-radius: 5px;
+            transition: background-color 0.3s ease;
+        }
+        .translation-option:hover {
+            background-color: #e9ecef;
+        }
+        .translation-option input[type="radio"] {
+            margin-right: 10px;
+            width: auto;
+        }
+        .translation-option label {
+            display: inline;
+            margin-left: 5px;
+            cursor: pointer;
+        }
+        .api-key-input, .ollama-settings { 
+            display: none; 
+            margin-top: 15px;
+            padding: 15px;
+            background: white;
+            border-radius: 8px;
+            border: 1px solid #dee2e6;
+        }
+        .status-indicator {
+            display: inline-block;
+            width: 10px;
+            height: 10px;
+            border-radius: 50%;
+            margin-right: 8px;
+        }
+        .status-ready { background-color: #28a745; }
+        .status-working { background-color: #ffc107; }
+        .status-error { background-color: #dc3545; }
+        
+        .file-info {
+            background: #e9ecef;
+            padding: 10px;
+            border-radius: 5px;
+            margin-top: 10px;
+            font-size: 14px;
+            color: #495057;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>게임 로컬라이제이션 번역기</h1>
+        <p class="subtitle">파라독스 인터랙티브 게임 등의 로컬라이제이션 파일 (예: l_english.yml)을 다른 언어로 번역합니다.</p>
+        
+        <form id="uploadForm" enctype="multipart/form-data">
+            <label for="file">번역할 파일 선택 (여러 파일 선택 가능, ZIP은 모드 전체 번역):</label>
+            <input type="file" name="file" id="fileInput" accept=".yml,.yaml,.zip" multiple>
+            <div id="fileInfo" class="file-info" style="display: none;"></div>
+            
+            <div class="translation-settings">
+                <label>모드 전체 번역 (선택 - 모든 파일을 한 번에 번역해 localisation/korean/ 폴더 구조로 저장):</label>
+                <label for="modFolder">모드 localisation 폴더 (l_english 파일만 번역):</label>
+                <input type="file" name="modFolder" id="modFolder" webkitdirectory multiple>
+                <label for="modArchive">또는 모드 ZIP 파일:</label>
+                <input type="file" name="modArchive" id="modArchive" accept=".zip">
+            </div>
+            
+            <div class="translation-settings">
+                <label>번역 API 선택:</label>
+                <div class="translation-option">
+                    <input type="radio" id="googleTranslate" name="translationApi" value="google" checked>
+                    <label for="googleTranslate">
+                        <span class="status-indicator status-ready"></span>
+                        구글 클라우드 번역 (빠름, 기본)
+                    </label>
+                </div>
+                
+                <div class="translation-option">
+                    <input type="radio" id="openaiApi" name="translationApi" value="openai">
+                    <label for="openaiApi">
+                        <span class="status-indicator status-ready"></span>
+                        OpenAI API (ChatGPT/GPT-4) - 고품질
+                    </label>
+                    <div id="openaiSettings" class="api-key-input">
+                        <label for="openaiApiKey">OpenAI API 키:</label>
+                        <input type="password" id="openaiApiKey" name="openaiApiKey" placeholder="sk-...">
+                        <label for="openaiModel">모델 선택:</label>
+                        <select id="openaiModel" name="openaiModel">
+                            <option value="gpt-4o">GPT-4o (최신)</option>
+                            <option value="gpt-4-turbo">GPT-4 Turbo</option>
+                            <option value="gpt-4">GPT-4</option>
+                            <option value="gpt-3.5-turbo" selected>GPT-3.5 Turbo (경제적)</option>
+                        </select>
+                        <label for="openaiPacking">요청 방식:</label>
+                        <select id="openaiPacking" name="openaiPacking">
+                            <option value="on" selected>여러 항목 묶음 요청 (토큰 절약, 빠름)</option>
+                            <option value="off">항목별 개별 요청</option>
+                        </select>
+                        <label for="openaiCompactPrompt">프롬프트:</label>
+                        <select id="openaiCompactPrompt" name="openaiCompactPrompt">
+                            <option value="off" selected>전체 지시문</option>
+                            <option value="on">압축 프롬프트 (입력 토큰 절약)</option>
+                        </select>
+                    </div>
+                </div>
+                
+                <div class="translation-option">
+                    <input type="radio" id="ollamaApi" name="translationApi" value="ollama">
+                    <label for="ollamaApi">
+                        <span class="status-indicator status-ready"></span>
+                        Ollama (로컬 AI) - 무료
+                    </label>
+                    <div id="ollamaSettings" class="ollama-settings">
+                        <label for="ollamaEndpoint">Ollama 엔드포인트:</label>
+                        <input type="text" id="ollamaEndpoint" name="ollamaEndpoint" value="http://localhost:11434" placeholder="http://localhost:11434">
+                        <label for="ollamaModel">모델 선택:</label>
+                        <select id="ollamaModel" name="ollamaModel">
+                            <option value="llama3.1:8b">Llama 3.1 8B (추천)</option>
+                            <option value="gemma2:27b">Gemma 2 27B (고품질)</option>
+                            <option value="mistral">Mistral 7B</option>
+                            <option value="llama2">Llama 2 7B</option>
+                        </select>
+                        <label for="ollamaPacking">요청 방식:</label>
+                        <select id="ollamaPacking" name="ollamaPacking">
+                            <option value="on" selected>여러 항목 묶음 요청 (/api/chat, 빠름)</option>
+                            <option value="off">항목별 개별 요청</option>
+                        </select>
+                        <label for="ollamaKeepAlive">모델 유지 시간 (keep_alive):</label>
+                        <input type="text" id="ollamaKeepAlive" name="ollamaKeepAlive" value="30m" placeholder="30m">
+                        <label for="ollamaNumCtx">컨텍스트 길이 (num_ctx):</label>
+                        <input type="number" id="ollamaNumCtx" name="ollamaNumCtx" value="8192" min="512" step="512">
+                        <button type="button" id="testOllama" style="margin-top: 10px; padding: 8px 15px; background: #6c757d; color: white; border: none; border-radius: 5px; cursor: pointer;">연결 테스트</button>
+                    </div>
+                </div>
+                
+                <label for="concurrency">AI 번역 동시 요청 수 (비워두면 API별 상한, 상한보다 낮게만 설정 가능):</label>
+                <input type="number" id="concurrency" name="concurrency" min="1" placeholder="OpenAI 8 / Ollama 2">
+            </div>
+            
+            <div class="translation-settings">
+                <label>증분 번역 (선택 - 모드 업데이트 시 바뀐 항목만 번역):</label>
+                <label for="oldSourceFile">이전 버전 원문 파일 (예: 업데이트 전 l_english.yml):</label>
+                <input type="file" name="oldSourceFile" id="oldSourceFile" accept=".yml,.yaml" multiple>
+                <label for="oldTranslationFile">이전 번역 결과 파일:</label>
+                <input type="file" name="oldTranslationFile" id="oldTranslationFile" accept=".yml,.yaml" multiple>
+            </div>
+            
+            <div class="translation-settings">
+                <label>번역 메모리 (선택 - 기존 번역과 정확히 일치하는 항목은 API 호출 없이 채움):</label>
+                <label for="memoryFile">기존 번역 파일 또는 ZIP (예: l_korean.yml, 번역된 모드 ZIP):</label>
+                <input type="file" name="memoryFile" id="memoryFile" accept=".yml,.yaml,.zip" multiple>
+                <label for="memoryFolder">번역된 모드 폴더 (원문/번역 파일을 키로 짝지어 색인):</label>
+                <input type="file" name="memoryFolder" id="memoryFolder" webkitdirectory multiple>
+            </div>
+            
+            <label for="language">번역할 언어:</label>
+            <select name="language" id="languageSelect">
+                <option value="ko">한국어 (Korean)</option>
+                <option value="en">영어 (English)</option>
+                <option value="ja">일본어 (Japanese)</option>
+                <option value="zh">중국어 (Chinese)</option>
+                <option value="es">스페인어 (Spanish)</option>
+                <option value="fr">프랑스어 (French)</option>
+                <option value="de">독일어 (German)</option>
+                <option value="ru">러시아어 (Russian)</option>
+                <option value="it">이탈리아어 (Italian)</option>
+                <option value="pt">포르투갈어 (Portuguese)</option>
+                <option value="nl">네덜란드어 (Dutch)</option>
+                <option value="sv">스웨덴어 (Swedish)</option>
+                <option value="no">노르웨이어 (Norwegian)</option>
+                <option value="da">덴마크어 (Danish)</option>
+                <option value="fi">핀란드어 (Finnish)</option>
+            </select>
+            
+            <input type="submit" value="번역 시작" id="submitBtn">
+        </form>
+
+        <div id="progress">
+            <h2>번역 진행률</h2>
+            <progress id="progressBar" value="0" max="100"></progress>
+            <p id="percentage">0%</p>
+            <p id="currentItem"></p>
+            <p id="estimatedTime" style="color: #666; font-size: 14px;"></p>
+            <a id="partialLink" href="#" style="display: none; color: #667eea; font-size: 14px;">⬇️ 지금까지 번역된 결과 받기 (번역되지 않은 줄은 원문 유지)</a>
+        </div>
+        
+        <div id="errorMessage" class="error-message"></div>
+        <div id="successMessage" class="success-message"></div>
+        
+        <div id="downloadLink"></div>
+        
+        <div class="info-section">
+            <h3>🎮 사용 안내</h3>
+            <p><strong>1단계:</strong> 번역할 YML 파일을 선택합니다 (여러 파일 선택 가능).</p>
+            <p><strong>2단계:</strong> 번역 API를 선택합니다.</p>
+            <p><strong>3단계:</strong> 번역할 언어를 선택합니다.</p>
+            <p><strong>4단계:</strong> '번역 시작' 버튼을 클릭하면 파일들이 순차적으로 번역됩니다.</p>
+            <p><strong>5단계:</strong> 번역 완료 후 개별 파일 또는 ZIP 파일로 다운로드할 수 있습니다.</p>
+            
+            <h3>⚙️ API별 특징</h3>
+            <p><strong>구글 클라우드 번역:</strong> 빠른 속도, 환경변수 설정 필요</p>
+            <p><strong>OpenAI API:</strong> 최고 품질, 게임 맥락 이해 우수, API 키 필요</p>
+            <p><strong>Ollama:</strong> 완전 무료, 로컬 처리, 프라이버시 보장</p>
+            
+            <h3>🔧 고급 기능</h3>
+            <p>• AI 번역 시 들여쓰기는 자동으로 줄바꿈(\\n)으로 변환됩니다</p>
+            <p>• 게임 변수 ($VARIABLE$) 는 번역되지 않고 보존됩니다</p>
+            <p>• HTML 엔티티(&quot;, &amp; 등)가 자동으로 정상 문자로 변환됩니다</p>
+            <p>• 약어와 줄임말을 자동으로 풀어서 번역합니다 (예: NATO → 북대서양 조약 기구)</p>
+            <p>• 역사적, 정치적, 군사적 조직명을 해당 언어의 공식 명칭으로 번역합니다</p>
+            <p>• 여러 파일 선택 시 자동으로 ZIP 파일로 묶어서 다운로드 제공</p>
+            <p>• 실시간 진행률 표시 (처리 속도, 예상 완료 시간) - 작업별 이벤트 스트림</p>
+            <p>• 대용량 파일 지원 및 시간 제한 없음</p>
+            <p>• 번역 캐시로 중복 텍스트 처리 최적화</p>
+        </div>
+    </div>
+
+    <script>
+        $(document).ready(function(){
+            // 파일 선택 시 정보 표시
+            $('#fileInput').change(function(){
+                const files = this.files;
+                if(files.length > 0) {
+                    let info = `선택된 파일 ${files.length}개:\\n`;
+                    for(let i = 0; i < files.length; i++) {
+                        info += `• ${files[i].name} (${(files[i].size / 1024).toFixed(1)} KB)\\n`;
+                    }
+                    $('#fileInfo').text(info).show();
+                } else {
+                    $('#fileInfo').hide();
+                }
+            });
+            
+            // 라디오 버튼 변경 시 관련 설정 표시/숨김
+            $('input[name="translationApi"]').change(function(){
+                $('.api-key-input, .ollama-settings').hide();
+                
+                if($(this).val() === 'openai') {
+                    $('#openaiSettings').show();
+                } else if($(this).val() === 'ollama') {
+                    $('#ollamaSettings').show();
+                }
+            });
+            
+            // Ollama 연결 테스트
+            $('#testOllama').click(function(){
+                const endpoint = $('#ollamaEndpoint').val();
+                const btn = $(this);
+                btn.text('테스트 중...').prop('disabled', true);
+                
+                $.get('/ollama/models?endpoint=' + encodeURIComponent(endpoint))
+                    .done(function(data) {
+                        if(data.models && data.models.length > 0) {
+                            btn.text('연결 성공!').css('background', '#28a745');
+                            
+                            // 모델 선택 옵션 업데이트
+                            const modelSelect = $('#ollamaModel');
+                            const currentModel = modelSelect.val();
+                            modelSelect.empty();
+                            
+                            data.models.forEach(function(model) {
+                                const option = $('<option></option>')
+                                    .attr('value', model)
+                                    .text(model);
+                                if(model === currentModel) {
+                                    option.attr('selected', true);
+                                }
+                                modelSelect.append(option);
+                            });
+                            
+                            // 현재 모델이 사용 가능한 모델에 없으면 첫 번째 모델 선택
+                            if(!data.models.includes(currentModel)) {
+                                modelSelect.val(data.models[0]);
+                            }
+                            
+                            setTimeout(() => {
+                                btn.text('연결 테스트').css('background', '#6c757d').prop('disabled', false);
+                            }, 2000);
+                        } else {
+                            btn.text('모델 없음').css('background', '#ffc107');
+                            setTimeout(() => {
+                                btn.text('연결 테스트').css('background', '#6c757d').prop('disabled', false);
+                            }, 3000);
+                        }
+                    })
+                    .fail(function() {
+                        btn.text('연결 실패').css('background', '#dc3545');
+                        setTimeout(() => {
+                            btn.text('연결 테스트').css('background', '#6c757d').prop('disabled', false);
+                        }, 2000);
+                    });
+            });
+            
+            // 폼 제출 처리
+            $('#uploadForm').submit(function(event){
+                event.preventDefault();
+                
+                // 기본 검증
+                const files = $('#fileInput')[0].files;
+                const modSelected = $('#modFolder')[0].files.length > 0 || $('#modArchive')[0].files.length > 0;
+                if(files.length === 0 && !modSelected) {
+                    showError('파일을 선택해주세요.');
+                    return;
+                }
+                
+                const translationApi = $('input[name="translationApi"]:checked').val();
+                if(translationApi === 'openai' && !$('#openaiApiKey').val().trim()) {
+                    showError('OpenAI API 키를 입력해주세요.');
+                    return;
+                }
+                
+                var formData = new FormData(this);
+                
+                // UI 상태 변경
+                $('#submitBtn').prop('disabled', true).val('번역 중...');
+                $('#progress').show();
+                $('#partialLink').hide();
+                $('#errorMessage, #successMessage').hide();
+                $('#downloadLink').html('');
+                
+                $.ajax({
+                    url: '/upload',
+                    type: 'POST',
+                    data: formData,
+                    contentType: false,
+                    processData: false,
+                    success: function(response) {
+                        if(response.error) {
+                            showError('번역 오류: ' + response.error);
+                            resetSubmitButton();
+                        } else if(response.job_id) {
+                            // 작업이 등록되면 진행률 이벤트 스트림 구독
+                            $('#partialLink').attr('href', `/jobs/${response.job_id}/partial`);
+                            startJobEvents(response.events_url);
+                        }
+                    },
+                    error: function(xhr, status, error) {
+                        let errorMsg = '서버 오류가 발생했습니다.';
+                        if(xhr.responseJSON && xhr.responseJSON.error) {
+                            errorMsg = xhr.responseJSON.error;
+                        } else if(status === 'error') {
+                            errorMsg = '네트워크 오류가 발생했습니다. 연결을 확인해주세요.';
+                        }
+                        showError(errorMsg);
+                        resetSubmitButton();
+                    }
+                });
+            });
+            
+            function startJobEvents(eventsUrl) {
+                const source = new EventSource(eventsUrl);
+                
+                source.addEventListener('progress', function(event) {
+                    updateProgress(JSON.parse(event.data));
+                });
+                
+                source.addEventListener('completed', function(event) {
+                    source.close();
+                    showJobResult(JSON.parse(event.data));
+                    resetSubmitButton();
+                });
+                
+                source.addEventListener('failed', function(event) {
+                    source.close();
+                    const job = JSON.parse(event.data);
+                    showError('번역 오류: ' + (job.error || '알 수 없는 오류'));
+                    resetSubmitButton();
+                });
+                
+                source.onerror = function() {
+                    // 연결이 끊기면 브라우저가 자동 재연결, 작업이 없으면 중단
+                    if(source.readyState === EventSource.CLOSED) {
+                        showError('작업 진행률을 받을 수 없습니다.');
+                        resetSubmitButton();
+                    }
+                };
+            }
+            
+            function updateProgress(data) {
+                const percent = Math.max(0, Math.min(100, data.progress || 0)); // 0-100 범위 강제
+                $('#progressBar').val(percent);
+                $('#percentage').text(`${Math.round(percent)}% (${data.current_count || 0}/${data.total_count || 0})`);
+                
+                // 현재 번역 중인 항목 정보 표시
+                if(data.current_item) {
+                    let itemText = `현재 번역 중: 파일 ${data.file_index}/${data.file_count}: ${data.current_item}`;
+                    if(data.entries_per_second > 0) {
+                        itemText += ` (초당 ${data.entries_per_second}개)`;
+                    }
+                    $('#currentItem').text(itemText);
+                }
+                
+                // 번역이 시작되면 부분 결과 다운로드 링크 표시
+                if(data.current_count > 0 && percent < 100) {
+                    $('#partialLink').show();
+                }
+                
+                // 예상 완료 시간 (서버에서 처리 속도 기준으로 계산)
+                if(data.eta_seconds !== null && percent < 100) {
+                    const minutes = Math.floor(data.eta_seconds / 60);
+                    const seconds = Math.ceil(data.eta_seconds % 60);
+                    
+                    if(minutes > 0) {
+                        $('#estimatedTime').text(`예상 완료: 약 ${minutes}분 ${seconds}초 후`);
+                    } else {
+                        $('#estimatedTime').text(`예상 완료: 약 ${seconds}초 후`);
+                    }
+                } else if(percent >= 100) {
+                    $('#estimatedTime').text('완료!');
+                }
+            }
+            
+            function showJobResult(job) {
+                $('#partialLink').hide();
+                $('#progressBar').val(100);
+                $('#percentage').text('100% - 번역 완료!');
+                
+                // 다운로드 링크 생성
+                let links = '<h3>✅ 번역 완료!</h3>';
+                
+                // ZIP 다운로드 링크 (파일이 2개 이상일 때)
+                if(job.zip_download_url) {
+                    links += `<div style="margin-bottom: 20px;">`;
+                    links += `<a href="${job.zip_download_url}" class="download-item" style="background: linear-gradient(45deg, #ff6b6b, #ee5a24); font-size: 18px; padding: 20px 30px;">📦 모든 파일 ZIP 다운로드</a>`;
+                    links += `</div>`;
+                    links += `<h4>개별 파일 다운로드:</h4>`;
+                }
+                
+                // 개별 파일 다운로드 링크
+                job.download_urls.forEach(function(url, index){
+                    const filename = url.split('/').pop();
+                    links += `<a href="${url}" class="download-item">📁 ${filename} 다운로드</a>`;
+                });
+                
+                $('#downloadLink').html(links);
+                
+                let successMsg = `총 ${job.download_urls.length}개 파일이 성공적으로 번역되었습니다.`;
+                if(job.mod) {
+                    successMsg += ` (모드 전체 번역: 항목 ${job.stats.entries || 0}개, ZIP을 모드 폴더에 풀면 localisation 폴더에 적용됩니다)`;
+                }
+                if(job.zip_download_url) {
+                    successMsg += ' ZIP 파일로 한번에 다운로드하거나 개별적으로 다운로드할 수 있습니다.';
+                }
+                if(job.memory_entries && job.stats) {
+                    successMsg += ` (번역 메모리: ${job.stats.memory || 0}개 항목 재사용)`;
+                }
+                if(job.stats && job.stats.resumed) {
+                    successMsg += ` (중단된 이전 실행에서 ${job.stats.resumed}개 항목 이어서 처리)`;
+                }
+                if(job.stats && job.stats.fuzzy) {
+                    successMsg += ` (변수만 다른 이전 번역 ${job.stats.fuzzy}개 재사용)`;
+                }
+                if(job.stats && job.stats.untranslated) {
+                    successMsg += ` (번역 API 오류로 ${job.stats.untranslated}개 항목은 원문 그대로 저장 - 같은 파일을 다시 번역하면 해당 항목만 다시 요청)`;
+                }
+                if(job.usage) {
+                    let costText = job.usage.estimated_cost_usd !== null ? `, 예상 비용 $${job.usage.estimated_cost_usd.toFixed(4)}` : '';
+                    successMsg += ` (OpenAI 토큰: 입력 ${job.usage.prompt_tokens} (캐시 ${job.usage.cached_tokens}), 출력 ${job.usage.completion_tokens}${costText}, 항목당 ${job.usage.tokens_per_entry} (이전 방식 약 ${job.usage.legacy_tokens_per_entry}))`;
+                }
+                if(job.incremental && job.stats) {
+                    successMsg += ` (증분 번역: 전체 ${job.stats.entries || 0}개 중 ${job.stats.translated || 0}개 번역, ${job.stats.unchanged || 0}개 이전 번역 재사용)`;
+                }
+                showSuccess(successMsg);
+            }
+            
+            function resetSubmitButton() {
+                $('#submitBtn').prop('disabled', false).val('번역 시작');
+            }
+            
+            function showError(message) {
+                $('#errorMessage').text(message).show();
+                $('#progress').hide();
+                $('#successMessage').hide();
+            }
+            
+            function showSuccess(message) {
+                $('#successMessage').text(message).show();
+                $('#errorMessage').hide();
+            }
+        });
+    </script>
+</body>
+</html>"""
+    return html_content
+
+@app.route('/ollama/models')
+def get_ollama_models():
+    """Ollama 사용 가능한 모델 목록 조회 API"""
+    endpoint = request.args.get('endpoint', 'http://localhost:11434')
+    models = get_available_ollama_models(endpoint, refresh=True)
+    return jsonify({"models": models})
+
+@app.route('/health')
+def health_check():
+    """헬스체크 엔드포인트"""
+    services = {
+        "google_translate": get_google_client() is not None,
+        "cache": translation_service.cache.stats(),
+        "fuzzy_memory_entries": len(translation_service.memory),
+        "in_flight": {"active": translation_service.inflight.in_flight(), "shared": translation_service.inflight.shared},
+        "timestamp": datetime.now().isoformat(),
+        "status": "healthy"
+    }
+    return jsonify(services)
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus 형식 성능 지표 (백엔드 지연/결과, 토큰, 캐시, 작업 큐, 전송량)"""
+    cache_stats = translation_service.cache.stats()
+    job_counts = job_manager.status_counts()
+    active_progress = job_manager.active_progress()
+
+    gauges = {
+        "translator_cache_hit_ratio": ("번역 캐시 적중률", [({}, cache_stats["hit_ratio"])]),
+        "translator_cache_lookups": ("번역 캐시 조회 수 (결과별)", [
+            ({"result": "memory_hit"}, cache_stats["memory_hits"]),
+            ({"result": "disk_hit"}, cache_stats["disk_hits"]),
+            ({"result": "miss"}, cache_stats["misses"]),
+        ]),
+        "translator_cache_memory_bytes": ("메모리 캐시 사용량 (바이트)", [({}, cache_stats["memory_bytes"])]),
+        "translator_jobs": ("상태별 보관 중인 작업 수", [({"status": status}, count) for status, count in job_counts.items()]),
+        "translator_queue_depth": ("대기 중인 작업 수", [({}, job_counts["queued"])]),
+        "translator_active_jobs": ("실행 중인 작업 수", [({}, job_counts["running"])]),
+        "translator_entries_per_second": ("실행 중인 작업의 항목 처리 속도 합계", [
+            ({}, sum(progress["entries_per_second"] or 0 for progress in active_progress))
+        ]),
+        "translator_inflight_requests": ("진행 중인 중복 합치기 대상 요청 수", [({}, translation_service.inflight.in_flight())]),
+        "translator_inflight_shared": ("다른 요청의 결과를 받아 쓴 누적 횟수", [({}, translation_service.inflight.shared)]),
+        "translator_fuzzy_memory_entries": ("유사 번역 메모리 항목 수", [({}, len(translation_service.memory))]),
+    }
+    return Response(metrics.render(gauges), mimetype="text/plain; version=0.0.4")
+
+@app.route('/upload', methods=['POST'])
+def upload_file():
+    """파일 업로드 및 번역 작업 등록"""
+    metrics.inc("translator_bytes_uploaded_total", request.content_length or 0)
+    try:
+        # 모드 전체 번역: localisation 폴더 또는 모드 ZIP (폴더 구조를 유지해 한 작업으로 번역, 파일 선택란의 ZIP 포함)
+        mod_files = [
+            f for f in request.files.getlist('modFolder')
+            if f.filename and os.path.splitext(f.filename.lower())[1] in config.SUPPORTED_EXTENSIONS
+        ]
+        uploaded_files = [f for f in request.files.getlist('file') if f.filename]
+        mod_archives = [f for f in request.files.getlist('modArchive') + uploaded_files if f.filename.lower().endswith('.zip')]
+        mod = bool(mod_files or mod_archives)
+        
+        # 파일 검증
+        files = [f for f in uploaded_files if not f.filename.lower().endswith('.zip')]
+        if not files and not mod:
+            return jsonify({"error": "파일이 선택되지 않았습니다."}), 400
+        
+        # 각 파일 유효성 검사
+        for file in files:
+            validate_file(file)
+        for archive in mod_archives:
+            validate_file(archive, {'.zip'})
+        
+        target_language = request.form.get('language')
+        if not target_language:
+            return jsonify({"error": "번역할 언어를 선택해주세요."}), 400
+        
+        translation_api = request.form.get('translationApi', 'google')
+        
+        # API 설정 정보 수집 및 검증
+        api_settings = {}
+        if translation_api == "openai":
+            api_key = request.form.get('openaiApiKey', '').strip()
+            if not api_key:
+                return jsonify({"error": "OpenAI API 키가 필요합니다."}), 400
+            api_settings = {
+                "openai_api_key": api_key,
+                "openai_model": request.form.get('openaiModel', 'gpt-3.5-turbo'),
+                "openai_packing": request.form.get('openaiPacking', 'on' if config.OPENAI_PACKING else 'off') == 'on',
+                "openai_compact_prompt": request.form.get('openaiCompactPrompt', 'on' if config.OPENAI_COMPACT_PROMPT else 'off') == 'on'
+            }
+        elif translation_api == "ollama":
+            api_settings = {
+                "ollama_endpoint": request.form.get('ollamaEndpoint', 'http://localhost:11434'),
+                "ollama_model": request.form.get('ollamaModel', 'llama3.1:8b'),
+                "ollama_packing": request.form.get('ollamaPacking', 'on' if config.OLLAMA_PACKING else 'off') == 'on',
+                "ollama_keep_alive": request.form.get('ollamaKeepAlive', '').strip() or config.OLLAMA_KEEP_ALIVE
+            }
+            
+            try:
+                num_ctx = int(request.form.get('ollamaNumCtx') or config.OLLAMA_NUM_CTX)
+            except ValueError:
+                return jsonify({"error": "Ollama 컨텍스트 길이는 숫자여야 합니다."}), 400
+            api_settings["ollama_num_ctx"] = num_ctx
+            
+            # Ollama 연결 및 모델 확인
+            endpoint = api_settings["ollama_endpoint"]
+            model = api_settings["ollama_model"]
+            is_valid, message = validate_ollama_model(endpoint, model)
+            if not is_valid:
+                available_models = get_available_ollama_models(endpoint)
+                if available_models:
+                    return jsonify({
+                        "error": f"모델 '{model}'을 찾을 수 없습니다. 사용 가능한 모델을 선택해주세요: {', '.join(available_models)}"
+                    }), 400
+                else:
+                    return jsonify({
+                        "error": "Ollama 서버에 연결할 수 없거나 설치된 모델이 없습니다. 'ollama pull <model>' 명령으로 모델을 설치해주세요."
+                    }), 400
+        elif translation_api == "google" and not get_google_client():
+            return jsonify({"error": "Google Cloud Translate API가 설정되지 않았습니다."}), 500
+        
+        # 작업별 동시 요청 수 (AI 번역)
+        api_settings["concurrency"] = resolve_concurrency(translation_api, {"concurrency": request.form.get('concurrency')})
+        
+        # 증분 번역: 이전 원문과 이전 번역 파일은 저장하지 않고 바로 파싱
+        old_source_files = [f for f in request.files.getlist('oldSourceFile') if f.filename]
+        old_translation_files = [f for f in request.files.getlist('oldTranslationFile') if f.filename]
+        previous = None
+        if old_source_files or old_translation_files:
+            if not (old_source_files and old_translation_files):
+                return jsonify({"error": "증분 번역에는 이전 원문 파일과 이전 번역 파일이 모두 필요합니다."}), 400
+            for file in old_source_files + old_translation_files:
+                validate_file(file)
+            previous = load_previous_translation(
+                [f.stream for f in old_source_files],
+                [f.stream for f in old_translation_files]
+            )
+        
+        # 번역 메모리: 기존 번역 파일, 번역된 모드 폴더, ZIP 파일 (파싱과 색인은 작업 워커에서 처리)
+        memory_uploads = [
+            f for f in request.files.getlist('memoryFile') + request.files.getlist('memoryFolder')
+            if f.filename and os.path.splitext(f.filename.lower())[1] in config.SUPPORTED_EXTENSIONS | {'.zip'}
+        ]
+        
+        # 업로드 폴더 생성
+        os.makedirs(config.UPLOAD_FOLDER, exist_ok=True)
+        
+        # 업로드 중 업로드 폴더에 기록된 파일을 그대로 작업 파일로 사용 (번역은 작업 워커에서 처리)
+        # (작업 파일로 넘긴 파일은 요청 종료 시 삭제되지 않으므로 작업 등록 전에 실패하면 여기서 삭제)
+        job_files = []
+        memory_files = []
+        try:
+            for file in files:
+                if file.filename == '':
+                    continue
+                
+                # 안전한 파일명 생성
+                safe_filename = secure_filename(file.filename)
+                if not safe_filename.lower().endswith(('.yml', '.yaml')):
+                    logging.error(f"{file.filename}은(는) 지원하지 않는 파일 형식입니다.")
+                    continue
+                
+                job_files.append((safe_filename, claim_upload(file)))
+            
+            # 모드 폴더 파일은 상대 경로(예: MyMod/localisation/english/a_l_english.yml)를 그대로 보관
+            for file in mod_files:
+                job_files.append((file.filename, claim_upload(file)))
+            
+            # 모드 ZIP은 원문 언어 로컬라이제이션 파일만 병렬로 꺼내 저장 (ZIP 자체는 요청이 끝나면 삭제)
+            try:
+                for archive in mod_archives:
+                    job_files.extend(extract_localization_archive(archive.stream, config.UPLOAD_FOLDER, config.MOD_SOURCE_LANGUAGE))
+            except (zipfile.BadZipFile, ValueError) as e:
+                remove_uploaded_files(job_files)
+                if isinstance(e, ValueError):
+                    return jsonify({"error": str(e)}), 400
+                return jsonify({"error": "모드 ZIP 파일을 읽을 수 없습니다."}), 400
+            
+            if not job_files:
+                return jsonify({"error": "번역할 수 있는 파일이 없습니다."}), 400
+            
+            # 작업 등록 후 즉시 작업 ID 반환
+            for f in memory_uploads:
+                memory_files.append((f.filename, claim_upload(f)))
+            job = job_manager.submit(TranslationJob(job_files, target_language, translation_api, api_settings, previous,
+                                                    mod=mod, memory_files=memory_files))
+        except BaseException:
+            remove_uploaded_files(job_files + memory_files)
+            raise
+        return jsonify(job.to_dict()), 202
+        
+    except Exception as e:
+        logging.error(f"업로드 처리 중 예상치 못한 오류: {e}")
+        return jsonify({"error": f"서버 오류가 발생했습니다: {str(e)}"}), 500
+
+@app.route('/jobs/<job_id>')
+def get_job_status(job_id):
+    """번역 작업 상태 조회"""
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/events')
+def stream_job_events(job_id):
+    """번역 작업 진행률 스트림 (Server-Sent Events)"""
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    
+    def generate():
+        version = -1
+        while True:
+            snapshot = job.progress.wait_for_change(version, config.SSE_KEEPALIVE_INTERVAL)
+            if snapshot is None:
+                # 프록시 연결 유지를 위한 주석 이벤트
+                yield ": keep-alive\n\n"
+                continue
+            
+            version = snapshot["version"]
+            yield f"event: progress\ndata: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
+            
+            if job.status in ("completed", "failed"):
+                yield f"event: {job.status}\ndata: {json.dumps(job.to_dict(), ensure_ascii=False)}\n\n"
+                return
+            
+            # 항목별 갱신을 묶어서 전송 (이벤트 폭주 방지)
+            time.sleep(config.SSE_MIN_INTERVAL)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def send_download(path, download_name):
+    """결과 파일 다운로드 응답 (보낸 바이트 수 집계)"""
+    metrics.inc("translator_bytes_downloaded_total", os.path.getsize(path))
+    return send_file(os.path.abspath(path), as_attachment=True, download_name=download_name)
+
+def send_archive(job):
+    """결과 ZIP 스트리밍 응답 - 결과 파일을 읽으며 바로 압축해 전송 (작업 중이면 파일이 완성되는 대로 추가)"""
+    def generate():
+        for chunk in iter_zip_stream(job.iter_archive_members()):
+            if chunk:
+                metrics.inc("translator_bytes_downloaded_total", len(chunk))
+                yield chunk
+    
+    return Response(
+        generate(),
+        mimetype='application/zip',
+        headers={"Content-Disposition": f"attachment; filename={job.archive_name}", "X-Accel-Buffering": "no"}
+    )
+
+@app.route('/jobs/<job_id>/result')
+def get_job_result(job_id):
+    """번역 작업 결과 다운로드 (파일 1개는 그대로, 여러 개는 ZIP)"""
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    
+    if job.status == "failed":
+        return jsonify(job.to_dict()), 500
+    if job.status != "completed":
+        return jsonify(job.to_dict()), 202
+    
+    if job.has_archive:
+        return send_archive(job)
+    
+    result_path = job.output_files[0]
+    if not os.path.exists(result_path):
+        return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
+    
+    return send_download(result_path, os.path.basename(result_path))
+
+@app.route('/jobs/<job_id>/archive')
+def get_job_archive(job_id):
+    """번역 작업 결과 ZIP 다운로드 - 작업 중에도 요청 가능 (완성된 파일부터 바로 전송, 모든 파일이 끝나면 완료)"""
+    job = job_manager.get(job_id)
+    if not job or not job.has_archive:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    if job.status == "failed":
+        return jsonify(job.to_dict()), 500
+    
+    return send_archive(job)
+
+@app.route('/jobs/<job_id>/partial')
+def download_partial_result(job_id):
+    """번역 중인 작업의 부분 결과 다운로드 - 번역된 줄 + 아직 번역되지 않은 원문 줄로 만든 완전한 파일
+    (파일 1개는 그대로, 여러 개는 ZIP, 임시 파일에 기록해 전체 결과를 메모리에 올리지 않음)"""
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    
+    writers = list(job.writers)
+    if not writers:
+        return jsonify({"error": "아직 다운로드할 번역 결과가 없습니다."}), 409
+    
+    output = tempfile.TemporaryFile()
+    try:
+        if len(writers) == 1 and not job.mod:
+            writers[0].write_snapshot(output)
+            download_name = os.path.basename(writers[0].output_path)
+        else:
+            with zipfile.ZipFile(output, 'w', config.ZIP_COMPRESSION, compresslevel=config.ZIP_COMPRESS_LEVEL) as zipf:
+                for writer in writers:
+                    arcname = os.path.relpath(writer.output_path, job.output_folder).replace(os.sep, '/')
+                    with zipf.open(arcname, 'w') as entry:
+                        writer.write_snapshot(entry)
+            download_name = f"partial_{job.id}.zip"
+    except Exception as e:
+        output.close()
+        logging.error(f"부분 결과 생성 중 오류: {e}")
+        return jsonify({"error": "부분 결과를 만들 수 없습니다."}), 500
+    
+    metrics.inc("translator_bytes_downloaded_total", output.tell())
+    output.seek(0)
+    return send_file(output, as_attachment=True, download_name=download_name)
+
+@app.route('/jobs/<job_id>/files/<path:filename>')
+def download_job_file(job_id, filename):
+    """번역 작업의 개별 결과 파일 다운로드 (모드 번역은 하위 폴더 경로 포함)"""
+    job = job_manager.get(job_id)
+    if not job or job.status != "completed":
+        return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
+    
+    safe_parts = [secure_filename(part) for part in filename.split('/')]
+    if not all(safe_parts):
+        return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
+    output_path = os.path.join(job.output_folder, *safe_parts)
+    if not os.path.isfile(output_path):
+        return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
+    
+    return send_download(output_path, safe_parts[-1])
+
+@app.route('/download/<filename>')
+def download_file(filename):
+    """번역된 파일 다운로드"""
+    try:
+        safe_filename = secure_filename(filename)
+        output_path = os.path.join(config.DOWNLOAD_FOLDER, safe_filename)
+        
+        if not os.path.exists(output_path):
+            return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
+        
+        return send_download(output_path, safe_filename)
+        
+    except Exception as e:
+        logging.error(f"파일 다운로드 중 오류: {e}")
+        return jsonify({"error": "파일 다운로드 중 오류가 발생했습니다."}), 500
+
+def main():
+    """웹 서버 실행"""
+    # 필요한 디렉토리 생성
+    for folder in [config.UPLOAD_FOLDER, config.DOWNLOAD_FOLDER]:
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+    
+    # 로깅 설정 (성능 최적화)
+    log_handlers = [logging.StreamHandler()]
+    
+    # 파일 로깅은 ERROR 레벨 이상만 (성능 향상)
+    if not os.path.exists('logs'):
+        os.makedirs('logs')
+    
+    file_handler = logging.FileHandler('logs/translator_errors.log')
+    file_handler.setLevel(logging.ERROR)
+    log_handlers.append(file_handler)
+    
+    logging.basicConfig(
+        level=config.LOG_LEVEL,  # WARNING 레벨로 설정
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=log_handlers
+    )
+    
+    logging.warning("게임 로컬라이제이션 번역기 시작 (백그라운드 최적화 모드)")
+    
+    # 구글 번역 클라이언트는 첫 요청 전에 미리 초기화
+    get_google_client()
+    
+    # Flask 앱 실행 (백그라운드 최적화)
+    app.run(
+        host='0.0.0.0', 
+        port=config.SERVER_PORT, 
+        debug=False,  # 디버그 모드 비활성화
+        threaded=True,  # 멀티 스레드 활성화
+        use_reloader=False  # 자동 재시작 비활성화
+    )
+
+if __name__ == "__main__":
+    main()